@@ -0,0 +1,471 @@
+"""Asyncio variant of the episode pipeline."""
+
+import asyncio
+import itertools
+from collections.abc import Callable
+from contextlib import nullcontext
+
+import structlog
+
+from brainwave.builder import EpisodeBuilder
+from brainwave.config import AppConfig
+from brainwave.llm import AsyncLLMClient
+from brainwave.models.episode import (
+    Episode,
+    EpisodeOutline,
+    EpisodeStatus,
+    PipelineStep,
+    SceneBeat,
+    StepUsage,
+)
+from brainwave.pipeline import BatchResult, EpisodePipeline, ScriptContinuation
+from brainwave.repair import ScriptRepairer
+from brainwave.streaming import StreamAbortedError
+
+logger = structlog.get_logger()
+
+
+class AsyncEpisodePipeline:
+    """
+    Runs the Outline → Script → Build → Complete steps as coroutines.
+
+    LLM calls go through AsyncOpenAI, audio through the TTS provider's
+    synthesize_async() and uploads through upload_episode_async(), so one
+    event loop can drive many episodes at once without a thread apiece.
+    Step checks, prompts, parsing and checkpoints are shared with
+    EpisodePipeline, so episodes stay resumable by either pipeline; the
+    blocking parts of those (episode files, the near-duplicate index and
+    directory cleanup) run in worker threads, off the event loop.
+
+    The async clients bind to the event loop they are first used on; create
+    one instance per loop (run_batch_sync() does this for sync callers).
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        builder: EpisodeBuilder | None = None,
+        pipeline: EpisodePipeline | None = None,
+    ):
+        """
+        Initialize the async pipeline.
+
+        Args:
+            config: Application configuration
+            builder: Builder for TTS audio (None marks builds as mocked)
+            pipeline: Sync pipeline to share helpers and the response cache with
+        """
+        self.config = config
+        self.pipeline = pipeline or EpisodePipeline(config)
+        self.builder = builder
+
+        self.llm = AsyncLLMClient(config.llm, cache=self.pipeline.llm.cache)
+        self.repairer = ScriptRepairer(
+            self.llm,
+            self.pipeline.validator,
+            self.pipeline.prompts,
+            abort_after_errors=config.generation.abort_after_errors,
+        )
+
+        # Limits how many episodes synthesize audio at once
+        tts_concurrency = config.tts.max_concurrency
+        self._tts_slots = asyncio.Semaphore(tts_concurrency) if tts_concurrency > 0 else None
+
+    async def run_outline(self, episode: Episode) -> Episode:
+        """
+        Generate episode outline (Step 1).
+
+        Args:
+            episode: Episode to generate outline for
+
+        Returns:
+            Episode with outline populated
+        """
+        pipeline = self.pipeline
+        prompt, monitor = pipeline.prepare_outline(episode)
+
+        usage = episode.meta.step_usage(PipelineStep.OUTLINE.value)
+        retries = pipeline._outline_retries()
+        with usage.timed():
+            # Ask again while the response can't be parsed, is aborted or repeats an
+            # episode (see EpisodePipeline)
+            for variant in itertools.count():
+                monitor.reset()
+                try:
+                    response = await self.llm.complete(
+                        prompt,
+                        monitor=monitor,
+                        usage=usage,
+                        variant=variant,
+                        step=PipelineStep.OUTLINE.value,
+                        max_tokens=self.config.generation.outline_max_tokens or None,
+                        response_format=pipeline.outline_response_format(),
+                    )
+                except StreamAbortedError as e:
+                    if not retries.allow(str(e), False, None):
+                        raise
+                    continue
+                truncated = response.finish_reason == "length"
+                outline, problem, duplicate = await asyncio.to_thread(
+                    pipeline.review_outline, episode, response.content, usage
+                )
+                if not retries.allow(problem, truncated, duplicate):
+                    break
+
+        if duplicate:
+            pipeline.reject_duplicate(episode, "outline", duplicate)
+        return await asyncio.to_thread(
+            pipeline.apply_outline, episode, outline.raw_text, outline, truncated=truncated
+        )
+
+    async def run_outlines(self, episodes: list[Episode]) -> list[Episode]:
+        """
+        Generate outlines for several episodes in one completion (see EpisodePipeline).
+
+        Args:
+            episodes: Episodes to outline, in topic order
+
+        Returns:
+            The episodes (outlined ones now OUTLINED; the rest unchanged)
+        """
+        pipeline = self.pipeline
+        prompt, max_tokens, response_format = pipeline._start_outline_group(episodes)
+
+        usage = StepUsage()
+        with usage.timed():
+            response = await self.llm.complete(
+                prompt,
+                usage=usage,
+                step=PipelineStep.OUTLINE.value,
+                max_tokens=max_tokens,
+                response_format=response_format,
+            )
+
+        return await asyncio.to_thread(
+            pipeline._apply_outline_group,
+            episodes,
+            response.content,
+            response.finish_reason,
+            usage,
+        )
+
+    async def run_script(self, episode: Episode) -> Episode:
+        """
+        Generate full script from outline (Step 2).
+
+        Args:
+            episode: Episode with outline to generate script for
+
+        Returns:
+            Episode with script populated
+        """
+        pipeline = self.pipeline
+        outline_text = pipeline.prepare_script(episode)
+
+        usage = episode.meta.step_usage(PipelineStep.SCRIPT.value)
+        with usage.timed():
+            if episode.outline and pipeline._writes_by_scenes(episode):
+                script_text = await self._generate_script_by_scenes(
+                    outline_text, episode.outline.scenes, usage, episode.outline
+                )
+            else:
+                prompt = pipeline.build_script_prompt(outline_text, outline=episode.outline)
+                beats = episode.outline.scenes if episode.outline else []
+                script_text = await self._write_scenes(
+                    prompt, outline_text, beats, usage, episode.outline
+                )
+
+            script, validation_result = pipeline.validate_script(script_text)
+
+            # Regenerate only the failing scenes
+            repair_options = pipeline.repair_options(validation_result, usage)
+            if repair_options:
+                script_text, validation_result = await self.repairer.repair_async(
+                    script_text, validation_result, **repair_options
+                )
+                script = pipeline.scripts.parse(script_text)
+
+        await asyncio.to_thread(pipeline.check_script_duplicate, episode, script)
+        return await asyncio.to_thread(
+            pipeline.apply_script, episode, script_text, script, validation_result
+        )
+
+    async def _write_scenes(
+        self,
+        prompt: list[dict[str, str]],
+        outline_text: str,
+        beats: list[SceneBeat],
+        usage: StepUsage | None = None,
+        outline: EpisodeOutline | None = None,
+    ) -> str:
+        """Complete a script prompt in its budget, continued if cut off (see EpisodePipeline)."""
+        script_text, truncated = await self._complete_script(
+            prompt, usage, self.pipeline.script_budget(len(beats))
+        )
+
+        continuation = ScriptContinuation(
+            self.pipeline, script_text, truncated, outline_text, beats, outline
+        )
+        while request := continuation.next_request():
+            prompt, max_tokens = request
+            continuation.add(*await self._complete_script(prompt, usage, max_tokens))
+        return continuation.finish()
+
+    async def _complete_script(
+        self,
+        prompt: list[dict[str, str]],
+        usage: StepUsage | None = None,
+        max_tokens: int | None = None,
+    ) -> tuple[str, bool]:
+        """Run a script completion; returns the cleaned text and whether it was truncated."""
+        try:
+            response = await self.llm.complete(
+                prompt,
+                monitor=self.pipeline.script_monitor(),
+                usage=usage,
+                step=PipelineStep.SCRIPT.value,
+                max_tokens=max_tokens,
+            )
+        except StreamAbortedError as e:
+            return self.pipeline.aborted_script(e)
+        truncated = response.finish_reason == "length"
+        return self.pipeline.clean_script_text(response.content), truncated
+
+    async def _generate_script_by_scenes(
+        self,
+        outline_text: str,
+        beats: list[SceneBeat],
+        usage: StepUsage | None = None,
+        outline: EpisodeOutline | None = None,
+    ) -> str:
+        """Write the script as concurrent scene-group completions (see EpisodePipeline)."""
+        groups = self.pipeline._scene_groups(beats)
+        slots = asyncio.Semaphore(max(1, self.config.generation.scene_workers))
+
+        async def write_group(index: int) -> str:
+            prompt = self.pipeline._build_scene_group_prompt(outline_text, groups, index, outline)
+            async with slots:
+                script_text = await self._write_scenes(
+                    prompt, outline_text, groups[index], usage, outline
+                )
+            last = index == len(groups) - 1
+            return self.pipeline._finish_scene_group(groups[index], script_text, last)
+
+        group_scripts = await asyncio.gather(*(write_group(i) for i in range(len(groups))))
+        return "\n\n".join(group_scripts)
+
+    async def run_build(self, episode: Episode) -> Episode:
+        """
+        Build TTS audio for episode (Step 3).
+
+        Args:
+            episode: Episode with script to build audio for
+
+        Returns:
+            Episode with audio built
+        """
+        self.pipeline._start_build(episode)
+
+        if self.builder:
+            async with self._tts_slots or nullcontext():
+                await self.builder.build_async(episode)
+        else:
+            # Without a builder, just mark as built (mock mode)
+            logger.warning("no_build_callback", episode_id=episode.id_str)
+            episode.meta.build_mocked = True
+
+        return await asyncio.to_thread(self.pipeline._apply_build, episode)
+
+    async def run_complete(self, episode: Episode) -> Episode:
+        """
+        Upload episode to cloud storage (Step 4).
+
+        Args:
+            episode: Episode to upload
+
+        Returns:
+            Completed episode
+        """
+        work_dir = self.pipeline._start_complete(episode)
+        remote_path = await self.pipeline.storage.upload_episode_async(work_dir, episode.id_str)
+        return await asyncio.to_thread(self.pipeline._apply_complete, episode, remote_path)
+
+    async def run_full(self, topic: str | None = None) -> Episode:
+        """
+        Run every step for a new episode.
+
+        Args:
+            topic: Optional topic for the episode
+
+        Returns:
+            Completed episode
+        """
+        episode = await asyncio.to_thread(self.pipeline.create, topic)
+        return await self._run_steps(episode, PipelineStep.OUTLINE)
+
+    async def resume(self, episode_id: str) -> Episode:
+        """
+        Finish a paused episode from its current step.
+
+        Args:
+            episode_id: Episode ID to resume
+
+        Returns:
+            Completed episode
+        """
+        episode = await asyncio.to_thread(self.pipeline.load, episode_id)
+
+        if not episode.can_resume():
+            raise ValueError(
+                f"Episode {episode_id} cannot be resumed (status: {episode.meta.status})"
+            )
+
+        next_step = episode.meta.get_next_step()
+        if not next_step:
+            logger.info("episode_already_complete", episode_id=episode_id)
+            return episode
+
+        logger.info("resuming_episode", episode_id=episode_id, next_step=next_step.value)
+        return await self._run_steps(episode, next_step)
+
+    async def run_batch(
+        self,
+        topics: list[str | None],
+        parallel: int = 1,
+        step_callback: Callable[[int, Episode, PipelineStep], None] | None = None,
+    ) -> list[BatchResult]:
+        """
+        Run the full pipeline for several episodes as concurrent tasks.
+
+        Args:
+            topics: One entry per episode (None for a random topic)
+            parallel: Number of episodes to run at once
+            step_callback: Called with (index, episode, step) after each completed step
+
+        Returns:
+            One BatchResult per topic, in input order
+        """
+        slots = asyncio.Semaphore(max(1, parallel))
+        episodes = await self._outline_groups(topics, slots, step_callback)
+
+        async def run_one(index: int, topic: str | None) -> BatchResult:
+            result = BatchResult(topic=topic, episode=episodes[index])
+
+            def on_step(episode: Episode, step: PipelineStep) -> None:
+                if step_callback:
+                    step_callback(index, episode, step)
+
+            async with slots:
+                try:
+                    if result.episode is None:
+                        result.episode = await asyncio.to_thread(self.pipeline.create, topic)
+                    result.episode = await self._run_steps(
+                        result.episode,
+                        result.episode.meta.get_next_step() or PipelineStep.OUTLINE,
+                        on_step,
+                    )
+
+                except Exception as e:
+                    result.error = e
+                    if result.episode:
+                        result.failed_step = result.episode.meta.get_next_step()
+                    logger.error(
+                        "batch_episode_failed",
+                        index=index,
+                        episode_id=result.episode.id_str if result.episode else None,
+                        step=result.failed_step.value if result.failed_step else None,
+                        error=str(e),
+                    )
+
+            return result
+
+        logger.info("batch_started", episodes=len(topics), parallel=parallel, mode="async")
+
+        results = await asyncio.gather(*(run_one(i, topic) for i, topic in enumerate(topics)))
+
+        logger.info(
+            "batch_finished",
+            episodes=len(results),
+            failed=sum(1 for r in results if r.error),
+        )
+        return list(results)
+
+    async def _outline_groups(
+        self,
+        topics: list[str | None],
+        slots: asyncio.Semaphore,
+        step_callback: Callable[[int, Episode, PipelineStep], None] | None = None,
+    ) -> list[Episode | None]:
+        """Create and outline a batch's episodes in groups (see EpisodePipeline._outline_groups)."""
+        size = self.config.generation.outlines_per_request
+        if size <= 1 or len(topics) <= 1:
+            return [None] * len(topics)
+
+        episodes = [await asyncio.to_thread(self.pipeline.create, topic) for topic in topics]
+        groups = [list(range(i, min(i + size, len(topics)))) for i in range(0, len(topics), size)]
+
+        async def outline_group(indexes: list[int]) -> None:
+            async with slots:
+                try:
+                    await self.run_outlines([episodes[i] for i in indexes])
+                except Exception as e:
+                    logger.warning("outline_group_failed", episodes=len(indexes), error=str(e))
+                    return
+            for i in indexes:
+                if step_callback and episodes[i].meta.status == EpisodeStatus.OUTLINED:
+                    step_callback(i, episodes[i], PipelineStep.OUTLINE)
+
+        await asyncio.gather(*(outline_group(indexes) for indexes in groups))
+        return episodes
+
+    async def _run_steps(
+        self,
+        episode: Episode,
+        start_step: PipelineStep,
+        step_callback: Callable[[Episode, PipelineStep], None] | None = None,
+    ) -> Episode:
+        """Run pipeline steps from start_step onwards."""
+        all_steps = [
+            (PipelineStep.OUTLINE, self.run_outline),
+            (PipelineStep.SCRIPT, self.run_script),
+            (PipelineStep.BUILD, self.run_build),
+            (PipelineStep.COMPLETE, self.run_complete),
+        ]
+
+        start_idx = next((i for i, (s, _) in enumerate(all_steps) if s == start_step), 0)
+
+        for step, runner in all_steps[start_idx:]:
+            episode = await runner(episode)
+            if step_callback:
+                step_callback(episode, step)
+
+        return episode
+
+
+def run_batch_sync(
+    config: AppConfig,
+    topics: list[str | None],
+    parallel: int = 1,
+    builder: EpisodeBuilder | None = None,
+    step_callback: Callable[[int, Episode, PipelineStep], None] | None = None,
+) -> list[BatchResult]:
+    """
+    Run a batch on the async pipeline from synchronous code.
+
+    Args:
+        config: Application configuration
+        topics: One entry per episode (None for a random topic)
+        parallel: Number of episodes to run at once
+        builder: Builder for TTS audio (None marks builds as mocked); its
+            provider's async client binds to this call's event loop
+        step_callback: Called with (index, episode, step) after each completed step
+
+    Returns:
+        One BatchResult per topic, in input order
+    """
+
+    async def main() -> list[BatchResult]:
+        pipeline = AsyncEpisodePipeline(config, builder=builder)
+        return await pipeline.run_batch(topics, parallel=parallel, step_callback=step_callback)
+
+    return asyncio.run(main())
@@ -1,6 +1,8 @@
 """Build audio assets for episodes using TTS."""
 
+import asyncio
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import structlog
@@ -9,9 +11,17 @@ import yaml
 from brainwave.config import AppConfig
 from brainwave.models.characters import CharacterRegistry, load_characters
 from brainwave.models.episode import Episode, EpisodeStatus
-from brainwave.models.script import DialogLine
-from brainwave.parser import WaveLangParser
+from brainwave.models.script import DialogLine, WaveLangScript
+from brainwave.script_cache import get_script_cache
+from brainwave.storage import S3StorageProvider, create_storage_provider
 from brainwave.tts.base import TTSProvider, TTSResult
+from brainwave.tts.cache import (
+    LocalTTSCache,
+    NegativeLookupCache,
+    RemoteTTSCache,
+    TTSCache,
+    tts_cache_key,
+)
 from brainwave.tts.mock import MockTTSProvider
 from brainwave.tts.narakeet import NarakeetTTSProvider
 from brainwave.tts.openai import OpenAITTSProvider
@@ -58,6 +68,41 @@ def get_tts_provider(config: AppConfig) -> TTSProvider:
         raise ValueError(f"Unknown TTS provider: {provider_name}")
 
 
+def create_tts_cache(config: AppConfig) -> TTSCache | None:
+    """
+    Create the TTS audio cache based on configuration.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Configured TTSCache, or None if caching is disabled
+    """
+    cache_config = config.tts.cache
+    if not cache_config.enabled:
+        return None
+
+    cache_dir = config.paths.cache_dir / "tts"
+    local = LocalTTSCache(cache_dir / "audio")
+
+    remote = None
+    if cache_config.remote:
+        storage = create_storage_provider(config.storage, config.paths.scenes_dir)
+        if isinstance(storage, S3StorageProvider):
+            remote = RemoteTTSCache(
+                storage=storage,
+                prefix=cache_config.remote_prefix,
+                negative_cache=NegativeLookupCache(
+                    cache_dir / "negative.json", cache_config.negative_ttl
+                ),
+                max_workers=cache_config.max_workers,
+            )
+        else:
+            logger.warning("tts_remote_cache_requires_s3", storage=config.storage.provider)
+
+    return TTSCache(local, remote)
+
+
 def load_voice_mappings(config: AppConfig) -> dict[str, dict[str, str]]:
     """
     Load voice mappings from YAML file.
@@ -74,15 +119,36 @@ def load_voice_mappings(config: AppConfig) -> dict[str, dict[str, str]]:
         return yaml.safe_load(f) or {}
 
 
+# (dialog, voice, cleaned text, output path)
+PendingLine = tuple[DialogLine, str, str, Path]
+
+
+@dataclass
+class _BuildState:
+    """Work and counters for one episode build."""
+
+    script: WaveLangScript
+    provider_name: str
+    results: dict[int, TTSResult] = field(default_factory=dict)
+    pending: list[PendingLine] = field(default_factory=list)
+    cache_keys: dict[int, str] = field(default_factory=dict)
+    cache_requests: dict[str, Path] = field(default_factory=dict)
+    cache_hits: set[str] = field(default_factory=set)
+    generated: int = 0
+    skipped: int = 0
+    restored: int = 0
+
+
 class EpisodeBuilder:
     """Build audio assets for episodes."""
 
     def __init__(self, config: AppConfig):
         self.config = config
-        self.parser = WaveLangParser()
+        self.scripts = get_script_cache()
         self.characters = load_characters(config.paths.data_dir / "characters.yaml")
         self.voice_mappings = load_voice_mappings(config)
         self.tts_provider = get_tts_provider(config)
+        self.cache = create_tts_cache(config)
 
     def build(
         self,
@@ -99,6 +165,80 @@ class EpisodeBuilder:
         Returns:
             List of TTSResult for each dialog line
         """
+        state = self._plan(episode, force)
+
+        # Restore previously synthesized lines from the cache in one batch
+        if self.cache and state.cache_requests:
+            state.cache_hits = self.cache.fetch_many(state.cache_requests)
+
+        for line in state.pending:
+            if not self._restore(state, line):
+                self._log_synthesis(line)
+                result = self.tts_provider.synthesize(line[2], line[1], line[3])
+                self._record(state, line, result)
+
+        return self._finish(episode, state)
+
+    async def build_async(
+        self,
+        episode: Episode,
+        force: bool = False,
+        concurrency: int | None = None,
+    ) -> list[TTSResult]:
+        """
+        Generate TTS audio for an episode with concurrent synthesis requests.
+
+        Lines sharing a cache key are synthesized once; repeats are restored
+        from the local cache tier afterwards.
+
+        Args:
+            episode: Episode to build
+            force: If True, regenerate even if files exist
+            concurrency: Max synthesis requests in flight (default: tts.line_concurrency)
+
+        Returns:
+            List of TTSResult for each dialog line
+        """
+        state = self._plan(episode, force)
+
+        if self.cache and state.cache_requests:
+            state.cache_hits = await asyncio.to_thread(self.cache.fetch_many, state.cache_requests)
+
+        first: list[PendingLine] = []
+        repeats: list[PendingLine] = []
+        seen: set[str] = set()
+        for line in state.pending:
+            cache_key = state.cache_keys.get(line[0].line_number)
+            if cache_key and cache_key in seen:
+                repeats.append(line)
+                continue
+            if cache_key:
+                seen.add(cache_key)
+            if not self._restore(state, line):
+                first.append(line)
+
+        slots = asyncio.Semaphore(max(1, concurrency or self.config.tts.line_concurrency))
+
+        async def synthesize(line: PendingLine) -> None:
+            async with slots:
+                self._log_synthesis(line)
+                result = await self.tts_provider.synthesize_async(line[2], line[1], line[3])
+            self._record(state, line, result, store=False)
+
+            cache_key = state.cache_keys.get(line[0].line_number)
+            if result.success and self.cache and cache_key:
+                await asyncio.to_thread(self.cache.store, cache_key, line[3])
+
+        await asyncio.gather(*(synthesize(line) for line in first))
+
+        # Repeats whose first copy failed are synthesized on their own
+        retry = [line for line in repeats if not self._restore(state, line)]
+        await asyncio.gather(*(synthesize(line) for line in retry))
+
+        return self._finish(episode, state)
+
+    def _plan(self, episode: Episode, force: bool) -> _BuildState:
+        """Parse the script and collect the lines that need audio."""
         if not episode.script_raw:
             raise ValueError("Episode has no script to build")
 
@@ -109,24 +249,23 @@ class EpisodeBuilder:
         sfx_dir = episode.work_dir / "assets" / "sfx"
         sfx_dir.mkdir(parents=True, exist_ok=True)
 
-        # Parse script
-        script = self.parser.parse(episode.script_raw)
+        # Parsed once per script (by the script step, or here for older episodes)
+        script = self.scripts.parse(episode.script_raw, episode.work_dir)
 
         # Get provider-specific voice mappings
         provider_name = self.tts_provider.name
         provider_voices = self.voice_mappings.get(provider_name, {})
 
-        results: list[TTSResult] = []
-        generated = 0
-        skipped = 0
+        state = _BuildState(script=script, provider_name=provider_name)
 
+        # Collect lines that need audio
         for dialog in script.all_dialog_lines:
             output_path = sfx_dir / f"dialog-{dialog.line_number}.mp3"
 
             # Skip if file exists and not forcing
             if output_path.exists() and not force:
-                skipped += 1
-                results.append(TTSResult(audio_path=output_path, cached=True))
+                state.skipped += 1
+                state.results[dialog.line_number] = TTSResult(audio_path=output_path, cached=True)
                 continue
 
             # Get voice for character
@@ -139,34 +278,80 @@ class EpisodeBuilder:
                 logger.warning("empty_dialog", line=dialog.line_number)
                 continue
 
-            # Synthesize
-            logger.info(
-                "synthesizing",
-                line=dialog.line_number,
-                character=dialog.character,
-                voice=voice,
-            )
-
-            result = self.tts_provider.synthesize(text, voice, output_path)
-            results.append(result)
-
-            if result.success:
-                generated += 1
-            else:
-                logger.error("synthesis_failed", line=dialog.line_number, error=result.error)
+            state.pending.append((dialog, voice, text, output_path))
+
+        if self.cache:
+            for dialog, voice, text, output_path in state.pending:
+                cache_key = tts_cache_key(provider_name, self.tts_provider.model, voice, text)
+                state.cache_keys[dialog.line_number] = cache_key
+                state.cache_requests.setdefault(cache_key, output_path)
+
+        return state
+
+    def _restore(self, state: _BuildState, line: PendingLine) -> bool:
+        """Restore a line's audio from the cache; returns True on a hit."""
+        dialog, _, _, output_path = line
+        cache_key = state.cache_keys.get(dialog.line_number)
+
+        # Repeated lines share a key; later copies come from the local tier
+        if self.cache and cache_key and (
+            (cache_key in state.cache_hits and state.cache_requests[cache_key] == output_path)
+            or self.cache.local.get(cache_key, output_path)
+        ):
+            state.restored += 1
+            state.results[dialog.line_number] = TTSResult(audio_path=output_path, cached=True)
+            return True
+        return False
+
+    def _log_synthesis(self, line: PendingLine) -> None:
+        """Log a synthesis request."""
+        dialog, voice, _, _ = line
+        logger.info(
+            "synthesizing",
+            line=dialog.line_number,
+            character=dialog.character,
+            voice=voice,
+        )
 
+    def _record(
+        self,
+        state: _BuildState,
+        line: PendingLine,
+        result: TTSResult,
+        store: bool = True,
+    ) -> None:
+        """Record a synthesis result, caching successful audio unless store is False."""
+        dialog, _, _, output_path = line
+        state.results[dialog.line_number] = result
+
+        if result.success:
+            state.generated += 1
+            cache_key = state.cache_keys.get(dialog.line_number)
+            if store and self.cache and cache_key:
+                self.cache.store(cache_key, output_path)
+        else:
+            logger.error("synthesis_failed", line=dialog.line_number, error=result.error)
+
+    def _finish(self, episode: Episode, state: _BuildState) -> list[TTSResult]:
+        """Log the build summary and mark the episode built."""
         logger.info(
             "build_complete",
-            generated=generated,
-            skipped=skipped,
-            total=len(script.all_dialog_lines),
+            generated=state.generated,
+            skipped=state.skipped,
+            restored=state.restored,
+            total=len(state.script.all_dialog_lines),
         )
 
         # Update episode status
         episode.meta.status = EpisodeStatus.BUILT
-        episode.meta.tts_provider = provider_name
-
-        return results
+        episode.meta.tts_provider = state.provider_name
+
+        # One result per dialog line, in script order
+        return [
+            state.results[dialog.line_number]
+            for dialog in state.script.all_dialog_lines
+            if dialog.line_number in state.results
+        ]
 
     def _get_voice_for_dialog(
         self,
@@ -0,0 +1,343 @@
+"""Bulk outline and script generation through the OpenAI Batch API."""
+
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import structlog
+from openai import OpenAI
+from openai.types import Batch
+
+from brainwave.config import AppConfig
+from brainwave.llm import LLMResponse
+from brainwave.llm_retry import LLMCallError
+from brainwave.models.episode import Episode, EpisodeStatus, PipelineStep, StepUsage
+from brainwave.pipeline import BatchResult, EpisodePipeline
+
+logger = structlog.get_logger()
+
+# Steps whose requests can be submitted as a batch
+BULK_STEPS = (PipelineStep.OUTLINE, PipelineStep.SCRIPT)
+
+# Batch statuses after which no more results will arrive
+FINISHED = ("completed", "failed", "expired", "cancelled")
+
+# Episode statuses each bulk step picks up
+READY = {
+    PipelineStep.OUTLINE: (EpisodeStatus.CREATED, EpisodeStatus.PENDING),
+    PipelineStep.SCRIPT: (EpisodeStatus.OUTLINED, EpisodeStatus.PLOT_GENERATED),
+}
+
+
+@dataclass
+class BulkJob:
+    """A submitted batch and the episodes it covers."""
+
+    batch_id: str
+    step: str
+    episode_ids: list[str]
+    submitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class BulkRunner:
+    """
+    Runs the outline or script step for many episodes as Batch API jobs.
+
+    Each episode contributes the request run_outline()/run_script() would
+    send (one script completion per episode; scene groups don't apply).
+    Submitted jobs and their input files are kept under
+    <paths.cache_dir>/bulk, so any later process can collect them.
+
+    Collected results are applied the way the interactive steps apply
+    theirs: outlines are parsed and saved; scripts are continued if
+    truncated, validated, repaired (with interactive requests) and saved.
+    Step usage is recorded and responses go into the response cache.
+    """
+
+    def __init__(self, config: AppConfig, pipeline: EpisodePipeline | None = None):
+        """
+        Initialize the bulk runner.
+
+        Args:
+            config: Application configuration
+            pipeline: Pipeline whose helpers, LLM client and episodes to use
+        """
+        self.config = config
+        self.pipeline = pipeline or EpisodePipeline(config)
+        self.llm = self.pipeline.llm
+        self.jobs_dir = config.paths.cache_dir / "bulk"
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def client(self) -> OpenAI:
+        """SDK client of the default backend, which batches are submitted to."""
+        backend = self.llm.router.default
+        if backend.config.provider == "anthropic":
+            raise ValueError("Bulk mode needs an openai or azure default backend")
+        return backend.client
+
+    def jobs(self) -> list[BulkJob]:
+        """Submitted jobs that haven't been collected yet, oldest first."""
+        jobs = [
+            BulkJob(**json.loads(path.read_text(encoding="utf-8")))
+            for path in self.jobs_dir.glob("*.json")
+        ]
+        return sorted(jobs, key=lambda job: job.submitted_at)
+
+    def queued(self, step: PipelineStep) -> list[Episode]:
+        """
+        Incomplete episodes ready for a step.
+
+        Episodes already in an uncollected job are left out.
+
+        Args:
+            step: Bulk step (outline or script)
+
+        Returns:
+            Loaded episodes
+        """
+        pending = {episode_id for job in self.jobs() for episode_id in job.episode_ids}
+        return [
+            self.pipeline.load(episode_id)
+            for episode_id, status, _ in self.pipeline.list_incomplete()
+            if status in READY[step] and episode_id not in pending
+        ]
+
+    def submit(self, episodes: list[Episode], step: PipelineStep) -> list[BulkJob]:
+        """
+        Submit a step's requests for episodes as Batch API jobs.
+
+        Args:
+            episodes: Episodes ready for the step
+            step: Bulk step (outline or script)
+
+        Returns:
+            Submitted jobs (more than one past llm.bulk.max_requests episodes)
+        """
+        if step not in BULK_STEPS:
+            raise ValueError(f"Bulk mode only runs the outline and script steps, not {step.value}")
+
+        size = max(1, self.config.llm.bulk.max_requests)
+        return [
+            self._submit_chunk(episodes[i : i + size], step) for i in range(0, len(episodes), size)
+        ]
+
+    def _submit_chunk(self, episodes: list[Episode], step: PipelineStep) -> BulkJob:
+        """Upload one batch input file and create the batch."""
+        lines = []
+        for episode in episodes:
+            messages, max_tokens, response_format = self._request(episode, step)
+            lines.append(
+                self.llm.batch_request(
+                    episode.id_str,
+                    messages,
+                    step=step.value,
+                    max_tokens=max_tokens,
+                    response_format=response_format,
+                )
+            )
+        data = "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+
+        client = self.client
+        upload = client.files.create(file=(f"brainwave-{step.value}.jsonl", data), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=upload.id,
+            endpoint=lines[0]["url"],
+            completion_window=self.config.llm.bulk.completion_window,
+            metadata={"brainwave_step": step.value},
+        )
+
+        job = BulkJob(batch_id=batch.id, step=step.value, episode_ids=[e.id_str for e in episodes])
+        self._input_path(job).write_bytes(data)
+        self._job_path(job).write_text(json.dumps(asdict(job), indent=2), encoding="utf-8")
+
+        logger.info("bulk_submitted", batch_id=batch.id, step=step.value, episodes=len(episodes))
+        return job
+
+    def _request(
+        self, episode: Episode, step: PipelineStep
+    ) -> tuple[list[dict[str, str]], int | None, dict | None]:
+        """The messages, output budget and response format run_outline()/run_script() would send."""
+        if step == PipelineStep.OUTLINE:
+            messages, _ = self.pipeline.prepare_outline(episode)
+            return (
+                messages,
+                self.config.generation.outline_max_tokens or None,
+                self.pipeline.outline_response_format(),
+            )
+
+        outline_text = self.pipeline.prepare_script(episode)
+        beats = episode.outline.scenes if episode.outline else []
+        messages = self.pipeline.build_script_prompt(outline_text, outline=episode.outline)
+        return messages, self.pipeline.script_budget(len(beats)), None
+
+    def wait(
+        self, job: BulkJob, on_poll: Callable[[BulkJob, Batch], None] | None = None
+    ) -> Batch:
+        """
+        Poll a job until its batch finishes.
+
+        Args:
+            job: Submitted job
+            on_poll: Called with (job, batch) after every status check
+
+        Returns:
+            The finished batch object
+        """
+        while True:
+            batch = self.client.batches.retrieve(job.batch_id)
+            if on_poll:
+                on_poll(job, batch)
+            if batch.status in FINISHED:
+                return batch
+            time.sleep(self.config.llm.bulk.poll_interval)
+
+    def collect(self, job: BulkJob) -> list[BatchResult] | None:
+        """
+        Apply a finished job's results to its episodes.
+
+        Episodes without a successful result keep their status (and can be
+        submitted again); their BatchResult carries the error.
+
+        Args:
+            job: Submitted job
+
+        Returns:
+            One BatchResult per episode, or None if the batch is still running
+        """
+        client = self.client
+        batch = client.batches.retrieve(job.batch_id)
+        if batch.status not in FINISHED:
+            return None
+
+        results_by_id: dict[str, dict] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                for raw in client.files.content(file_id).text.splitlines():
+                    if raw.strip():
+                        line = json.loads(raw)
+                        results_by_id[line["custom_id"]] = line
+
+        requests = {}
+        with open(self._input_path(job), encoding="utf-8") as f:
+            for raw in f:
+                line = json.loads(raw)
+                requests[line["custom_id"]] = line["body"]
+
+        step = PipelineStep(job.step)
+        results = [
+            self._ingest(episode_id, step, requests, results_by_id.get(episode_id), batch.status)
+            for episode_id in job.episode_ids
+        ]
+
+        self._job_path(job).unlink(missing_ok=True)
+        self._input_path(job).unlink(missing_ok=True)
+
+        logger.info(
+            "bulk_collected",
+            batch_id=job.batch_id,
+            status=batch.status,
+            episodes=len(results),
+            failed=sum(1 for r in results if r.error),
+        )
+        return results
+
+    def _ingest(
+        self,
+        episode_id: str,
+        step: PipelineStep,
+        requests: dict[str, dict],
+        line: dict | None,
+        batch_status: str,
+    ) -> BatchResult:
+        """Apply one episode's batch result, capturing any failure in the BatchResult."""
+        result = BatchResult(topic=None)
+        try:
+            episode = self.pipeline.load(episode_id)
+            result.episode = episode
+            result.topic = episode.meta.topic
+
+            request = requests.get(episode_id)
+            if request is None:
+                raise ValueError(f"Episode {episode_id} is missing from the batch input file")
+            if line is None:
+                raise LLMCallError(f"No result in {batch_status} batch", "server")
+
+            if step == PipelineStep.OUTLINE:
+                result.episode = self._ingest_outline(episode, request, line)
+            else:
+                result.episode = self._ingest_script(episode, request, line)
+
+        except Exception as e:
+            result.error = e
+            result.failed_step = step
+            logger.error(
+                "bulk_episode_failed", episode_id=episode_id, step=step.value, error=str(e)
+            )
+
+        return result
+
+    def _ingest_outline(self, episode: Episode, request: dict, line: dict) -> Episode:
+        """
+        Finish the outline step with a batch result (mirrors run_outline).
+
+        An outline that can't be parsed is counted as a parse failure but
+        kept, since a new sample would take another batch. A near-duplicate
+        is rejected; the episode can be submitted again.
+        """
+        self.pipeline.prepare_outline(episode)
+
+        usage = episode.meta.step_usage(PipelineStep.OUTLINE.value)
+        with usage.timed():
+            response = self._response(PipelineStep.OUTLINE, request, line, usage)
+            outline, _, duplicate = self.pipeline.review_outline(episode, response.content, usage)
+
+        if duplicate:
+            self.pipeline.reject_duplicate(episode, "outline", duplicate)
+        return self.pipeline.apply_outline(
+            episode, outline.raw_text, outline, truncated=response.finish_reason == "length"
+        )
+
+    def _ingest_script(self, episode: Episode, request: dict, line: dict) -> Episode:
+        """Finish the script step with a batch result (mirrors run_script)."""
+        pipeline = self.pipeline
+        outline_text = pipeline.prepare_script(episode)
+        beats = episode.outline.scenes if episode.outline else []
+
+        usage = episode.meta.step_usage(PipelineStep.SCRIPT.value)
+        with usage.timed():
+            response = self._response(PipelineStep.SCRIPT, request, line, usage)
+            script_text = pipeline.continue_scenes(
+                pipeline.clean_script_text(response.content),
+                response.finish_reason == "length",
+                outline_text,
+                beats,
+                usage,
+                episode.outline,
+            )
+            script_text, script, validation_result = pipeline.check_script(script_text, usage)
+
+        pipeline.check_script_duplicate(episode, script)
+        return pipeline.apply_script(episode, script_text, script, validation_result)
+
+    def _response(
+        self, step: PipelineStep, request: dict, line: dict, usage: StepUsage
+    ) -> LLMResponse:
+        """Read a result line against the request body it answers."""
+        return self.llm.batch_response(
+            line,
+            request["messages"],
+            usage=usage,
+            step=step.value,
+            max_tokens=request.get("max_completion_tokens"),
+            response_format=request.get("response_format"),
+        )
+
+    def _job_path(self, job: BulkJob) -> Path:
+        return self.jobs_dir / f"{job.batch_id}.json"
+
+    def _input_path(self, job: BulkJob) -> Path:
+        return self.jobs_dir / f"{job.batch_id}.input.jsonl"
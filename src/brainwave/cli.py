@@ -1,6 +1,9 @@
 """Command-line interface for brainwave."""
 
+import random
 import sys
+import threading
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 
@@ -13,12 +16,17 @@ from rich.prompt import Confirm
 from rich.table import Table
 
 from brainwave import __version__
+from brainwave.async_pipeline import run_batch_sync
 from brainwave.builder import EpisodeBuilder
+from brainwave.bulk import BulkRunner
 from brainwave.config import load_config
 from brainwave.exporter import UnityExporter, generate_preview_text
 from brainwave.generator import EpisodeGenerator, EpisodeManager
+from brainwave.models.characters import load_characters, load_shots
 from brainwave.models.episode import Episode, EpisodeStatus, PipelineStep
-from brainwave.pipeline import EpisodePipeline
+from brainwave.pipeline import BatchResult, EpisodePipeline
+from brainwave.prompts import get_prompt_renderer
+from brainwave.standin import ResponseSynthesizer, StandInServer, StandInSettings
 
 # Set up console
 console = Console()
@@ -90,9 +98,17 @@ def make_build_callback(config, force: bool = False, silent: bool = False):
     """Create a build callback for the pipeline."""
     builder = EpisodeBuilder(config)
 
+    # Limits how many episodes synthesize audio at once when built concurrently
+    tts_slots = (
+        threading.BoundedSemaphore(config.tts.max_concurrency)
+        if config.tts.max_concurrency > 0
+        else nullcontext()
+    )
+
     def build_callback(episode: Episode) -> Episode:
         if silent:
-            builder.build(episode, force=force)
+            with tts_slots:
+                builder.build(episode, force=force)
         else:
             with Progress(
                 SpinnerColumn(),
@@ -113,6 +129,11 @@ def main(
     config_path: Optional[Path] = typer.Option(
         None, "--config", "-c", help="Path to config file"
     ),
+    llm_cache: str | None = typer.Option(
+        None,
+        "--llm-cache",
+        help="LLM response cache mode: off, read-through, record, replay",
+    ),
 ) -> None:
     """Brainwave - Episode Generator for Unity Cartoons."""
     setup_logging(debug)
@@ -123,6 +144,13 @@ def main(
     ctx.obj["config"] = load_config(config_path, root_dir)
     ctx.obj["debug"] = debug
 
+    if llm_cache:
+        if llm_cache not in ("off", "read-through", "record", "replay"):
+            raise typer.BadParameter(
+                f"Unknown LLM cache mode: {llm_cache}", param_hint="--llm-cache"
+            )
+        ctx.obj["config"].llm.cache = llm_cache
+
 
 # ============================================================================
 # NEW PIPELINE COMMANDS
@@ -539,69 +567,143 @@ def batch(
     topics_file: Optional[Path] = typer.Option(None, "--topics", help="File with topics (one per line)"),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip all confirmations"),
     mock: bool = typer.Option(False, "--mock", "-m", help="Use mock TTS"),
+    parallel: int = typer.Option(
+        1, "--parallel", "-p", help="Number of episodes to run concurrently"
+    ),
+    llm_concurrency: int | None = typer.Option(
+        None, "--llm-concurrency", help="Max concurrent LLM requests (default: llm.max_concurrency)"
+    ),
+    tts_concurrency: int | None = typer.Option(
+        None,
+        "--tts-concurrency",
+        help="Max episodes building audio at once (default: tts.max_concurrency)",
+    ),
+    use_async: bool = typer.Option(
+        False,
+        "--async",
+        help="Run episodes as asyncio tasks in one thread instead of worker threads",
+    ),
 ) -> None:
     """Generate multiple episodes in batch using the new pipeline."""
     config = ctx.obj["config"]
 
     if mock:
         config.tts.provider = "mock"
+    if llm_concurrency is not None:
+        config.llm.max_concurrency = llm_concurrency
+    if tts_concurrency is not None:
+        config.tts.max_concurrency = tts_concurrency
 
-    pipeline = EpisodePipeline(config)
+    topics = _load_topics(topics_file, count)
 
-    # Load topics from file if provided
-    topics: list[str | None] = [None] * count
-    if topics_file and topics_file.exists():
-        with open(topics_file) as f:
-            file_topics = [line.strip() for line in f if line.strip()]
-        topics = file_topics[:count]
-        if len(topics) < count:
-            topics.extend([None] * (count - len(topics)))
+    console.print(f"\nGenerating {count} episode(s), {max(1, parallel)} at a time...\n")
 
-    results_table = Table(title="Batch Generation Results")
-    results_table.add_column("Episode ID", style="cyan")
-    results_table.add_column("Title")
-    results_table.add_column("Status")
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        tasks = [
+            progress.add_task(f"Episode {i + 1}/{count}: queued", total=None)
+            for i in range(count)
+        ]
 
-    console.print(f"\nGenerating {count} episode(s)...\n")
+        def on_step(index: int, episode: Episode, step: PipelineStep) -> None:
+            progress.update(
+                tasks[index],
+                description=f"Episode {index + 1}/{count}: {step.value} done ({episode.title})",
+            )
 
-    success_count = 0
-    for i in range(count):
-        topic = topics[i] if i < len(topics) else None
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            task = progress.add_task(f"Episode {i + 1}/{count}...", total=None)
-
-            try:
-                confirm_cb = make_confirm_callback(True)  # Always auto-confirm in batch
-                build_cb = make_build_callback(config)
-
-                episode = pipeline.run_full(
-                    topic=topic,
-                    confirm_callback=confirm_cb,
-                    build_callback=build_cb,
-                )
+        if use_async:
+            results = run_batch_sync(
+                config,
+                topics,
+                parallel=parallel,
+                builder=EpisodeBuilder(config),
+                step_callback=on_step,
+            )
+        else:
+            results = EpisodePipeline(config).run_batch(
+                topics,
+                parallel=parallel,
+                build_callback=make_build_callback(config, silent=True),
+                step_callback=on_step,
+            )
 
-                results_table.add_row(
-                    episode.id_str[:8] + "...",
-                    episode.title,
-                    f"[green]{episode.meta.status.value}[/green]",
-                )
-                success_count += 1
+    _print_batch_results(results)
 
-            except Exception as e:
-                results_table.add_row(
-                    "N/A",
-                    topic[:30] + "..." if topic and len(topic) > 30 else (topic or "Random"),
-                    f"[red]Failed: {str(e)[:20]}[/red]",
-                )
 
-    console.print(results_table)
-    console.print(f"\n[bold]Completed:[/bold] {success_count}/{count} episodes")
+@app.command()
+def bulk(
+    ctx: typer.Context,
+    step: str | None = typer.Argument(
+        None, help="Step to run for queued episodes: outline or script"
+    ),
+    count: int = typer.Option(0, "--count", "-n", help="New episodes to create and queue first"),
+    topics_file: Path | None = typer.Option(
+        None, "--topics", help="File with topics for new episodes"
+    ),
+    wait: bool = typer.Option(
+        True, "--wait/--no-wait", help="Poll until the batch finishes and apply it"
+    ),
+    collect: bool = typer.Option(
+        False, "--collect", help="Apply previously submitted batches that have finished"
+    ),
+) -> None:
+    """Run the outline or script step for all queued episodes as one Batch API job."""
+    config = ctx.obj["config"]
+    runner = BulkRunner(config)
+
+    if collect:
+        jobs = runner.jobs()
+        if not jobs:
+            console.print("[yellow]No submitted batches to collect.[/yellow]")
+            return
+
+        results = []
+        for job in jobs:
+            collected = runner.collect(job)
+            if collected is None:
+                console.print(f"[dim]{job.batch_id} ({job.step}): still running[/dim]")
+            else:
+                results.extend(collected)
+        if results:
+            _print_batch_results(results)
+        return
+
+    if step not in ("outline", "script"):
+        console.print("[red]Step must be 'outline' or 'script' (or use --collect)[/red]")
+        raise typer.Exit(1)
+    bulk_step = PipelineStep(step)
+
+    for topic in _load_topics(topics_file, count):
+        runner.pipeline.create(topic)
+
+    episodes = runner.queued(bulk_step)
+    if not episodes:
+        console.print(f"[yellow]No episodes are ready for the {step} step.[/yellow]")
+        return
+
+    jobs = runner.submit(episodes, bulk_step)
+    console.print(f"Submitted {len(episodes)} {step} request(s) in {len(jobs)} batch(es)")
+    if not wait:
+        console.print("Apply the results later with: [cyan]brainwave bulk --collect[/cyan]")
+        return
+
+    results = []
+    with console.status("Waiting for batch...") as status:
+
+        def on_poll(job, batch) -> None:
+            counts = batch.request_counts
+            done = f" ({counts.completed}/{counts.total})" if counts else ""
+            status.update(f"Batch {job.batch_id}: {batch.status}{done}")
+
+        for job in jobs:
+            runner.wait(job, on_poll=on_poll)
+            results.extend(runner.collect(job) or [])
+
+    _print_batch_results(results)
 
 
 @app.command("export")
@@ -750,6 +852,202 @@ def show(
     console.print(preview)
 
 
+@app.command()
+def stats(
+    ctx: typer.Context,
+    completed: bool = typer.Option(
+        False, "--completed", "-c", help="Include completed (cloud) episodes"
+    ),
+) -> None:
+    """Show LLM token and latency usage per step across episodes."""
+    config = ctx.obj["config"]
+    pipeline = EpisodePipeline(config)
+
+    summaries = pipeline.collect_usage(include_completed=completed)
+    if not summaries:
+        console.print("[yellow]No usage recorded yet.[/yellow]")
+        return
+
+    total_tokens = sum(s.usage.total_tokens for s in summaries) or 1
+    total_latency = sum(s.usage.latency_seconds for s in summaries) or 1.0
+
+    table = Table(title="LLM Usage by Step")
+    table.add_column("Step", style="cyan")
+    table.add_column("Model")
+    table.add_column("Episodes", justify="right")
+    table.add_column("Attempts", justify="right")
+    table.add_column("Requests", justify="right")
+    table.add_column("Retries", justify="right")
+    table.add_column("Parse Fails", justify="right")
+    table.add_column("Prompt", justify="right")
+    table.add_column("Cached", justify="right")
+    table.add_column("Completion", justify="right")
+    table.add_column("Tokens %", justify="right")
+    table.add_column("Avg Latency", justify="right")
+    table.add_column("Latency %", justify="right")
+
+    for summary in summaries:
+        usage = summary.usage
+        step = summary.step
+        if summary.output_format:
+            step = f"{summary.step} ({summary.output_format})"
+        parse_failures = (
+            f"{usage.parse_failures} ({usage.parse_failures / usage.requests:.0%})"
+            if usage.requests
+            else str(usage.parse_failures)
+        )
+        table.add_row(
+            step,
+            summary.model or "-",
+            str(summary.episodes),
+            str(usage.attempts),
+            str(usage.requests),
+            str(usage.retries),
+            parse_failures,
+            f"{usage.prompt_tokens:,}",
+            f"{usage.cache_hit_ratio:.0%}",
+            f"{usage.completion_tokens:,}",
+            f"{usage.total_tokens / total_tokens:.0%}",
+            f"{usage.latency_seconds / summary.episodes:.1f}s",
+            f"{usage.latency_seconds / total_latency:.0%}",
+        )
+
+    console.print(table)
+
+
+@app.command()
+def dedup(
+    ctx: typer.Context,
+    completed: bool = typer.Option(
+        False, "--completed", "-c", help="Also index completed (cloud) episodes"
+    ),
+    threshold: float | None = typer.Option(
+        None, "--threshold", "-t", help="Similarity to report (default: generation.dedup.threshold)"
+    ),
+) -> None:
+    """Update the near-duplicate index and list near-duplicate episodes."""
+    config = ctx.obj["config"]
+    config.generation.dedup.enabled = True
+    pipeline = EpisodePipeline(config)
+    threshold = threshold if threshold is not None else config.generation.dedup.threshold
+
+    added = pipeline.index_episodes(include_completed=completed)
+    console.print(
+        f"Indexed [cyan]{added}[/cyan] new outlines/scripts ({len(pipeline.dedup)} total)"
+    )
+
+    table = Table(title=f"Near-Duplicates (>= {threshold:.0%})")
+    table.add_column("Kind", style="cyan")
+    table.add_column("Episode")
+    table.add_column("Duplicate Of")
+    table.add_column("Similarity", justify="right")
+
+    for kind in ("outline", "script"):
+        for episode_id, match in pipeline.dedup.pairs(kind, threshold):
+            table.add_row(kind, episode_id, match.episode_id, f"{match.similarity:.0%}")
+
+    if table.row_count:
+        console.print(table)
+    else:
+        console.print("[green]No near-duplicates found.[/green]")
+
+
+@app.command()
+def prompts(ctx: typer.Context) -> None:
+    """Show estimated system prompt tokens per template in full and compact encoding."""
+    config = ctx.obj["config"]
+
+    full = get_prompt_renderer(config, verbosity="full").token_estimates()
+    compact = get_prompt_renderer(config, verbosity="compact").token_estimates()
+
+    table = Table(title="System Prompt Tokens (estimated)")
+    table.add_column("Template", style="cyan")
+    table.add_column("Full", justify="right")
+    table.add_column("Compact", justify="right")
+    table.add_column("Saved", justify="right")
+
+    for name, full_tokens in full.items():
+        compact_tokens = compact[name]
+        table.add_row(
+            name,
+            f"{full_tokens:,}",
+            f"{compact_tokens:,}",
+            f"{1 - compact_tokens / full_tokens:.0%}",
+        )
+
+    console.print(table)
+    console.print(f"Configured verbosity: [cyan]{config.generation.prompt_verbosity}[/cyan]")
+
+
+@app.command()
+def standin(
+    ctx: typer.Context,
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to listen on"),
+    port: int = typer.Option(8765, "--port", help="Port to listen on"),
+    tps: float = typer.Option(0.0, "--tps", help="Completion tokens per second (0 = unthrottled)"),
+    latency: float = typer.Option(0.0, "--latency", help="Seconds before each response starts"),
+    error_rate: float = typer.Option(
+        0.0, "--error-rate", help="Fraction of requests failing with 500"
+    ),
+    rate_limit_rate: float = typer.Option(
+        0.0, "--rate-limit-rate", help="Fraction of requests failing with 429"
+    ),
+    rpm: int = typer.Option(
+        0, "--rpm", help="Chat requests per minute before 429s (0 = unlimited)"
+    ),
+    tpm: int = typer.Option(
+        0, "--tpm", help="Chat tokens per minute before 429s (0 = unlimited)"
+    ),
+    seed: int | None = typer.Option(
+        None, "--seed", help="Random seed for reproducible responses"
+    ),
+    batch_delay: float = typer.Option(
+        0.0, "--batch-delay", help="Seconds each Batch API job stays in progress"
+    ),
+    batch_error_rate: float = typer.Option(
+        0.0, "--batch-error-rate", help="Fraction of Batch API requests failing with 500"
+    ),
+) -> None:
+    """Run a local OpenAI-compatible stand-in for offline runs and load tests."""
+    config = ctx.obj["config"]
+
+    settings = StandInSettings(
+        tokens_per_second=tps,
+        latency=latency,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        requests_per_minute=rpm,
+        tokens_per_minute=tpm,
+        seed=seed,
+        batch_delay=batch_delay,
+        batch_error_rate=batch_error_rate,
+    )
+    synthesizer = ResponseSynthesizer(
+        load_characters(config.paths.data_dir / "characters.yaml"),
+        load_shots(config.paths.data_dir / "shots.yaml"),
+        random.Random(seed),
+    )
+    server = StandInServer(synthesizer, settings, host=host, port=port)
+
+    console.print(
+        Panel(
+            f"Serving on [cyan]{server.base_url}[/cyan]\n\n"
+            f"Point brainwave at it with:\n"
+            f"  BRAINWAVE_LLM__BASE_URL={server.base_url} BRAINWAVE_LLM__API_KEY=standin\n"
+            f"  BRAINWAVE_TTS__PROVIDER=openai BRAINWAVE_TTS__BASE_URL={server.base_url} "
+            f"BRAINWAVE_TTS__API_KEY=standin",
+            title="LLM stand-in",
+        )
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
 @app.command()
 def version() -> None:
     """Show version information."""
@@ -761,6 +1059,47 @@ def version() -> None:
 # ============================================================================
 
 
+def _load_topics(topics_file: Path | None, count: int) -> list[str | None]:
+    """Read up to count topics from a file (one per line), padding with None for random topics."""
+    topics: list[str | None] = [None] * count
+    if topics_file and topics_file.exists():
+        with open(topics_file) as f:
+            file_topics = [line.strip() for line in f if line.strip()]
+        topics = file_topics[:count]
+        if len(topics) < count:
+            topics.extend([None] * (count - len(topics)))
+    return topics
+
+
+def _print_batch_results(results: list[BatchResult]) -> None:
+    """Print a table of per-episode batch outcomes."""
+    results_table = Table(title="Batch Generation Results")
+    results_table.add_column("Episode ID", style="cyan")
+    results_table.add_column("Title")
+    results_table.add_column("Status")
+
+    success_count = 0
+    for result in results:
+        topic = result.topic
+        if result.error is None and result.episode:
+            results_table.add_row(
+                result.episode.id_str[:8] + "...",
+                result.episode.title,
+                f"[green]{result.episode.meta.status.value}[/green]",
+            )
+            success_count += 1
+        else:
+            step_info = f" at {result.failed_step.value}" if result.failed_step else ""
+            results_table.add_row(
+                result.episode.id_str[:8] + "..." if result.episode else "N/A",
+                topic[:30] + "..." if topic and len(topic) > 30 else (topic or "Random"),
+                f"[red]Failed{step_info}: {str(result.error)[:20]}[/red]",
+            )
+
+    console.print(results_table)
+    console.print(f"\n[bold]Completed:[/bold] {success_count}/{len(results)} episodes")
+
+
 def _show_episode_status(episode: Episode) -> None:
     """Display episode status after pipeline operations."""
     status_color = {
@@ -8,6 +8,76 @@ from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class LLMRetryConfig(BaseModel):
+    """Retry and circuit-breaker settings for LLM requests."""
+
+    max_attempts: int = 5  # Total attempts for rate-limit, timeout and server errors
+    base_delay: float = 1.0  # Seconds; doubled per attempt, with full jitter
+    max_delay: float = 60.0  # Cap on any single wait (including Retry-After)
+    # Consecutive timeout/server errors that pause all requests (0 = no breaker)
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 30.0  # Seconds to pause before probing the provider again
+
+
+class LLMPacingConfig(BaseModel):
+    """Proactive pacing from the provider's rate-limit response headers."""
+
+    enabled: bool = True  # Delay requests that would exceed the reported quotas
+    headroom: float = 0.05  # Share of the request/token quotas left unspent
+    max_delay: float = 60.0  # Cap on any single pacing wait (seconds)
+
+
+class LLMBackendConfig(BaseModel):
+    """One LLM endpoint the router can send requests to."""
+
+    name: str
+    provider: Literal["openai", "anthropic", "azure"] = "openai"
+    # Model (Azure: deployment) served by this backend (default: the step's model)
+    model: str | None = None
+    api_key: SecretStr | None = None  # Default: llm.api_key
+    # Endpoint; Azure: https://<resource>.openai.azure.com, Anthropic: its OpenAI-compatible API
+    base_url: str | None = None
+    api_version: str | None = None  # Azure only
+
+
+class LLMRouterConfig(BaseModel):
+    """Health-based selection between LLM backends."""
+
+    window: float = 60.0  # Seconds of request outcomes kept per backend
+    min_samples: int = 3  # Outcomes needed before a backend's error rate counts
+    # Backends failing more than this share of recent requests are skipped
+    max_error_rate: float = 0.5
+    # Share of requests sent to a random healthy backend to refresh its latency
+    explore: float = 0.05
+
+
+class LLMBulkConfig(BaseModel):
+    """Batch API submission settings for bulk outline/script generation."""
+
+    completion_window: str = "24h"  # Time the provider has to finish a batch
+    poll_interval: float = 60.0  # Seconds between batch status checks
+    max_requests: int = 50000  # Requests per submitted batch (provider limit)
+
+
+class LLMStepConfig(BaseModel):
+    """Per-step overrides of the LLM settings (unset fields use the llm defaults)."""
+
+    model: str | None = None
+    temperature: float | None = None
+    timeout: int | None = None
+    max_tokens: int | None = None
+    base_url: str | None = None
+
+
+class LLMStepsConfig(BaseModel):
+    """LLM overrides for each generation step."""
+
+    outline: LLMStepConfig = Field(default_factory=LLMStepConfig)
+    script: LLMStepConfig = Field(default_factory=LLMStepConfig)  # Includes scene repair
+    preview: LLMStepConfig = Field(default_factory=LLMStepConfig)
+    generate: LLMStepConfig = Field(default_factory=LLMStepConfig)  # Legacy one-shot generator
+
+
 class LLMConfig(BaseModel):
     """LLM configuration."""
 
@@ -17,6 +87,43 @@ class LLMConfig(BaseModel):
     base_url: str | None = None
     temperature: float = 0.9
     timeout: int = 120
+    max_tokens: int | None = None  # Output token cap per completion (None = provider default)
+    stream: bool = False  # Stream completions so output can be checked as it arrives
+    # Response cache: off, read-through, record (always call and save), replay (fail on miss)
+    cache: Literal["off", "read-through", "record", "replay"] = "off"
+    cache_dir: Path | None = None  # Recorded responses (default: <paths.cache_dir>/llm)
+    max_concurrency: int = 0  # Max in-flight requests per process (0 = unlimited)
+    retry: LLMRetryConfig = Field(default_factory=LLMRetryConfig)
+    pacing: LLMPacingConfig = Field(default_factory=LLMPacingConfig)
+    steps: LLMStepsConfig = Field(default_factory=LLMStepsConfig)
+    # Endpoints to route between; empty = the single endpoint configured above
+    backends: list[LLMBackendConfig] = Field(default_factory=list)
+    router: LLMRouterConfig = Field(default_factory=LLMRouterConfig)
+    bulk: LLMBulkConfig = Field(default_factory=LLMBulkConfig)
+
+    def for_step(self, step: str | None) -> "LLMConfig":
+        """
+        Resolve the settings for one generation step.
+
+        Args:
+            step: Step name (outline, script, preview, generate), or None for the defaults
+
+        Returns:
+            This config with the step's overrides applied
+        """
+        overrides = getattr(self.steps, step, None) if step else None
+        values = overrides.model_dump(exclude_none=True) if overrides else {}
+        return self.model_copy(update=values) if values else self
+
+
+class TTSCacheConfig(BaseModel):
+    """Content-addressed TTS audio cache configuration."""
+
+    enabled: bool = False
+    remote: bool = False  # Share audio between hosts via the storage bucket (s3/r2 only)
+    remote_prefix: str = "tts-cache/"  # Key prefix for cached audio in the bucket
+    negative_ttl: int = 3600  # Seconds to remember remote misses before asking again
+    max_workers: int = 8  # Concurrent remote lookups/downloads
 
 
 class TTSConfig(BaseModel):
@@ -26,6 +133,9 @@ class TTSConfig(BaseModel):
     api_key: SecretStr | None = None
     base_url: str | None = None
     voice_mapping_file: Path | None = None
+    max_concurrency: int = 0  # Max episodes synthesizing audio at once (0 = unlimited)
+    line_concurrency: int = 4  # Max synthesis requests in flight per episode (async builds)
+    cache: TTSCacheConfig = Field(default_factory=TTSCacheConfig)
 
 
 class StorageConfig(BaseModel):
@@ -40,6 +150,58 @@ class StorageConfig(BaseModel):
     prefix: str = "episodes/"  # Key prefix for all uploads
 
 
+class DedupConfig(BaseModel):
+    """Near-duplicate detection of outlines and scripts (before audio is built)."""
+
+    enabled: bool = False
+    # Estimated Jaccard similarity of word shingles that counts as a duplicate
+    threshold: float = 0.5
+    # "regenerate" samples a new outline before rejecting; "reject" fails the step right away.
+    # Duplicate scripts are always rejected (the episode stays outlined and can be resumed)
+    action: Literal["regenerate", "reject"] = "regenerate"
+    regenerate_attempts: int = 2
+    num_perm: int = 64  # MinHash signature length
+    shingle_size: int = 3  # Words per shingle
+
+
+class GenerationConfig(BaseModel):
+    """Outline and script generation behaviour."""
+
+    # Stop a streamed completion once this many fatal validation errors are seen (0 = never)
+    abort_after_errors: int = 2
+    # Write the script as concurrent completions of this many outline scenes each
+    # (0 = one completion)
+    scene_group_size: int = 0
+    scene_workers: int = 8  # Max concurrent scene-group completions per episode
+    # Scene-level repair completions to attempt when a script fails validation (0 = off)
+    repair_attempts: int = 1
+    # Concurrent script candidates per generator attempt; the first valid one wins (1 = off)
+    candidates: int = 1
+    # System prompt encoding: "full" registry prose, or "compact" shot tables and character cards
+    prompt_verbosity: Literal["full", "compact"] = "full"
+    card_length: int = 120  # Max characters per description/quirks entry in compact prompts
+    # Voices and shots in the script prompt: "outline" sends only those the outline uses
+    # (plus characters it mentions), "registry" the whole registry
+    script_cast: Literal["outline", "registry"] = "outline"
+    # Output token budgets: each script call may write lines_per_scene * tokens_per_line
+    # tokens per outline scene plus budget_overhead (0 lines_per_scene = llm.max_tokens only)
+    lines_per_scene: int = 15
+    tokens_per_line: int = 40
+    budget_overhead: int = 1000  # Headers, summary line and any reasoning tokens
+    outline_max_tokens: int = 4000  # Output token cap for outline calls (0 = llm.max_tokens only)
+    # Follow-up completions for the scenes a budget-truncated script didn't finish
+    continuation_attempts: int = 2
+    # Outline response format: "json" requests schema-constrained structured output (the
+    # text parser remains the fallback), "text" the free-text format of outline.md.j2
+    outline_format: Literal["text", "json"] = "text"
+    # New outline requests after a response that can't be parsed or is aborted while streaming
+    outline_parse_retries: int = 1
+    # Outlines per completion in batch runs: one request carries this many topics, so the
+    # system prompt is sent once per group (outlines that can't be split out are retried singly)
+    outlines_per_request: int = 1
+    dedup: DedupConfig = Field(default_factory=DedupConfig)
+
+
 class PathsConfig(BaseModel):
     """Paths configuration."""
 
@@ -48,6 +210,7 @@ class PathsConfig(BaseModel):
     data_dir: Path = Path("data")
     templates_dir: Path = Path("templates")
     placeholders_dir: Path = Path("placeholders")
+    cache_dir: Path = Path(".cache")  # Local caches (TTS audio, etc.)
 
 
 class AppConfig(BaseSettings):
@@ -64,12 +227,15 @@ class AppConfig(BaseSettings):
     llm: LLMConfig = Field(default_factory=LLMConfig)
     tts: TTSConfig = Field(default_factory=TTSConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
+    generation: GenerationConfig = Field(default_factory=GenerationConfig)
     paths: PathsConfig = Field(default_factory=PathsConfig)
     debug: bool = False
     log_level: str = "INFO"
 
     # Direct environment variable overrides
     openai_api_key: SecretStr | None = Field(default=None, alias="OPENAI_API_KEY")
+    anthropic_api_key: SecretStr | None = Field(default=None, alias="ANTHROPIC_API_KEY")
+    azure_openai_api_key: SecretStr | None = Field(default=None, alias="AZURE_OPENAI_API_KEY")
     elevenlabs_api_key: SecretStr | None = Field(default=None, alias="ELEVENLABS_API_KEY")
     narakeet_api_key: SecretStr | None = Field(default=None, alias="NARAKEET_API_KEY")
 
@@ -114,8 +280,17 @@ def load_config(config_path: Path | None = None, root_dir: Path | None = None) -
     config = AppConfig(**config_dict)
 
     # Apply API key overrides
-    if config.openai_api_key and not config.llm.api_key:
-        config.llm.api_key = config.openai_api_key
+    provider_keys = {
+        "openai": config.openai_api_key,
+        "anthropic": config.anthropic_api_key,
+        "azure": config.azure_openai_api_key,
+    }
+    if not config.llm.api_key:
+        config.llm.api_key = provider_keys[config.llm.provider] or config.openai_api_key
+
+    for backend in config.llm.backends:
+        if not backend.api_key and backend.provider != config.llm.provider:
+            backend.api_key = provider_keys[backend.provider]
 
     if config.elevenlabs_api_key and not config.tts.api_key:
         if config.tts.provider == "elevenlabs":
@@ -144,5 +319,8 @@ def load_config(config_path: Path | None = None, root_dir: Path | None = None) -
         config.paths.data_dir = root_dir / config.paths.data_dir
         config.paths.templates_dir = root_dir / config.paths.templates_dir
         config.paths.placeholders_dir = root_dir / config.paths.placeholders_dir
+        config.paths.cache_dir = root_dir / config.paths.cache_dir
+        if config.llm.cache_dir:
+            config.llm.cache_dir = root_dir / config.llm.cache_dir
 
     return config
@@ -0,0 +1,255 @@
+"""MinHash index for spotting near-duplicate outlines and scripts."""
+
+import json
+import random
+import re
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+import structlog
+
+from brainwave.models.episode import EpisodeOutline
+from brainwave.models.script import WaveLangScript
+
+logger = structlog.get_logger()
+
+DedupKind = Literal["outline", "script"]
+
+# Rows per LSH band: documents sharing any band become candidates. With three
+# rows, pairs above ~0.4 similarity are almost always candidates
+LSH_ROWS = 3
+
+# Modulus of the permutation hashes (a Mersenne prime above the 32-bit shingle hashes)
+_PRIME = (1 << 61) - 1
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+class DuplicateEpisodeError(ValueError):
+    """Raised when generated output is a near-duplicate of an existing episode."""
+
+    def __init__(self, message: str, kind: DedupKind, match: "DuplicateMatch"):
+        super().__init__(message)
+        self.kind = kind
+        self.match = match
+
+
+@dataclass
+class DuplicateMatch:
+    """Closest indexed episode to a checked text."""
+
+    episode_id: str
+    similarity: float  # Estimated Jaccard similarity of the word shingles
+
+
+def outline_content(outline: EpisodeOutline) -> str:
+    """The text of an outline that is compared (its fields, without format labels)."""
+    parts = [outline.title, outline.premise, outline.theme or ""]
+    for scene in outline.scenes:
+        parts += [scene.setup, scene.beat, scene.lands]
+    parts += [*outline.callbacks, outline.ending or ""]
+    return "\n".join(parts)
+
+
+def script_content(script: WaveLangScript) -> str:
+    """The text of a script that is compared (its dialog)."""
+    return "\n".join(line.text for scene in script.scenes for line in scene.dialog)
+
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures of episode outlines and scripts, bucketed for LSH lookups.
+
+    Texts are reduced to sets of word shingles; the fraction of matching
+    signature slots estimates the Jaccard similarity of two sets. Lookups
+    only compare signatures that share an LSH band, so a check costs about
+    as much as hashing the new text.
+
+    Signatures are appended to a JSONL file as episodes are indexed, so
+    the index grows incrementally and other processes' additions are
+    picked up before each lookup. The file name carries the signature
+    parameters; changing them starts a new index.
+    """
+
+    def __init__(self, cache_dir: Path, num_perm: int = 64, shingle_size: int = 3):
+        """
+        Initialize the index.
+
+        Args:
+            cache_dir: Directory the index file is kept in
+            num_perm: MinHash signature length (more is more accurate and slower)
+            shingle_size: Words per shingle
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.path = cache_dir / f"dedup-{num_perm}x{shingle_size}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Fixed seed, so signatures stay comparable across runs
+        rng = random.Random(num_perm)
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+
+        self._signatures: dict[str, dict[str, tuple[int, ...]]] = {"outline": {}, "script": {}}
+        self._buckets: dict[tuple[str, int, tuple[int, ...]], set[str]] = {}
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """
+        MinHash signature of a text.
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            num_perm minimum hash values
+        """
+        words = _WORD.findall(text.lower())
+        size = min(self.shingle_size, len(words)) or 1
+        hashes = {
+            zlib.crc32(" ".join(words[i : i + size]).encode("utf-8"))
+            for i in range(max(1, len(words) - size + 1))
+        }
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self._perms)
+
+    def __contains__(self, key: tuple[DedupKind, str]) -> bool:
+        """Whether (kind, episode_id) is indexed."""
+        kind, episode_id = key
+        with self._lock:
+            self._refresh()
+            return episode_id in self._signatures[kind]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return sum(len(signatures) for signatures in self._signatures.values())
+
+    def add(self, kind: DedupKind, episode_id: str, text: str) -> None:
+        """
+        Index (or re-index) an episode's outline or script.
+
+        Args:
+            kind: "outline" or "script"
+            episode_id: Episode the text belongs to
+            text: Text to index (see outline_content/script_content)
+        """
+        signature = self.signature(text)
+        line = json.dumps({"kind": kind, "episode_id": episode_id, "signature": signature})
+        with self._lock:
+            self._refresh()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            # The offset stays put: lines other processes appended before ours are
+            # read on the next refresh, along with ours (already indexed, so skipped)
+            self._insert(kind, episode_id, signature)
+
+    def query(
+        self,
+        kind: DedupKind,
+        text: str,
+        threshold: float,
+        exclude: str | None = None,
+    ) -> DuplicateMatch | None:
+        """
+        Find the most similar indexed episode at or above a threshold.
+
+        Args:
+            kind: "outline" or "script"
+            text: Text to check
+            threshold: Minimum estimated similarity (0-1)
+            exclude: Episode ID to ignore (the episode being generated)
+
+        Returns:
+            The closest match, or None if nothing reaches the threshold
+        """
+        return self._best(kind, self.signature(text), threshold, exclude)
+
+    def pairs(self, kind: DedupKind, threshold: float) -> list[tuple[str, DuplicateMatch]]:
+        """
+        Indexed episodes with a near-duplicate among the others.
+
+        Args:
+            kind: "outline" or "script"
+            threshold: Minimum estimated similarity (0-1)
+
+        Returns:
+            (episode_id, closest match) per pair, most similar first
+        """
+        with self._lock:
+            self._refresh()
+            signatures = list(self._signatures[kind].items())
+
+        found: dict[frozenset[str], tuple[str, DuplicateMatch]] = {}
+        for episode_id, signature in signatures:
+            match = self._best(kind, signature, threshold, exclude=episode_id)
+            if match:
+                found.setdefault(frozenset((episode_id, match.episode_id)), (episode_id, match))
+        return sorted(found.values(), key=lambda pair: -pair[1].similarity)
+
+    def _best(
+        self,
+        kind: DedupKind,
+        signature: tuple[int, ...],
+        threshold: float,
+        exclude: str | None,
+    ) -> DuplicateMatch | None:
+        """Compare a signature with its LSH candidates; returns the closest match."""
+        with self._lock:
+            self._refresh()
+            candidates: set[str] = set()
+            for band, key in self._bands(signature):
+                candidates |= self._buckets.get((kind, band, key), set())
+            candidates.discard(exclude)
+            indexed = self._signatures[kind]
+            scored = [(indexed[c], c) for c in candidates]
+
+        best: DuplicateMatch | None = None
+        for other, episode_id in scored:
+            similarity = sum(x == y for x, y in zip(signature, other)) / self.num_perm
+            if similarity >= threshold and (best is None or similarity > best.similarity):
+                best = DuplicateMatch(episode_id=episode_id, similarity=similarity)
+        return best
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        rows = min(LSH_ROWS, len(signature)) or 1
+        return [
+            (band, signature[start : start + rows])
+            for band, start in enumerate(range(0, len(signature) - rows + 1, rows))
+        ]
+
+    def _insert(self, kind: str, episode_id: str, signature: tuple[int, ...]) -> None:
+        """Add a signature to the in-memory index (replacing the episode's previous one)."""
+        previous = self._signatures[kind].get(episode_id)
+        if previous == signature:
+            return
+        if previous:
+            for band, key in self._bands(previous):
+                self._buckets.get((kind, band, key), set()).discard(episode_id)
+
+        self._signatures[kind][episode_id] = signature
+        for band, key in self._bands(signature):
+            self._buckets.setdefault((kind, band, key), set()).add(episode_id)
+
+    def _refresh(self) -> None:
+        """Load signatures appended to the index file since the last read."""
+        if not self.path.exists() or self.path.stat().st_size <= self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+
+        # Leave a partially written last line for the next refresh
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].splitlines():
+            try:
+                entry = json.loads(raw)
+                self._insert(entry["kind"], entry["episode_id"], tuple(entry["signature"]))
+            except (ValueError, KeyError):
+                logger.warning("dedup_index_line_skipped", path=str(self.path))
+        self._offset += end
@@ -8,7 +8,7 @@ import structlog
 
 from brainwave.models.episode import Episode
 from brainwave.models.script import WaveLangScript
-from brainwave.parser import WaveLangParser
+from brainwave.script_cache import get_script_cache
 
 logger = structlog.get_logger()
 
@@ -19,7 +19,7 @@ class UnityExporter:
     VERSION = "1.0"
 
     def __init__(self):
-        self.parser = WaveLangParser()
+        self.scripts = get_script_cache()
 
     def export(self, episode: Episode, output_dir: Path | None = None) -> Path:
         """
@@ -45,7 +45,7 @@ class UnityExporter:
         # Parse script if available
         script: WaveLangScript | None = None
         if episode.script_raw:
-            script = self.parser.parse(episode.script_raw)
+            script = self.scripts.parse(episode.script_raw, episode.work_dir)
 
         manifest = self._build_manifest(episode, script)
 
@@ -133,7 +133,7 @@ class UnityExporter:
         dialogs: list[dict[str, Any]] = []
 
         if episode.script_raw:
-            script = self.parser.parse(episode.script_raw)
+            script = self.scripts.parse(episode.script_raw, episode.work_dir)
 
             for dialog in script.all_dialog_lines:
                 dialogs.append({
@@ -176,8 +176,7 @@ def generate_preview_text(episode: Episode) -> str:
             lines.append("")
 
     if episode.script_raw:
-        parser = WaveLangParser()
-        script = parser.parse(episode.script_raw)
+        script = get_script_cache().parse(episode.script_raw, episode.work_dir)
 
         lines.append("## Scene Breakdown")
         lines.append("")
@@ -1,24 +1,61 @@
 """Episode generation using single-shot LLM calls."""
 
 import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
 import structlog
-from jinja2 import Environment, FileSystemLoader
-from openai import OpenAI
 
 from brainwave.config import AppConfig
+from brainwave.llm import CompletionCancelledError, create_llm_client
+from brainwave.llm_cache import LLMCacheMissError
+from brainwave.llm_retry import LLMCallError
 from brainwave.models.characters import CharacterRegistry, ShotRegistry, load_characters, load_shots
-from brainwave.models.episode import Episode, EpisodeMeta, EpisodePlot, EpisodeStatus, PlotBeat
+from brainwave.models.episode import (
+    Episode,
+    EpisodeMeta,
+    EpisodePlot,
+    EpisodeStatus,
+    PlotBeat,
+    StepUsage,
+)
 from brainwave.models.script import WaveLangScript
 from brainwave.parser import PlotParser, WaveLangParser
-from brainwave.validator import ScriptValidator
+from brainwave.prompts import get_prompt_renderer
+from brainwave.repair import ScriptRepairer
+from brainwave.streaming import ScriptStreamMonitor
+from brainwave.validator import ScriptValidator, ValidationResult
 
 logger = structlog.get_logger()
 
 
+@dataclass
+class ScriptCandidate:
+    """A parsed and validated script completion."""
+
+    script_text: str
+    script: WaveLangScript
+    validation: ValidationResult
+    plot: EpisodePlot | None = None
+    index: int = 0
+
+
+def _worth_regenerating(error: Exception) -> bool:
+    """
+    Whether a fresh attempt could succeed.
+
+    API errors have already been retried (or are permanent) in the LLM
+    client, and a replay miss will miss again; everything else (bad
+    output, parse errors, aborted streams) may go better next time.
+    """
+    return not isinstance(error, (LLMCallError, LLMCacheMissError))
+
+
 class EpisodeGenerator:
     """
     Generates complete episodes in a single LLM call.
@@ -40,19 +77,16 @@ class EpisodeGenerator:
         # Set up validator
         self.validator = ScriptValidator(self.characters, self.shots)
 
-        # Set up Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(config.paths.templates_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # Shared, memoized prompt rendering
+        self.prompts = get_prompt_renderer(config)
 
-        # Set up OpenAI client
-        api_key = config.llm.api_key.get_secret_value() if config.llm.api_key else None
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url=config.llm.base_url,
-            timeout=config.llm.timeout,
+        # Set up LLM client
+        self.llm = create_llm_client(config)
+        self.repairer = ScriptRepairer(
+            self.llm,
+            self.validator,
+            self.prompts,
+            abort_after_errors=config.generation.abort_after_errors,
         )
 
     def generate(
@@ -71,75 +105,71 @@ class EpisodeGenerator:
             Complete Episode with plot and WaveLang script
         """
         episode = Episode.new(topic=topic)
-        episode.meta.model_used = self.config.llm.model
+        episode.meta.model_used = self.config.llm.for_step("generate").model
 
         # Build the consolidated prompt
         prompt = self._build_episode_prompt(topic=topic)
+        usage = episode.meta.step_usage("generate")
 
         for attempt in range(max_retries):
-            try:
-                logger.info(
-                    "generating_episode",
-                    attempt=attempt + 1,
-                    model=self.config.llm.model,
-                    topic=topic,
-                )
-
-                response = self.client.chat.completions.create(
-                    model=self.config.llm.model,
-                    messages=prompt,
-                    temperature=self.config.llm.temperature,
-                )
-
-                content = response.choices[0].message.content
-                if not content:
-                    raise ValueError("Empty response from LLM")
-
-                if response.usage:
-                    episode.meta.generation_tokens = response.usage.total_tokens
-
-                # Parse the response into plot + script
-                plot_text, script_text = self.wavlang_parser.extract_plot_and_script(content)
-
-                # Parse plot
-                plot_data = self.plot_parser.parse(plot_text)
-                episode.plot = self._build_plot(plot_data, plot_text)
-                episode.meta.title = episode.plot.title
-
-                # Parse script
-                script = self.wavlang_parser.parse(script_text)
-                episode.script_raw = script_text
-                episode.meta.scene_count = script.scene_count
-                episode.meta.dialog_count = script.dialog_count
-
-                # Validate the script
-                validation_result = self.validator.validate(script)
-                if not validation_result.is_valid:
-                    logger.warning(
-                        "validation_failed",
-                        errors=[e.message for e in validation_result.errors],
+            # Each attempt is timed and counted in the step's usage
+            with usage.timed():
+                try:
+                    logger.info(
+                        "generating_episode",
                         attempt=attempt + 1,
+                        model=episode.meta.model_used,
+                        topic=topic,
                     )
-                    if attempt < max_retries - 1:
-                        continue
-                    # On final attempt, return with warnings
-                    logger.warning("returning_with_validation_errors")
 
-                episode.meta.status = EpisodeStatus.SCRIPT_GENERATED
-                logger.info(
-                    "episode_generated",
-                    title=episode.plot.title,
-                    scenes=script.scene_count,
-                    dialogs=script.dialog_count,
-                )
+                    candidate = self._complete_candidates(
+                        prompt, usage, self._parse_episode_response, attempt
+                    )
+                    episode.meta.update_generation_tokens()
+
+                    episode.plot = candidate.plot
+                    episode.meta.title = episode.plot.title
+
+                    # Repair failing scenes in place
+                    script_text = candidate.script_text
+                    script = candidate.script
+                    validation_result = candidate.validation
+                    if not validation_result.is_valid:
+                        script_text, validation_result = self._repair(
+                            script_text, validation_result, usage
+                        )
+                        script = self.wavlang_parser.parse(script_text)
+
+                    episode.script_raw = script_text
+                    episode.meta.scene_count = script.scene_count
+                    episode.meta.dialog_count = script.dialog_count
+
+                    if not validation_result.is_valid:
+                        logger.warning(
+                            "validation_failed",
+                            errors=[e.message for e in validation_result.errors],
+                            attempt=attempt + 1,
+                        )
+                        if attempt < max_retries - 1:
+                            continue
+                        # On final attempt, return with warnings
+                        logger.warning("returning_with_validation_errors")
+
+                    episode.meta.status = EpisodeStatus.SCRIPT_GENERATED
+                    logger.info(
+                        "episode_generated",
+                        title=episode.plot.title,
+                        scenes=script.scene_count,
+                        dialogs=script.dialog_count,
+                    )
 
-                return episode
+                    return episode
 
-            except Exception as e:
-                logger.error("generation_failed", error=str(e), attempt=attempt + 1)
-                if attempt == max_retries - 1:
-                    episode.meta.status = EpisodeStatus.FAILED
-                    raise
+                except Exception as e:
+                    logger.error("generation_failed", error=str(e), attempt=attempt + 1)
+                    if attempt == max_retries - 1 or not _worth_regenerating(e):
+                        episode.meta.status = EpisodeStatus.FAILED
+                        raise
 
         raise RuntimeError("Episode generation failed after max retries")
 
@@ -154,24 +184,17 @@ class EpisodeGenerator:
             Episode with plot but no script
         """
         episode = Episode.new(topic=topic)
-        episode.meta.model_used = self.config.llm.model
+        episode.meta.model_used = self.config.llm.for_step("preview").model
 
         prompt = self._build_preview_prompt(topic=topic)
 
-        logger.info("generating_preview", model=self.config.llm.model, topic=topic)
-
-        response = self.client.chat.completions.create(
-            model=self.config.llm.model,
-            messages=prompt,
-            temperature=self.config.llm.temperature,
-        )
-
-        content = response.choices[0].message.content
-        if not content:
-            raise ValueError("Empty response from LLM")
+        logger.info("generating_preview", model=episode.meta.model_used, topic=topic)
 
-        if response.usage:
-            episode.meta.generation_tokens = response.usage.total_tokens
+        usage = episode.meta.step_usage("preview")
+        with usage.timed():
+            response = self.llm.complete(prompt, usage=usage, step="preview")
+        content = response.content
+        episode.meta.update_generation_tokens()
 
         # Extract plot section
         plot_text, _ = self.wavlang_parser.extract_plot_and_script(content + "\n=== SCRIPT ===\n")
@@ -205,113 +228,237 @@ class EpisodeGenerator:
             topic=episode.meta.topic,
             existing_plot=episode.plot,
         )
+        usage = episode.meta.step_usage("generate")
 
         for attempt in range(max_retries):
-            try:
-                logger.info(
-                    "generating_script_from_plot",
-                    attempt=attempt + 1,
-                    title=episode.plot.title,
-                )
-
-                response = self.client.chat.completions.create(
-                    model=self.config.llm.model,
-                    messages=prompt,
-                    temperature=self.config.llm.temperature,
-                )
-
-                content = response.choices[0].message.content
-                if not content:
-                    raise ValueError("Empty response from LLM")
-
-                # Parse script from response - it may or may not have section markers
-                script_text = content
-
-                # Try to extract just the script section if markers are present
-                if "=== SCRIPT ===" in content:
-                    try:
-                        _, script_text = self.wavlang_parser.extract_plot_and_script(content)
-                    except ValueError:
-                        # If extraction fails, use the whole content
-                        pass
-
-                # Clean up any markdown code blocks
-                script_text = script_text.strip()
-                if script_text.startswith("```"):
-                    lines = script_text.split("\n")
-                    script_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
-
-                script = self.wavlang_parser.parse(script_text)
-
-                episode.script_raw = script_text
-                episode.meta.scene_count = script.scene_count
-                episode.meta.dialog_count = script.dialog_count
-
-                # Validate
-                validation_result = self.validator.validate(script)
-                if not validation_result.is_valid and attempt < max_retries - 1:
-                    logger.warning("validation_failed", attempt=attempt + 1)
-                    continue
+            # Each attempt is timed and counted in the step's usage
+            with usage.timed():
+                try:
+                    logger.info(
+                        "generating_script_from_plot",
+                        attempt=attempt + 1,
+                        title=episode.plot.title,
+                    )
+
+                    candidate = self._complete_candidates(
+                        prompt, usage, self._parse_script_response, attempt
+                    )
+                    episode.meta.update_generation_tokens()
+
+                    # Repair failing scenes in place
+                    script_text = candidate.script_text
+                    script = candidate.script
+                    validation_result = candidate.validation
+                    if not validation_result.is_valid:
+                        script_text, validation_result = self._repair(
+                            script_text, validation_result, usage
+                        )
+                        script = self.wavlang_parser.parse(script_text)
+
+                    episode.script_raw = script_text
+                    episode.meta.scene_count = script.scene_count
+                    episode.meta.dialog_count = script.dialog_count
+
+                    if not validation_result.is_valid and attempt < max_retries - 1:
+                        logger.warning("validation_failed", attempt=attempt + 1)
+                        continue
 
-                episode.meta.status = EpisodeStatus.SCRIPT_GENERATED
-                return episode
+                    episode.meta.status = EpisodeStatus.SCRIPT_GENERATED
+                    return episode
 
-            except Exception as e:
-                logger.error("script_generation_failed", error=str(e), attempt=attempt + 1)
-                if attempt == max_retries - 1:
-                    raise
+                except Exception as e:
+                    logger.error("script_generation_failed", error=str(e), attempt=attempt + 1)
+                    if attempt == max_retries - 1 or not _worth_regenerating(e):
+                        raise
 
         raise RuntimeError("Script generation failed after max retries")
 
+    def _complete_candidates(
+        self,
+        prompt: list[dict[str, str]],
+        usage: StepUsage,
+        parse: Callable[[str], ScriptCandidate],
+        attempt: int = 0,
+    ) -> ScriptCandidate:
+        """
+        Generate one or more candidate scripts and pick a winner.
+
+        With generation.candidates > 1 the candidates are requested
+        concurrently and each is parsed and validated as soon as it
+        arrives; the first valid one wins and the rest are cancelled.
+        Candidates are always streamed, so cancelling closes their
+        connections instead of leaving blocking requests running.
+        If none is valid, the candidate with the fewest errors is returned
+        (for repair).
+
+        Args:
+            prompt: Chat messages
+            usage: Step usage record
+            parse: Turns completion text into a validated candidate
+            attempt: Retry attempt; each attempt samples fresh completions
+                rather than the cached ones of earlier attempts
+
+        Returns:
+            Winning candidate
+        """
+        count = self.config.generation.candidates
+        if count <= 1:
+            response = self.llm.complete(
+                prompt,
+                monitor=self._script_monitor(),
+                usage=usage,
+                variant=attempt,
+                step="generate",
+            )
+            return parse(response.content)
+
+        cancel = threading.Event()
+
+        def run(index: int) -> ScriptCandidate:
+            response = self.llm.complete(
+                prompt,
+                monitor=self._script_monitor(),
+                usage=usage,
+                cancel=cancel,
+                variant=attempt * count + index,
+                step="generate",
+                stream=True,
+            )
+            candidate = parse(response.content)
+            candidate.index = index
+            return candidate
+
+        best: ScriptCandidate | None = None
+        failures: list[Exception] = []
+
+        executor = ThreadPoolExecutor(max_workers=count)
+        try:
+            futures = [executor.submit(run, i) for i in range(count)]
+            for future in as_completed(futures):
+                try:
+                    candidate = future.result()
+                except CompletionCancelledError:
+                    continue
+                except Exception as e:
+                    logger.warning("candidate_failed", error=str(e))
+                    failures.append(e)
+                    continue
+
+                if candidate.validation.is_valid:
+                    logger.info("candidate_won", index=candidate.index, candidates=count)
+                    return candidate
+
+                if best is None or candidate.validation.error_count < best.validation.error_count:
+                    best = candidate
+        finally:
+            # Close the streams still in flight
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if best is None:
+            raise failures[0]
+
+        logger.info("no_valid_candidate", candidates=count, best_errors=best.validation.error_count)
+        return best
+
+    def _parse_episode_response(self, content: str) -> ScriptCandidate:
+        """Parse a plot + script completion into a validated candidate."""
+        plot_text, script_text = self.wavlang_parser.extract_plot_and_script(content)
+
+        plot_data = self.plot_parser.parse(plot_text)
+        script = self.wavlang_parser.parse(script_text)
+
+        return ScriptCandidate(
+            script_text=script_text,
+            script=script,
+            validation=self.validator.validate(script),
+            plot=self._build_plot(plot_data, plot_text),
+        )
+
+    def _parse_script_response(self, content: str) -> ScriptCandidate:
+        """Parse a script-only completion into a validated candidate."""
+        # Parse script from response - it may or may not have section markers
+        script_text = content
+
+        # Try to extract just the script section if markers are present
+        if "=== SCRIPT ===" in content:
+            try:
+                _, script_text = self.wavlang_parser.extract_plot_and_script(content)
+            except ValueError:
+                # If extraction fails, use the whole content
+                pass
+
+        # Clean up any markdown code blocks
+        script_text = script_text.strip()
+        if script_text.startswith("```"):
+            lines = script_text.split("\n")
+            script_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+
+        script = self.wavlang_parser.parse(script_text)
+        return ScriptCandidate(
+            script_text=script_text,
+            script=script,
+            validation=self.validator.validate(script),
+        )
+
+    def _repair(
+        self,
+        script_text: str,
+        validation_result: ValidationResult,
+        usage: StepUsage | None = None,
+    ) -> tuple[str, ValidationResult]:
+        """Try scene-level repair before falling back to a full retry."""
+        if self.config.generation.repair_attempts <= 0:
+            return script_text, validation_result
+
+        return self.repairer.repair(
+            script_text,
+            validation_result,
+            max_rounds=self.config.generation.repair_attempts,
+            usage=usage,
+            step="generate",
+        )
+
+    def _script_monitor(self) -> ScriptStreamMonitor:
+        """Create a monitor that aborts streamed scripts with too many errors."""
+        return ScriptStreamMonitor(self.validator, self.config.generation.abort_after_errors)
+
     def _build_episode_prompt(
         self,
         topic: str | None = None,
         existing_plot: EpisodePlot | None = None,
     ) -> list[dict[str, str]]:
         """Build the full episode generation prompt."""
-        template = self.jinja_env.get_template("episode.md.j2")
-
-        system_content = template.render(
-            characters=self.characters.characters,
-            shots=self.shots.shots,
-            topic=topic,
-        )
-
-        messages = [{"role": "system", "content": system_content}]
+        # The system message is identical for every episode (prompt-cache
+        # friendly); the premise and plot go in the user message
+        premise = f"PREMISE: {topic}\n\n" if topic else ""
 
         if existing_plot:
             # Add the existing plot to generate script for it
             plot_text = self._format_plot_for_prompt(existing_plot)
-            messages.append({
-                "role": "user",
-                "content": (
-                    f"Generate the full WaveLang script for this existing plot. "
-                    f"Output ONLY the WaveLang script (scene headers and dialog), no plot section needed.\n\n"
-                    f"PLOT:\n{plot_text}\n\n"
-                    f"Generate 10-20 scenes covering all plot beats. Start directly with the first scene header (>>)."
-                ),
-            })
+            user_content = (
+                f"{premise}"
+                "Generate the full WaveLang script for this existing plot. "
+                "Output ONLY the WaveLang script (scene headers and dialog), "
+                "no plot section needed.\n\n"
+                f"PLOT:\n{plot_text}\n\n"
+                "Generate 10-20 scenes covering all plot beats. "
+                "Start directly with the first scene header (>>)."
+            )
         else:
-            messages.append({
-                "role": "user",
-                "content": "Generate a complete episode with plot and full WaveLang script.",
-            })
+            user_content = (
+                f"{premise}Generate a complete episode with plot and full WaveLang script."
+            )
 
-        return messages
+        return self.prompts.messages("episode.md.j2", user_content)
 
     def _build_preview_prompt(self, topic: str | None = None) -> list[dict[str, str]]:
         """Build the plot-only preview prompt."""
-        template = self.jinja_env.get_template("preview.md.j2")
-
-        system_content = template.render(
-            characters=self.characters.characters,
-            topic=topic,
-        )
+        user_content = "Generate an episode plot outline."
+        if topic:
+            user_content = f"TOPIC/PREMISE: {topic}\n\n{user_content}"
 
-        return [
-            {"role": "system", "content": system_content},
-            {"role": "user", "content": "Generate an episode plot outline."},
-        ]
+        return self.prompts.messages("preview.md.j2", user_content)
 
     def _build_plot(self, plot_data: dict[str, str], raw_text: str) -> EpisodePlot:
         """Build EpisodePlot from parsed data."""
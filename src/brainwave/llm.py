@@ -0,0 +1,844 @@
+"""Chat completion client shared by the pipeline and the legacy generator."""
+
+import asyncio
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+
+import structlog
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion
+
+from brainwave.config import AppConfig, LLMConfig
+from brainwave.llm_cache import LLMResponseCache
+from brainwave.llm_pacing import Reservation
+from brainwave.llm_retry import (
+    OUTAGE,
+    RETRYABLE,
+    CircuitBreaker,
+    LLMCallError,
+    backoff_delay,
+    classify_error,
+)
+from brainwave.llm_router import LLMBackend, LLMRouter
+from brainwave.models.episode import StepUsage
+from brainwave.prompts import estimate_tokens, get_prompt_renderer
+from brainwave.streaming import StreamAbortedError, StreamMonitor
+
+logger = structlog.get_logger()
+
+
+class CompletionCancelledError(Exception):
+    """Raised when a request is cancelled because its result is no longer needed."""
+
+
+@dataclass
+class LLMResponse:
+    """Result of a chat completion."""
+
+    content: str
+    finish_reason: str | None = None
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    total_tokens: int | None = None
+    cached_tokens: int | None = None
+    model: str | None = None  # Model that served the request
+
+
+class _LLMClientBase:
+    """Caching, usage accounting, routing and retry policy shared by the sync and async clients."""
+
+    def __init__(self, config: LLMConfig, cache: LLMResponseCache | None = None):
+        self.config = config
+        self.cache = cache
+        self.router = LLMRouter(config)
+        self._usage_lock = threading.Lock()
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Circuit breaker of the default backend."""
+        return self.router.default.breaker
+
+    @staticmethod
+    def _with_budget(settings: LLMConfig, max_tokens: int | None) -> LLMConfig:
+        """Apply a per-call output token budget, never above the configured llm.max_tokens."""
+        if not max_tokens:
+            return settings
+        if settings.max_tokens:
+            max_tokens = min(max_tokens, settings.max_tokens)
+        return settings.model_copy(update={"max_tokens": max_tokens})
+
+    def _request_kwargs(
+        self,
+        messages: list[dict[str, str]],
+        stream: bool,
+        settings: LLMConfig,
+        backend: LLMBackend,
+        response_format: dict | None = None,
+    ) -> dict:
+        """Arguments for a chat completion request."""
+        kwargs = {
+            "model": backend.model or settings.model,
+            "messages": messages,
+            "temperature": settings.temperature,
+            "timeout": settings.timeout,
+        }
+        if settings.max_tokens:
+            kwargs["max_completion_tokens"] = settings.max_tokens
+        if response_format:
+            kwargs["response_format"] = response_format
+        if stream:
+            kwargs["stream"] = True
+            kwargs["stream_options"] = {"include_usage": True}
+        return kwargs
+
+    def _lookup(
+        self,
+        messages: list[dict[str, str]],
+        monitor: StreamMonitor | None,
+        usage: StepUsage | None,
+        variant: int,
+        settings: LLMConfig,
+        response_format: dict | None = None,
+        stream: bool = False,
+    ) -> tuple[str | None, LLMResponse | None]:
+        """Look a request up in the response cache; returns (cache key, cached response)."""
+        if not self.cache:
+            return None, None
+
+        cache_key = self.cache.key(
+            settings.model,
+            settings.temperature,
+            messages,
+            variant=variant,
+            max_tokens=settings.max_tokens,
+            response_format=response_format,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        response = LLMResponse(**cached)
+        # Replay through the monitor so aborts behave as they would live
+        if stream and monitor:
+            monitor.feed(response.content)
+            monitor.finish()
+        self._record_usage(usage, response, response.model or settings.model)
+        return cache_key, response
+
+    def _finish(
+        self,
+        messages: list[dict[str, str]],
+        response: LLMResponse,
+        usage: StepUsage | None,
+        cache_key: str | None,
+        settings: LLMConfig,
+    ) -> LLMResponse:
+        """Record usage, reject empty output and cache a live response."""
+        self._record_usage(usage, response, response.model or settings.model)
+
+        if not response.content:
+            raise ValueError("Empty response from LLM")
+
+        if self.cache and cache_key:
+            self.cache.put(cache_key, asdict(response), settings.model, messages)
+
+        return response
+
+    def _pace(
+        self, backend: LLMBackend, messages: list[dict[str, str]], settings: LLMConfig
+    ) -> Reservation:
+        """
+        Reserve a request against the backend's rate-limit quotas.
+
+        The token estimate covers the prompt and the output cap, which is
+        what providers count against the quota when a request is admitted.
+
+        Returns:
+            Reservation with the seconds to wait before sending the request
+        """
+        tokens = sum(estimate_tokens(str(m.get("content") or "")) for m in messages)
+        return backend.pacer.reserve(tokens + (settings.max_tokens or 0))
+
+    def _handle_failure(
+        self,
+        error: Exception,
+        attempt: int,
+        usage: StepUsage | None,
+        backend: LLMBackend,
+        latency: float,
+        pool: list[LLMBackend],
+        failed: set[str],
+        reservation: Reservation | None = None,
+    ) -> float:
+        """
+        Handle a failed attempt: update the backend's health and pick a delay.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Attempt number (1-based)
+            usage: Optional step usage record (retries are counted)
+            backend: Backend the attempt was sent to
+            latency: Seconds the attempt took
+            pool: Backends the request may use
+            failed: Backends that failed this request; updated in place
+            reservation: The attempt's pacing reservation (released)
+
+        Returns:
+            Seconds to wait before the next attempt (0 to fail over at once)
+
+        Raises:
+            The original error if it is not an API error, or LLMCallError
+            if it is not retryable or attempts are exhausted
+        """
+        response = getattr(error, "response", None)
+        backend.pacer.observe(response.headers if response is not None else None, reservation)
+
+        kind = classify_error(error)
+        if kind in OUTAGE:
+            backend.breaker.record_failure()
+        else:
+            # The provider answered, so it is reachable
+            backend.breaker.record_success()
+        if kind in RETRYABLE:
+            backend.health.record(False, latency)
+
+        if kind is None:
+            raise error
+        if kind not in RETRYABLE or attempt >= self.config.retry.max_attempts:
+            raise LLMCallError(
+                f"LLM request failed ({kind}) after {attempt} attempt(s): {error}",
+                kind=kind,
+                attempts=attempt,
+            ) from error
+
+        if usage is not None:
+            with self._usage_lock:
+                usage.retries += 1
+
+        # Another backend can take the request straight away
+        failed.add(backend.name)
+        if self.router.has_alternative(pool, failed):
+            logger.warning(
+                "llm_failover",
+                kind=kind,
+                backend=backend.name,
+                attempt=attempt,
+                error=str(error),
+            )
+            return 0.0
+
+        failed.clear()
+        delay = backoff_delay(
+            attempt, self.config.retry.base_delay, self.config.retry.max_delay, error
+        )
+        logger.warning(
+            "llm_call_retry",
+            kind=kind,
+            backend=backend.name,
+            attempt=attempt,
+            delay=round(delay, 2),
+            error=str(error),
+        )
+        return delay
+
+    def _handle_success(self, backend: LLMBackend, latency: float) -> None:
+        """Record a successful attempt."""
+        backend.breaker.record_success()
+        backend.health.record(True, latency)
+
+    def _parse_completion(self, response, model: str) -> LLMResponse:
+        """Convert a non-streaming API response."""
+        choice = response.choices[0]
+        result = LLMResponse(
+            content=choice.message.content or "",
+            finish_reason=choice.finish_reason,
+            model=model,
+        )
+        if response.usage:
+            self._apply_usage(result, response.usage)
+        return result
+
+    def _apply_chunk(
+        self,
+        result: LLMResponse,
+        parts: list[str],
+        chunk,
+        monitor: StreamMonitor | None,
+    ) -> None:
+        """Fold one streamed chunk into the response, feeding text to the monitor."""
+        if chunk.usage:
+            self._apply_usage(result, chunk.usage)
+
+        if not chunk.choices:
+            return
+
+        choice = chunk.choices[0]
+        if choice.delta.content:
+            parts.append(choice.delta.content)
+            if monitor:
+                monitor.feed(choice.delta.content)
+
+        if choice.finish_reason:
+            result.finish_reason = choice.finish_reason
+
+    @staticmethod
+    def _apply_usage(result: LLMResponse, usage) -> None:
+        """Copy token counts from an API usage object."""
+        result.prompt_tokens = usage.prompt_tokens
+        result.completion_tokens = usage.completion_tokens
+        result.total_tokens = usage.total_tokens
+        result.cached_tokens = _cached_tokens(usage)
+
+    def _record_usage(
+        self,
+        usage: StepUsage | None,
+        response: LLMResponse,
+        model: str,
+    ) -> None:
+        """Add a response's token usage to a step record (shared across threads)."""
+        if usage is None:
+            return
+
+        with self._usage_lock:
+            usage.add(
+                model,
+                response.prompt_tokens,
+                response.completion_tokens,
+                response.cached_tokens,
+            )
+
+        if response.cached_tokens:
+            logger.debug(
+                "llm_prompt_cache_hit",
+                cached_tokens=response.cached_tokens,
+                prompt_tokens=response.prompt_tokens,
+            )
+
+
+class LLMClient(_LLMClientBase):
+    """
+    Thin wrapper around the OpenAI chat completions API.
+
+    When streaming is enabled, completion text is fed to an optional
+    StreamMonitor as it arrives so a bad completion can be stopped early.
+    An optional LLMResponseCache records or replays responses.
+
+    Requests go to the backend an LLMRouter picks from llm.backends (or the
+    single configured endpoint). Rate-limit, timeout and server errors fail
+    over to another healthy backend at once, or are retried with jittered
+    exponential backoff when none is left; repeated outage errors open a
+    backend's circuit breaker, holding back every caller sharing this
+    client until that backend recovers. Each backend's QuotaPacer reads the
+    rate-limit headers of its responses and delays requests that would
+    overrun the remaining quota, so a busy batch stays just under the limit
+    instead of running into 429s.
+    """
+
+    def __init__(self, config: LLMConfig, cache: LLMResponseCache | None = None):
+        super().__init__(config, cache)
+
+        # Caps in-flight requests when several episodes share this client
+        self._slots = (
+            threading.BoundedSemaphore(config.max_concurrency)
+            if config.max_concurrency > 0
+            else None
+        )
+
+    @property
+    def client(self) -> OpenAI:
+        """SDK client of the default backend (created lazily; replay runs never need one)."""
+        return self.router.default.client
+
+    @client.setter
+    def client(self, client: OpenAI) -> None:
+        self.router.default.client = client
+
+    def complete(
+        self,
+        messages: list[dict[str, str]],
+        monitor: StreamMonitor | None = None,
+        usage: StepUsage | None = None,
+        cancel: threading.Event | None = None,
+        variant: int = 0,
+        step: str | None = None,
+        max_tokens: int | None = None,
+        response_format: dict | None = None,
+        stream: bool | None = None,
+    ) -> LLMResponse:
+        """
+        Run a chat completion.
+
+        Args:
+            messages: Chat messages
+            monitor: Optional monitor fed with streamed output (streaming mode only)
+            usage: Optional step usage record to add this request's tokens to
+            cancel: Optional event; once set, the request stops (streams are closed)
+            variant: Sample index when the same request is sent several times
+            step: Generation step whose llm.steps overrides apply (None = defaults)
+            max_tokens: Output token budget for this call (capped at llm.max_tokens)
+            response_format: Structured output format (e.g. a json_schema) to request
+            stream: Override llm.stream for this call; a blocking request can't
+                be stopped once sent, so callers relying on cancel stream
+
+        Returns:
+            LLMResponse with content and usage (finish_reason "length" if the
+            budget cut it short)
+
+        Raises:
+            ValueError: If the LLM returned no content
+            StreamAbortedError: If the monitor stopped the stream
+            LLMCacheMissError: In replay mode, if the request was never recorded
+            LLMCallError: If the API request failed and could not be retried
+            CompletionCancelledError: If cancel was set before the response completed
+        """
+        stream = self.config.stream if stream is None else stream
+        settings = self._with_budget(self.config.for_step(step), max_tokens)
+        cache_key, cached = self._lookup(
+            messages, monitor, usage, variant, settings, response_format, stream
+        )
+        if cached is not None:
+            return cached
+
+        response = self._complete_with_retry(
+            messages, settings, monitor, usage, cancel, response_format, stream
+        )
+        return self._finish(messages, response, usage, cache_key, settings)
+
+    def batch_request(
+        self,
+        custom_id: str,
+        messages: list[dict[str, str]],
+        step: str | None = None,
+        max_tokens: int | None = None,
+        response_format: dict | None = None,
+    ) -> dict:
+        """
+        Build one Batch API input line for a chat completion.
+
+        Batches go to the default backend, so its model and endpoint apply.
+
+        Args:
+            custom_id: ID to match the result line back to the request
+            messages: Chat messages
+            step: Generation step whose llm.steps overrides apply (None = defaults)
+            max_tokens: Output token budget (capped at llm.max_tokens)
+            response_format: Structured output format to request
+
+        Returns:
+            JSONL line as a dict
+        """
+        settings = self._with_budget(self.config.for_step(step), max_tokens)
+        backend = self.router.default
+        body = self._request_kwargs(messages, False, settings, backend, response_format)
+        body.pop("timeout")
+
+        url = "/chat/completions" if backend.config.provider == "azure" else "/v1/chat/completions"
+        return {"custom_id": custom_id, "method": "POST", "url": url, "body": body}
+
+    def batch_response(
+        self,
+        line: dict,
+        messages: list[dict[str, str]],
+        usage: StepUsage | None = None,
+        step: str | None = None,
+        max_tokens: int | None = None,
+        response_format: dict | None = None,
+    ) -> LLMResponse:
+        """
+        Read one Batch API output line as complete() would have returned it.
+
+        Usage is recorded and the response cached under the same key a live
+        request would use, so a later run replays it.
+
+        Args:
+            line: Output (or error) file line for the request
+            messages: The request's chat messages
+            usage: Optional step usage record to add the tokens to
+            step: Generation step the request was built for
+            max_tokens: Output token budget the request was built with
+            response_format: Structured output format the request was built with
+
+        Returns:
+            LLMResponse with content and usage
+
+        Raises:
+            LLMCallError: If the request failed inside the batch
+            ValueError: If the LLM returned no content
+        """
+        result = line.get("response") or {}
+        status = result.get("status_code", 0)
+        if line.get("error") or status != 200:
+            error = line.get("error") or (result.get("body") or {}).get("error") or {}
+            kind = "rate_limit" if status == 429 else "server" if status >= 500 else "bad_request"
+            raise LLMCallError(f"Batch request failed: {error.get('message', status)}", kind)
+
+        settings = self._with_budget(self.config.for_step(step), max_tokens)
+        completion = ChatCompletion.model_validate(result["body"])
+        response = self._parse_completion(completion, completion.model or settings.model)
+
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.key(
+                settings.model,
+                settings.temperature,
+                messages,
+                max_tokens=settings.max_tokens,
+                response_format=response_format,
+            )
+        return self._finish(messages, response, usage, cache_key, settings)
+
+    def _complete_with_retry(
+        self,
+        messages: list[dict[str, str]],
+        settings: LLMConfig,
+        monitor: StreamMonitor | None,
+        usage: StepUsage | None = None,
+        cancel: threading.Event | None = None,
+        response_format: dict | None = None,
+        stream: bool = False,
+    ) -> LLMResponse:
+        """Call the API, failing over between backends and retrying with backoff."""
+        pool = self.router.pool(settings.base_url)
+        failed: set[str] = set()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            backend = self.router.select(pool, failed)
+            # A probe whose outcome isn't recorded is handed back, or the open
+            # circuit would wait on it forever
+            probe = backend.breaker.acquire()
+            try:
+                reservation = self._pace(backend, messages, settings)
+                if reservation.delay:
+                    if cancel:
+                        if cancel.wait(reservation.delay):
+                            backend.pacer.release(reservation)
+                            raise CompletionCancelledError("Request cancelled while paced")
+                    else:
+                        time.sleep(reservation.delay)
+                started = time.monotonic()
+
+                try:
+                    with self._slots or nullcontext():
+                        if cancel and cancel.is_set():
+                            raise CompletionCancelledError("Request cancelled before it was sent")
+                        started = time.monotonic()
+                        kwargs = self._request_kwargs(
+                            messages, stream, settings, backend, response_format
+                        )
+                        if stream:
+                            response = self._complete_streaming(
+                                backend, kwargs, reservation, monitor, cancel
+                            )
+                        else:
+                            response = self._complete_blocking(backend, kwargs, reservation)
+
+                except CompletionCancelledError:
+                    # Says nothing about the provider's health
+                    backend.pacer.release(reservation)
+                    raise
+
+                except Exception as e:
+                    probe = False  # The outcome is recorded
+                    # Sleep outside the concurrency slot so other requests can proceed
+                    delay = self._handle_failure(
+                        e,
+                        attempt,
+                        usage,
+                        backend,
+                        time.monotonic() - started,
+                        pool,
+                        failed,
+                        reservation,
+                    )
+                    if cancel:
+                        if cancel.wait(delay):
+                            raise CompletionCancelledError(
+                                "Request cancelled during backoff"
+                            ) from e
+                    else:
+                        time.sleep(delay)
+                    if monitor:
+                        monitor.reset()
+                    continue
+
+                probe = False
+                self._handle_success(backend, time.monotonic() - started)
+                return response
+
+            finally:
+                if probe:
+                    backend.breaker.abandon_probe()
+
+    def _complete_blocking(
+        self, backend: LLMBackend, kwargs: dict, reservation: Reservation
+    ) -> LLMResponse:
+        """Run a non-streaming completion."""
+        raw = backend.client.chat.completions.with_raw_response.create(**kwargs)
+        backend.pacer.observe(raw.headers, reservation)
+        return self._parse_completion(raw.parse(), kwargs["model"])
+
+    def _complete_streaming(
+        self,
+        backend: LLMBackend,
+        kwargs: dict,
+        reservation: Reservation,
+        monitor: StreamMonitor | None,
+        cancel: threading.Event | None = None,
+    ) -> LLMResponse:
+        """Run a streaming completion, feeding chunks to the monitor."""
+        raw = backend.client.chat.completions.with_raw_response.create(**kwargs)
+        backend.pacer.observe(raw.headers, reservation)
+        stream = raw.parse()
+
+        parts: list[str] = []
+        result = LLMResponse(content="", model=kwargs["model"])
+
+        try:
+            for chunk in stream:
+                if cancel and cancel.is_set():
+                    raise CompletionCancelledError("Stream cancelled")
+                self._apply_chunk(result, parts, chunk, monitor)
+
+            if monitor:
+                monitor.finish()
+
+        except (StreamAbortedError, CompletionCancelledError):
+            logger.info("completion_stream_closed", received_chars=sum(len(p) for p in parts))
+            raise
+
+        finally:
+            # Closing the response stops generation (and billing) on the provider side
+            stream.close()
+
+        result.content = "".join(parts)
+        return result
+
+
+class AsyncLLMClient(_LLMClientBase):
+    """
+    Asyncio counterpart of LLMClient built on AsyncOpenAI.
+
+    Shares the response cache, usage accounting, routing, retry policy, pacing and
+    circuit breaker behaviour of the sync client, but waits on the event
+    loop instead of a thread, so one process can keep many requests in
+    flight. Cancelling the awaiting task closes an open stream.
+
+    The SDK clients and concurrency semaphore bind to the running event
+    loop, so use one instance per loop.
+    """
+
+    def __init__(self, config: LLMConfig, cache: LLMResponseCache | None = None):
+        super().__init__(config, cache)
+        self._slots = (
+            asyncio.BoundedSemaphore(config.max_concurrency) if config.max_concurrency > 0 else None
+        )
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Async SDK client of the default backend."""
+        return self.router.default.async_client
+
+    @client.setter
+    def client(self, client: AsyncOpenAI) -> None:
+        self.router.default.async_client = client
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        monitor: StreamMonitor | None = None,
+        usage: StepUsage | None = None,
+        variant: int = 0,
+        step: str | None = None,
+        max_tokens: int | None = None,
+        response_format: dict | None = None,
+    ) -> LLMResponse:
+        """
+        Run a chat completion.
+
+        Args:
+            messages: Chat messages
+            monitor: Optional monitor fed with streamed output (streaming mode only)
+            usage: Optional step usage record to add this request's tokens to
+            variant: Sample index when the same request is sent several times
+            step: Generation step whose llm.steps overrides apply (None = defaults)
+            max_tokens: Output token budget for this call (capped at llm.max_tokens)
+            response_format: Structured output format (e.g. a json_schema) to request
+
+        Returns:
+            LLMResponse with content and usage (finish_reason "length" if the
+            budget cut it short)
+
+        Raises:
+            ValueError: If the LLM returned no content
+            StreamAbortedError: If the monitor stopped the stream
+            LLMCacheMissError: In replay mode, if the request was never recorded
+            LLMCallError: If the API request failed and could not be retried
+        """
+        settings = self._with_budget(self.config.for_step(step), max_tokens)
+        cache_key, cached = self._lookup(
+            messages, monitor, usage, variant, settings, response_format, self.config.stream
+        )
+        if cached is not None:
+            return cached
+
+        response = await self._complete_with_retry(
+            messages, settings, monitor, usage, response_format
+        )
+        return self._finish(messages, response, usage, cache_key, settings)
+
+    async def _complete_with_retry(
+        self,
+        messages: list[dict[str, str]],
+        settings: LLMConfig,
+        monitor: StreamMonitor | None,
+        usage: StepUsage | None = None,
+        response_format: dict | None = None,
+    ) -> LLMResponse:
+        """Call the API, failing over between backends and retrying with backoff."""
+        pool = self.router.pool(settings.base_url)
+        failed: set[str] = set()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            backend = self.router.select(pool, failed)
+            # An unrecorded probe is handed back (see LLMClient)
+            probe = await backend.breaker.acquire_async()
+            try:
+                reservation = self._pace(backend, messages, settings)
+                started = time.monotonic()
+
+                try:
+                    if reservation.delay:
+                        await asyncio.sleep(reservation.delay)
+                    async with self._slots or nullcontext():
+                        started = time.monotonic()
+                        kwargs = self._request_kwargs(
+                            messages, self.config.stream, settings, backend, response_format
+                        )
+                        if self.config.stream:
+                            response = await self._complete_streaming(
+                                backend, kwargs, reservation, monitor
+                            )
+                        else:
+                            response = await self._complete_blocking(backend, kwargs, reservation)
+
+                except asyncio.CancelledError:
+                    backend.pacer.release(reservation)
+                    raise
+
+                except Exception as e:
+                    probe = False
+                    delay = self._handle_failure(
+                        e,
+                        attempt,
+                        usage,
+                        backend,
+                        time.monotonic() - started,
+                        pool,
+                        failed,
+                        reservation,
+                    )
+                    await asyncio.sleep(delay)
+                    if monitor:
+                        monitor.reset()
+                    continue
+
+                probe = False
+                self._handle_success(backend, time.monotonic() - started)
+                return response
+
+            finally:
+                if probe:
+                    backend.breaker.abandon_probe()
+
+    async def _complete_blocking(
+        self, backend: LLMBackend, kwargs: dict, reservation: Reservation
+    ) -> LLMResponse:
+        """Run a non-streaming completion."""
+        raw = await backend.async_client.chat.completions.with_raw_response.create(**kwargs)
+        backend.pacer.observe(raw.headers, reservation)
+        return self._parse_completion(raw.parse(), kwargs["model"])
+
+    async def _complete_streaming(
+        self,
+        backend: LLMBackend,
+        kwargs: dict,
+        reservation: Reservation,
+        monitor: StreamMonitor | None,
+    ) -> LLMResponse:
+        """Run a streaming completion, feeding chunks to the monitor."""
+        raw = await backend.async_client.chat.completions.with_raw_response.create(**kwargs)
+        backend.pacer.observe(raw.headers, reservation)
+        stream = raw.parse()
+
+        parts: list[str] = []
+        result = LLMResponse(content="", model=kwargs["model"])
+
+        try:
+            async for chunk in stream:
+                self._apply_chunk(result, parts, chunk, monitor)
+
+            if monitor:
+                monitor.finish()
+
+        except (StreamAbortedError, asyncio.CancelledError):
+            logger.info("completion_stream_closed", received_chars=sum(len(p) for p in parts))
+            raise
+
+        finally:
+            # Closing the response stops generation (and billing) on the provider side
+            await stream.close()
+
+        result.content = "".join(parts)
+        return result
+
+
+def _cached_tokens(usage) -> int | None:
+    """Read prompt-cache hits from a usage object (absent on some providers)."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", None) if details else None
+
+
+def _create_response_cache(config: AppConfig) -> LLMResponseCache | None:
+    """Create the response cache configured for this run, if any."""
+    if config.llm.cache == "off":
+        return None
+
+    cache = LLMResponseCache(
+        cache_dir=config.llm.cache_dir or config.paths.cache_dir / "llm",
+        mode=config.llm.cache,
+        fingerprint=get_prompt_renderer(config).fingerprint,
+    )
+    logger.info("llm_cache_enabled", mode=config.llm.cache, path=str(cache.cache_dir))
+    return cache
+
+
+def create_llm_client(config: AppConfig) -> LLMClient:
+    """
+    Create an LLM client with the response cache configured for this run.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Configured LLMClient
+    """
+    return LLMClient(config.llm, cache=_create_response_cache(config))
+
+
+def create_async_llm_client(config: AppConfig) -> AsyncLLMClient:
+    """
+    Create an async LLM client with the response cache configured for this run.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Configured AsyncLLMClient (use it from a single event loop)
+    """
+    return AsyncLLMClient(config.llm, cache=_create_response_cache(config))
@@ -0,0 +1,136 @@
+"""On-disk cache of LLM responses for record/replay runs."""
+
+import hashlib
+import json
+import uuid
+from pathlib import Path
+from typing import Any, Literal
+
+import structlog
+
+logger = structlog.get_logger()
+
+CacheMode = Literal["off", "read-through", "record", "replay"]
+
+
+class LLMCacheMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class LLMResponseCache:
+    """
+    Content-addressed store of chat completion responses.
+
+    Modes:
+    - off: never read or write
+    - read-through: serve hits, call the API and record on a miss
+    - record: always call the API and (over)write the recording
+    - replay: serve hits only; a miss raises LLMCacheMissError
+    """
+
+    def __init__(self, cache_dir: Path, mode: CacheMode, fingerprint: str = ""):
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.fingerprint = fingerprint
+
+    @property
+    def reads(self) -> bool:
+        """Whether lookups are served from the cache."""
+        return self.mode in ("read-through", "replay")
+
+    @property
+    def writes(self) -> bool:
+        """Whether API responses are recorded."""
+        return self.mode in ("read-through", "record")
+
+    def key(
+        self,
+        model: str,
+        temperature: float,
+        messages: list[dict[str, str]],
+        variant: int = 0,
+        max_tokens: int | None = None,
+        response_format: dict | None = None,
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        A non-zero variant distinguishes concurrent samples of the same
+        request (e.g. best-of-N candidates) so each gets its own recording.
+        An output token cap is part of the key since it can truncate a response,
+        and so is a structured output format since it shapes one.
+        """
+        messages_hash = hashlib.sha256(
+            json.dumps(messages, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        fields: dict[str, Any] = {
+            "model": model,
+            "temperature": temperature,
+            "messages": messages_hash,
+            "prompts": self.fingerprint,
+        }
+        if variant:
+            fields["variant"] = variant
+        if max_tokens:
+            fields["max_tokens"] = max_tokens
+        if response_format:
+            fields["response_format"] = response_format
+        payload = json.dumps(fields, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a recorded response.
+
+        Returns:
+            Recorded response fields, or None on a miss
+
+        Raises:
+            LLMCacheMissError: In replay mode, if nothing was recorded for key
+        """
+        if not self.reads:
+            return None
+
+        path = self._path(key)
+        if not path.exists():
+            if self.mode == "replay":
+                raise LLMCacheMissError(f"No recorded LLM response for request {key[:12]}")
+            return None
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        logger.debug("llm_cache_hit", key=key[:12])
+        return data["response"]
+
+    def put(
+        self,
+        key: str,
+        response: dict[str, Any],
+        model: str,
+        messages: list[dict[str, str]],
+    ) -> None:
+        """Record a response (with its request, for inspection)."""
+        if not self.writes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "request": {"model": model, "messages": messages},
+                    "response": response,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        tmp_path.replace(path)
+
+        logger.debug("llm_cache_recorded", key=key[:12])
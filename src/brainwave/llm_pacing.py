@@ -0,0 +1,206 @@
+"""Proactive pacing of LLM requests from the provider's rate-limit headers."""
+
+import re
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.get_logger()
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_reset(value: str | None) -> float | None:
+    """
+    Parse a rate-limit reset header ("1s", "6m0s", "20ms" or plain seconds).
+
+    Returns:
+        Seconds, or None if the value can't be read
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def _number(value: str | None) -> float | None:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+@dataclass(eq=False)
+class Reservation:
+    """A request admitted by a QuotaPacer, counted against its quotas until answered."""
+
+    delay: float  # Seconds to wait before sending the request
+    tokens: int
+
+
+@dataclass
+class _Quota:
+    """One quota (requests or tokens): what the provider last reported, projected forward."""
+
+    limit: float | None = None
+    level: float | None = None  # Projected remaining quota; negative once admissions queue up
+    rate: float | None = None  # Replenishment per second (known once some quota is spent)
+    reset_at: float = 0.0  # When the provider said the quota is full again
+    updated: float = 0.0
+
+    def observe(
+        self,
+        limit: float | None,
+        remaining: float | None,
+        reset: float | None,
+        in_flight: float,
+        now: float,
+    ) -> None:
+        """Take the provider's numbers, less the admitted requests it may not have seen."""
+        if limit is not None:
+            self.limit = limit
+        if remaining is None:
+            return
+
+        self.level = remaining - in_flight
+        self.updated = now
+        if reset is not None:
+            self.reset_at = now + reset
+            # The spent part of the quota comes back over the reset period
+            if self.limit and reset > 0 and self.limit > remaining:
+                self.rate = (self.limit - remaining) / reset
+
+    def reserve(self, amount: float, headroom: float, now: float) -> float:
+        """Take a request's share of the quota; returns seconds until it may be sent."""
+        if self.level is None:
+            return 0.0
+
+        if self.rate:
+            self.level += self.rate * (now - self.updated)
+            if self.limit:
+                self.level = min(self.level, self.limit)
+        self.updated = now
+        self.level -= amount
+
+        floor = headroom * (self.limit or 0)
+        if self.level >= floor:
+            return 0.0
+        if self.rate:
+            return (floor - self.level) / self.rate
+        # Without a replenishment rate, all that is known is when the quota resets
+        return max(0.0, self.reset_at - now) if self.level < 0 else 0.0
+
+
+class QuotaPacer:
+    """
+    Spreads a backend's requests over its rate-limit quota.
+
+    Every response's x-ratelimit-* headers update the remaining request and
+    token quotas and how fast they replenish. Before a request is sent it
+    reserves one request and its estimated tokens; once a quota (less a
+    headroom share) is used up, callers are given staggered delays at the
+    replenishment rate instead of all going out and coming back as 429s.
+
+    Reservations count against the reported quotas until their own response
+    (or failure) comes back, since the provider may not have seen them when
+    another response's headers were written.
+
+    Until a provider sends the headers, requests are never delayed.
+    """
+
+    def __init__(self, enabled: bool = True, headroom: float = 0.05, max_delay: float = 60.0):
+        """
+        Initialize the pacer.
+
+        Args:
+            enabled: Whether to pace at all
+            headroom: Share of each quota left unspent (for other clients and
+                estimate errors)
+            max_delay: Longest wait given to a single request
+        """
+        self.enabled = enabled
+        self.headroom = headroom
+        self.max_delay = max_delay
+        self._requests = _Quota()
+        self._tokens = _Quota()
+        self._in_flight: set[Reservation] = set()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> Reservation:
+        """
+        Admit one request.
+
+        Args:
+            tokens: Estimated tokens the request counts against the quota
+
+        Returns:
+            Reservation whose delay is the wait before sending (0 to send now)
+        """
+        if not self.enabled:
+            return Reservation(delay=0.0, tokens=tokens)
+
+        now = time.monotonic()
+        with self._lock:
+            delay = max(
+                self._requests.reserve(1, self.headroom, now),
+                self._tokens.reserve(tokens, self.headroom, now),
+            )
+            reservation = Reservation(delay=min(delay, self.max_delay), tokens=tokens)
+            self._in_flight.add(reservation)
+            remaining_requests = self._requests.level
+            remaining_tokens = self._tokens.level
+
+        if reservation.delay > 0:
+            logger.debug(
+                "llm_paced",
+                delay=round(reservation.delay, 2),
+                remaining_requests=remaining_requests,
+                remaining_tokens=remaining_tokens,
+            )
+        return reservation
+
+    def observe(
+        self, headers: Mapping[str, str] | None, reservation: Reservation | None = None
+    ) -> None:
+        """
+        Update the quotas from a response's headers.
+
+        Args:
+            headers: Response headers (success or error responses)
+            reservation: The request the response answers (released)
+        """
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight.discard(reservation)
+            if not headers:
+                return
+            in_flight = {
+                "requests": len(self._in_flight),
+                "tokens": sum(r.tokens for r in self._in_flight),
+            }
+            for name, quota in (("requests", self._requests), ("tokens", self._tokens)):
+                quota.observe(
+                    _number(headers.get(f"x-ratelimit-limit-{name}")),
+                    _number(headers.get(f"x-ratelimit-remaining-{name}")),
+                    parse_reset(headers.get(f"x-ratelimit-reset-{name}")),
+                    in_flight[name],
+                    now,
+                )
+
+    def release(self, reservation: Reservation) -> None:
+        """Stop counting a request that got no response (e.g. a connection error)."""
+        self.observe(None, reservation)
@@ -0,0 +1,217 @@
+"""Error classification, backoff and circuit breaking for LLM calls."""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Literal
+
+import openai
+import structlog
+
+logger = structlog.get_logger()
+
+ErrorKind = Literal["rate_limit", "timeout", "server", "bad_request"]
+
+# Kinds worth retrying; bad requests fail the same way every time
+RETRYABLE: frozenset[str] = frozenset({"rate_limit", "timeout", "server"})
+
+# Kinds that indicate the provider itself is unhealthy
+OUTAGE: frozenset[str] = frozenset({"timeout", "server"})
+
+
+class LLMCallError(Exception):
+    """Raised when an LLM request fails for good (not retryable, or retries exhausted)."""
+
+    def __init__(self, message: str, kind: ErrorKind, attempts: int = 1):
+        super().__init__(message)
+        self.kind = kind
+        self.attempts = attempts
+
+
+def classify_error(error: Exception) -> ErrorKind | None:
+    """
+    Classify an API error.
+
+    Args:
+        error: Exception raised by the OpenAI SDK
+
+    Returns:
+        Error kind, or None if the exception is not an API error
+    """
+    if isinstance(error, openai.RateLimitError):
+        return "rate_limit"
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIConnectionError):
+        return "server"
+    if isinstance(error, openai.APIStatusError):
+        if error.status_code == 408:
+            return "timeout"
+        if error.status_code == 409 or error.status_code >= 500:
+            return "server"
+        return "bad_request"
+    return None
+
+
+def retry_after(error: Exception) -> float | None:
+    """
+    Read the server's requested delay from Retry-After headers.
+
+    Returns:
+        Delay in seconds, or None if the response carries no hint
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    error: Exception | None = None,
+) -> float:
+    """
+    Delay before retry number `attempt` (1-based).
+
+    Honours Retry-After when the server sends it; otherwise uses
+    exponential backoff with full jitter so concurrent callers spread out.
+    """
+    hinted = retry_after(error) if error else None
+    if hinted is not None:
+        return min(max_delay, hinted) + random.uniform(0, base_delay)
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Pauses callers while the provider looks down.
+
+    After `threshold` consecutive outage errors the circuit opens and
+    acquire() blocks every caller for `cooldown` seconds. One probe request
+    is then let through: success closes the circuit and releases everyone,
+    failure re-opens it for another cooldown. A probe that ends without
+    either (e.g. it was cancelled) must call abandon_probe().
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._cond = threading.Condition()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently being held back."""
+        with self._cond:
+            return self._opened_at is not None
+
+    # How often async callers re-check while another caller's probe is in flight
+    PROBE_POLL_INTERVAL = 0.5
+
+    def acquire(self) -> bool:
+        """
+        Block while the circuit is open (no-op when closed or disabled).
+
+        Returns:
+            Whether the caller was let through as the probe
+        """
+        if self.threshold <= 0:
+            return False
+
+        with self._cond:
+            while (wait := self._claim()) is not None:
+                self._cond.wait(timeout=wait or None)
+            # An open circuit only lets its probe through
+            return self._opened_at is not None
+
+    async def acquire_async(self) -> bool:
+        """Async variant of acquire(); waits without blocking the event loop."""
+        if self.threshold <= 0:
+            return False
+
+        while True:
+            with self._cond:
+                wait = self._claim()
+                if wait is None:
+                    return self._opened_at is not None
+            await asyncio.sleep(wait or self.PROBE_POLL_INTERVAL)
+
+    def abandon_probe(self) -> None:
+        """Give up the probe without an outcome, so another caller can probe."""
+        with self._cond:
+            self._probing = False
+            self._cond.notify_all()
+
+    def _claim(self) -> float | None:
+        """
+        Check whether the caller may send a request (lock must be held).
+
+        Returns:
+            None to proceed (possibly as the probe), otherwise seconds until the
+            cooldown ends, or 0 while another caller's probe is in flight
+        """
+        if self._opened_at is None:
+            return None
+        remaining = self._opened_at + self.cooldown - time.monotonic()
+        if remaining > 0:
+            return remaining
+        if not self._probing:
+            self._probing = True
+            return None
+        return 0.0
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy provider."""
+        if self.threshold <= 0:
+            return
+
+        with self._cond:
+            if self._opened_at is not None:
+                logger.info("llm_circuit_closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+            self._cond.notify_all()
+
+    def record_failure(self) -> None:
+        """Record an outage error (timeout, 5xx, connection failure)."""
+        if self.threshold <= 0:
+            return
+
+        with self._cond:
+            self._failures += 1
+            if self._probing or (self._opened_at is None and self._failures >= self.threshold):
+                logger.warning(
+                    "llm_circuit_opened",
+                    consecutive_failures=self._failures,
+                    cooldown=self.cooldown,
+                )
+                self._opened_at = time.monotonic()
+                self._probing = False
+                self._cond.notify_all()
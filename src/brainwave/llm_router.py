@@ -0,0 +1,229 @@
+"""Health-based routing of LLM requests across several backends."""
+
+import random
+import threading
+import time
+from collections import deque
+
+import structlog
+from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
+
+from brainwave.config import LLMBackendConfig, LLMConfig, LLMRouterConfig
+from brainwave.llm_pacing import QuotaPacer
+from brainwave.llm_retry import CircuitBreaker
+
+logger = structlog.get_logger()
+
+# Anthropic's OpenAI SDK compatibility endpoint
+ANTHROPIC_BASE_URL = "https://api.anthropic.com/v1/"
+
+# Used when an Azure backend doesn't set api_version
+AZURE_API_VERSION = "2024-10-21"
+
+
+class BackendHealth:
+    """
+    Rolling record of a backend's recent request outcomes.
+
+    Outcomes older than the window are dropped, so a backend that was
+    skipped for failing gets a clean slate (and is tried again) once its
+    failures age out.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._lock = threading.Lock()
+        self._outcomes: deque[tuple[float, bool, float]] = deque()
+
+    def record(self, ok: bool, latency: float) -> None:
+        """Record one request outcome and its wall time."""
+        with self._lock:
+            self._outcomes.append((time.monotonic(), ok, latency))
+            self._prune()
+
+    def snapshot(self) -> tuple[int, float, float | None]:
+        """
+        Summarize the window.
+
+        Returns:
+            Tuple of (outcomes, error rate, mean latency of successful
+            requests or None if there are none)
+        """
+        with self._lock:
+            self._prune()
+            total = len(self._outcomes)
+            latencies = [latency for _, ok, latency in self._outcomes if ok]
+
+        if not total:
+            return 0, 0.0, None
+        error_rate = 1 - len(latencies) / total
+        mean_latency = sum(latencies) / len(latencies) if latencies else None
+        return total, error_rate, mean_latency
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+
+class LLMBackend:
+    """One endpoint: its SDK clients, circuit breaker, quota pacer and health window."""
+
+    def __init__(self, config: LLMBackendConfig, llm: LLMConfig):
+        self.config = config
+        self.name = config.name
+        self.model = config.model
+        self.breaker = CircuitBreaker(llm.retry.breaker_threshold, llm.retry.breaker_cooldown)
+        self.pacer = QuotaPacer(llm.pacing.enabled, llm.pacing.headroom, llm.pacing.max_delay)
+        self.health = BackendHealth(llm.router.window)
+
+        api_key = config.api_key or llm.api_key
+        self._api_key = api_key.get_secret_value() if api_key else None
+        self._timeout = llm.timeout
+
+        self._client: OpenAI | None = None
+        self._async_client: AsyncOpenAI | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> OpenAI:
+        """Lazily initialize the sync SDK client."""
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._create_client(asynchronous=False)
+            return self._client
+
+    @client.setter
+    def client(self, client: OpenAI) -> None:
+        self._client = client
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Lazily initialize the async SDK client (bound to the loop it is first used on)."""
+        if self._async_client is None:
+            self._async_client = self._create_client(asynchronous=True)
+        return self._async_client
+
+    @async_client.setter
+    def async_client(self, client: AsyncOpenAI) -> None:
+        self._async_client = client
+
+    def _create_client(self, asynchronous: bool):
+        """Build the SDK client for this backend's provider."""
+        kwargs = {
+            "api_key": self._api_key,
+            "timeout": self._timeout,
+            "max_retries": 0,  # Retries and failover are handled by the LLM client
+        }
+
+        if self.config.provider == "azure":
+            cls = AsyncAzureOpenAI if asynchronous else AzureOpenAI
+            return cls(
+                azure_endpoint=self.config.base_url,
+                api_version=self.config.api_version or AZURE_API_VERSION,
+                **kwargs,
+            )
+
+        base_url = self.config.base_url
+        if self.config.provider == "anthropic" and not base_url:
+            base_url = ANTHROPIC_BASE_URL
+
+        cls = AsyncOpenAI if asynchronous else OpenAI
+        return cls(base_url=base_url, **kwargs)
+
+
+class LLMRouter:
+    """
+    Picks a backend for each request attempt.
+
+    Backends with an open circuit, or whose recent error rate exceeds
+    router.max_error_rate, are skipped while any other backend is usable.
+    Among the rest the one with the lowest mean latency wins; a backend
+    with no recent successes counts as fastest, so new and recovered
+    backends get traffic. A small share of requests goes to a random
+    healthy backend so latencies stay current.
+
+    Without configured backends the router holds a single backend built
+    from the top-level llm settings, which is always selected.
+    """
+
+    def __init__(self, config: LLMConfig):
+        self.config = config
+        self.settings: LLMRouterConfig = config.router
+
+        backend_configs = config.backends or [
+            LLMBackendConfig(
+                name="default",
+                provider=config.provider,
+                api_key=config.api_key,
+                base_url=config.base_url,
+            )
+        ]
+        self.backends = [LLMBackend(b, config) for b in backend_configs]
+
+        # Backends created on demand for steps that pin their own base_url
+        self._pinned: dict[str, LLMBackend] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def default(self) -> LLMBackend:
+        """The first configured backend."""
+        return self.backends[0]
+
+    def pool(self, base_url: str | None) -> list[LLMBackend]:
+        """
+        Backends a request may use.
+
+        Args:
+            base_url: Endpoint a step pins its requests to, or None to route
+
+        Returns:
+            The configured backends, or the pinned endpoint alone
+        """
+        if not base_url or base_url == self.config.base_url:
+            return self.backends
+
+        with self._lock:
+            backend = self._pinned.get(base_url)
+            if backend is None:
+                backend = LLMBackend(
+                    LLMBackendConfig(
+                        name=base_url, provider=self.config.provider, base_url=base_url
+                    ),
+                    self.config,
+                )
+                self._pinned[base_url] = backend
+            return [backend]
+
+    def select(self, pool: list[LLMBackend], avoid: set[str] | None = None) -> LLMBackend:
+        """
+        Choose the backend for the next attempt.
+
+        Args:
+            pool: Candidate backends
+            avoid: Names of backends that already failed this request
+
+        Returns:
+            Selected backend
+        """
+        if len(pool) == 1:
+            return pool[0]
+
+        candidates = [b for b in pool if b.name not in (avoid or ())] or pool
+        closed = [b for b in candidates if not b.breaker.is_open] or candidates
+
+        stats = {b.name: b.health.snapshot() for b in closed}
+        healthy = [
+            b
+            for b in closed
+            if stats[b.name][0] < self.settings.min_samples
+            or stats[b.name][1] <= self.settings.max_error_rate
+        ] or closed
+
+        if len(healthy) > 1 and random.random() < self.settings.explore:
+            return random.choice(healthy)
+        return min(healthy, key=lambda b: stats[b.name][2] or 0.0)
+
+    def has_alternative(self, pool: list[LLMBackend], avoid: set[str]) -> bool:
+        """Whether a backend that hasn't failed this request is usable right now."""
+        return any(b.name not in avoid and not b.breaker.is_open for b in pool)
@@ -1,5 +1,8 @@
 """Episode data models."""
 
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -54,6 +57,15 @@ class SceneBeat(BaseModel):
     beat: str
     lands: str
 
+    def to_text(self) -> str:
+        """Render the beat in the outline's scene format."""
+        return (
+            f"{self.scene_num}. [Shot {self.shot_id}] - {', '.join(self.characters)}\n"
+            f"   - Setup: {self.setup}\n"
+            f"   - Beat: {self.beat}\n"
+            f"   - Lands: {self.lands}"
+        )
+
 
 class EpisodeOutline(BaseModel):
     """Detailed episode outline for script generation."""
@@ -66,6 +78,20 @@ class EpisodeOutline(BaseModel):
     ending: str | None = None
     raw_text: str = ""
 
+    def to_text(self) -> str:
+        """Render the outline in the text output format of the outline prompt."""
+        lines = ["=== OUTLINE ===", f"title: {self.title}", "", f"premise: {self.premise}", ""]
+        if self.theme:
+            lines += [f"theme: {self.theme}", ""]
+        lines.append("scenes:")
+        for scene in self.scenes:
+            lines += [scene.to_text(), ""]
+        if self.callbacks:
+            lines += ["callbacks:", *(f"- {callback}" for callback in self.callbacks), ""]
+        if self.ending:
+            lines.append(f"ending: {self.ending}")
+        return "\n".join(lines).strip()
+
 
 class EpisodePlot(BaseModel):
     """Structured episode plot with title and beats (legacy format)."""
@@ -100,6 +126,96 @@ class EpisodePlot(BaseModel):
         return next((b.content for b in self.beats if b.name == "resolution"), None)
 
 
+class StepUsage(BaseModel):
+    """LLM usage and timing accumulated over one step."""
+
+    model: str | None = None
+    attempts: int = 0  # Times the step ran (the generator may regenerate)
+    requests: int = 0
+    retries: int = 0  # API retries after rate-limit, timeout or server errors
+    prompt_tokens: int = 0
+    cached_tokens: int = 0  # Prompt tokens served from the provider's prompt cache
+    completion_tokens: int = 0
+    latency_seconds: float = 0.0  # Wall time spent in the step
+    output_format: str | None = None  # Response format the step requested (outline: text or json)
+    parse_failures: int = 0  # Responses that couldn't be parsed (retried while attempts remain)
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from the prompt cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def add(
+        self,
+        model: str | None,
+        prompt_tokens: int | None,
+        completion_tokens: int | None,
+        cached_tokens: int | None,
+    ) -> None:
+        """Add one request's usage."""
+        self.model = model or self.model
+        self.requests += 1
+        self.prompt_tokens += prompt_tokens or 0
+        self.completion_tokens += completion_tokens or 0
+        self.cached_tokens += cached_tokens or 0
+
+    def merge(self, other: "StepUsage") -> None:
+        """Add another record's counters to this one (for aggregate views)."""
+        self.model = self.model or other.model
+        self.output_format = self.output_format or other.output_format
+        self.attempts += other.attempts
+        self.requests += other.requests
+        self.retries += other.retries
+        self.prompt_tokens += other.prompt_tokens
+        self.cached_tokens += other.cached_tokens
+        self.completion_tokens += other.completion_tokens
+        self.latency_seconds += other.latency_seconds
+        self.parse_failures += other.parse_failures
+
+    def add_share(self, other: "StepUsage", index: int, parts: int) -> None:
+        """
+        Add one part's share of a record for a request made on behalf of several episodes.
+
+        Tokens and latency are split evenly; requests, retries, parse failures
+        and rounding remainders go to part 0, so the parts sum to the whole.
+
+        Args:
+            other: Usage of the shared request(s)
+            index: This part's position (0-based)
+            parts: Number of parts
+        """
+
+        def share(value: int) -> int:
+            return value // parts + (value % parts if index == 0 else 0)
+
+        self.model = other.model or self.model
+        self.output_format = other.output_format or self.output_format
+        self.attempts += 1
+        self.prompt_tokens += share(other.prompt_tokens)
+        self.cached_tokens += share(other.cached_tokens)
+        self.completion_tokens += share(other.completion_tokens)
+        self.latency_seconds += other.latency_seconds / parts
+        if index == 0:
+            self.requests += other.requests
+            self.retries += other.retries
+            self.parse_failures += other.parse_failures
+
+    @contextmanager
+    def timed(self) -> Iterator[None]:
+        """Count one attempt of the step and add its wall time."""
+        self.attempts += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.latency_seconds += time.perf_counter() - start
+
+
 class EpisodeMeta(BaseModel):
     """Episode metadata stored in meta.json."""
 
@@ -118,6 +234,9 @@ class EpisodeMeta(BaseModel):
     scene_count: int | None = None
     dialog_count: int | None = None
 
+    # LLM usage per step (outline, script, generate, preview)
+    usage: dict[str, StepUsage] = Field(default_factory=dict)
+
     # Pipeline tracking
     steps_completed: list[str] = Field(default_factory=list)
     current_step: str | None = None
@@ -138,6 +257,14 @@ class EpisodeMeta(BaseModel):
         if step.value not in self.steps_completed:
             self.steps_completed.append(step.value)
 
+    def step_usage(self, step: str) -> StepUsage:
+        """Get (creating if needed) the usage record for a step."""
+        return self.usage.setdefault(step, StepUsage())
+
+    def update_generation_tokens(self) -> None:
+        """Set generation_tokens to the total over all steps."""
+        self.generation_tokens = sum(u.total_tokens for u in self.usage.values()) or None
+
     def get_next_step(self) -> PipelineStep | None:
         """Get the next step to execute based on status."""
         status_to_next: dict[EpisodeStatus, PipelineStep | None] = {
@@ -44,6 +44,94 @@ class WaveLangParser:
         """
         Parse a complete WaveLang script.
 
+        Single pass: each line is dispatched on its prefix (>>, ::, ==) and
+        dialog fields are split on the first two colons instead of matched.
+        Lines the split can't settle (an empty field) fall back to the line
+        patterns, so the result equals parse_regex().
+
+        Args:
+            text: Raw WaveLang script text
+
+        Returns:
+            Parsed WaveLangScript model
+        """
+        scenes, summary, errors = self._parse_lines(text.strip().split("\n"))
+
+        self._log_errors(errors)
+        return WaveLangScript(scenes=scenes, summary=summary, raw_text=text)
+
+    def _parse_lines(self, lines: list[str]) -> tuple[list[Scene], str | None, list[ParseError]]:
+        """The parse() loop: returns (scenes, summary, errors)."""
+        scenes: list[Scene] = []
+        dialog: list[DialogLine] | None = None  # Dialog of the current scene
+        summary: str | None = None
+        errors: list[ParseError] = []
+        global_line_number = 0  # Track line number for TTS file naming
+
+        header_pattern = self.SCENE_HEADER_PATTERN
+
+        for line_num, original_line in enumerate(lines, start=1):
+            line = original_line.strip()
+            if not line:
+                continue
+
+            prefix = line[:2]
+            if prefix == "::":
+                fields = self._dialog_fields(line)
+                if fields:
+                    global_line_number += 1
+                    if dialog is None:
+                        errors.append(
+                            ParseError(
+                                line_number=line_num,
+                                message="Dialog line before scene header",
+                                raw_line=original_line,
+                            )
+                        )
+                    else:
+                        dialog.append(
+                            DialogLine(
+                                character=fields[0],
+                                inflection=fields[1],
+                                text=fields[2],
+                                line_number=global_line_number,
+                            )
+                        )
+                    continue
+
+            elif prefix == ">>":
+                header_match = header_pattern.match(line)
+                if header_match:
+                    scene = Scene(header=self._build_header(header_match), dialog=[])
+                    scenes.append(scene)
+                    dialog = scene.dialog
+                    continue
+
+            elif prefix == "==":
+                content = line[2:].strip()
+                if content:
+                    summary = content
+                    continue
+
+            # Unknown line format - skip comments and markdown fences
+            if not line.startswith("#") and not line.startswith("```"):
+                errors.append(
+                    ParseError(
+                        line_number=line_num,
+                        message="Unrecognized line format",
+                        raw_line=original_line,
+                    )
+                )
+
+        return scenes, summary, errors
+
+    def parse_regex(self, text: str) -> WaveLangScript:
+        """
+        Parse a complete WaveLang script by trying each line pattern in turn.
+
+        The reference implementation parse() must agree with; it validates
+        every model it builds. Kept for cross-checks and benchmarks.
+
         Args:
             text: Raw WaveLang script text
 
@@ -71,17 +159,7 @@ class WaveLangParser:
                 if current_scene:
                     scenes.append(current_scene)
 
-                # Parse character list
-                char_text = header_match.group(4)
-                characters = [c.strip() for c in char_text.split(",") if c.strip()]
-
-                header = SceneHeader(
-                    shot_id=int(header_match.group(1)),
-                    character_count=int(header_match.group(2)),
-                    max_characters=int(header_match.group(3)),
-                    characters=characters,
-                )
-                current_scene = Scene(header=header, dialog=[])
+                current_scene = Scene(header=self._build_header(header_match), dialog=[])
                 continue
 
             # Check for dialog
@@ -128,15 +206,7 @@ class WaveLangParser:
         if current_scene:
             scenes.append(current_scene)
 
-        # Log warnings for parse errors
-        if errors:
-            for error in errors:
-                logger.warning(
-                    "parse_warning",
-                    line=error.line_number,
-                    message=error.message,
-                    content=error.raw_line[:50] + "..." if len(error.raw_line) > 50 else error.raw_line,
-                )
+        self._log_errors(errors)
 
         return WaveLangScript(
             scenes=scenes,
@@ -144,6 +214,71 @@ class WaveLangParser:
             raw_text=text,
         )
 
+    def split_scenes(self, text: str) -> tuple[str, list[str]]:
+        """
+        Split script text into per-scene blocks without parsing dialog.
+
+        Block i corresponds to scene i of parse(text), so scenes can be
+        replaced individually and joined back together.
+
+        Args:
+            text: Raw WaveLang script text
+
+        Returns:
+            Tuple of (text before the first scene header, list of scene blocks)
+        """
+        preamble: list[str] = []
+        blocks: list[list[str]] = []
+
+        for line in text.strip().split("\n"):
+            if self.SCENE_HEADER_PATTERN.match(line.strip()):
+                blocks.append([line])
+            elif blocks:
+                blocks[-1].append(line)
+            else:
+                preamble.append(line)
+
+        return "\n".join(preamble), ["\n".join(block).strip() for block in blocks]
+
+    @staticmethod
+    def _build_header(header_match: re.Match[str]) -> SceneHeader:
+        """Build a SceneHeader from a SCENE_HEADER_PATTERN match."""
+        char_text = header_match.group(4)
+        characters = [c.strip() for c in char_text.split(",") if c.strip()]
+
+        return SceneHeader(
+            shot_id=int(header_match.group(1)),
+            character_count=int(header_match.group(2)),
+            max_characters=int(header_match.group(3)),
+            characters=characters,
+        )
+
+    @classmethod
+    def _dialog_fields(cls, line: str) -> tuple[str, ...] | None:
+        """(character, inflection, text) of a stripped "::" line, as DIALOG_PATTERN reads it."""
+        fields = line[2:].split(":", 2)
+        if len(fields) == 3:
+            character = fields[0].strip()
+            inflection = fields[1].strip()
+            text = fields[2].strip()
+            if character and inflection and text:
+                return character, inflection, text
+
+        # With an empty field the pattern may still match by splitting elsewhere
+        dialog_match = cls.DIALOG_PATTERN.match(line)
+        return tuple(g.strip() for g in dialog_match.groups()) if dialog_match else None
+
+    @staticmethod
+    def _log_errors(errors: list[ParseError]) -> None:
+        """Log warnings for parse errors."""
+        for error in errors:
+            logger.warning(
+                "parse_warning",
+                line=error.line_number,
+                message=error.message,
+                content=error.raw_line[:50] + "..." if len(error.raw_line) > 50 else error.raw_line,
+            )
+
     def extract_plot_and_script(self, response: str) -> tuple[str, str]:
         """
         Extract plot and script sections from LLM response.
@@ -193,6 +328,53 @@ class WaveLangParser:
         return plot_text, script_text
 
 
+class IncrementalWaveLangParser:
+    """
+    Line-at-a-time WaveLang parser for streamed LLM output.
+
+    Scenes are built up as lines arrive, so constraints can be checked
+    before the completion has finished. Lines that are not WaveLang
+    (plot sections, markdown fences) are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.scenes: list[Scene] = []
+        self._line_number = 0
+
+    def feed_line(self, line: str) -> Scene | None:
+        """
+        Consume one complete line of script text.
+
+        Args:
+            line: A single line (without the trailing newline)
+
+        Returns:
+            The new Scene if this line was a scene header, otherwise None
+        """
+        line = line.strip()
+
+        header_match = WaveLangParser.SCENE_HEADER_PATTERN.match(line)
+        if header_match:
+            scene = Scene(header=WaveLangParser._build_header(header_match), dialog=[])
+            self.scenes.append(scene)
+            return scene
+
+        dialog_match = WaveLangParser.DIALOG_PATTERN.match(line)
+        if dialog_match:
+            self._line_number += 1
+            if self.scenes:
+                self.scenes[-1].dialog.append(
+                    DialogLine(
+                        character=dialog_match.group(1).strip(),
+                        inflection=dialog_match.group(2).strip(),
+                        text=dialog_match.group(3).strip(),
+                        line_number=self._line_number,
+                    )
+                )
+
+        return None
+
+
 class PlotParser:
     """Parser for episode plot structure."""
 
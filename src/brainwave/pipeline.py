@@ -1,18 +1,30 @@
 """Unified episode generation pipeline."""
 
+import itertools
 import json
+import re
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Callable
 from uuid import UUID
 
 import structlog
-from jinja2 import Environment, FileSystemLoader
-from openai import OpenAI
 
 from brainwave.config import AppConfig
-from brainwave.models.characters import load_characters, load_shots
+from brainwave.dedup import (
+    DedupKind,
+    DuplicateEpisodeError,
+    DuplicateMatch,
+    NearDuplicateIndex,
+    outline_content,
+    script_content,
+)
+from brainwave.llm import create_llm_client
+from brainwave.models.characters import Character, Shot, load_characters, load_shots
 from brainwave.models.episode import (
     Episode,
     EpisodeMeta,
@@ -20,17 +32,148 @@ from brainwave.models.episode import (
     EpisodeStatus,
     PipelineStep,
     SceneBeat,
+    StepUsage,
 )
+from brainwave.models.script import WaveLangScript
 from brainwave.parser import WaveLangParser
+from brainwave.prompts import get_prompt_renderer
+from brainwave.repair import ScriptRepairer
+from brainwave.script_cache import get_script_cache
 from brainwave.storage import StorageProvider, create_storage_provider
-from brainwave.validator import ScriptValidator
+from brainwave.streaming import OutlineStreamMonitor, ScriptStreamMonitor, StreamAbortedError
+from brainwave.validator import ScriptValidator, ValidationResult
 
 logger = structlog.get_logger()
 
+# Structured output schema for outlines (generation.outline_format "json"); maps onto
+# EpisodeOutline and SceneBeat, with scene numbers assigned in order
+_NULLABLE_STRING = {"type": ["string", "null"]}
+OUTLINE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "premise": {"type": "string"},
+        "theme": _NULLABLE_STRING,
+        "scenes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "shot_id": {"type": "integer"},
+                    "characters": {"type": "array", "items": {"type": "string"}},
+                    "setup": {"type": "string"},
+                    "beat": {"type": "string"},
+                    "lands": {"type": "string"},
+                },
+                "required": ["shot_id", "characters", "setup", "beat", "lands"],
+                "additionalProperties": False,
+            },
+        },
+        "callbacks": {"type": "array", "items": {"type": "string"}},
+        "ending": _NULLABLE_STRING,
+    },
+    "required": ["title", "premise", "theme", "scenes", "callbacks", "ending"],
+    "additionalProperties": False,
+}
+
+OUTLINE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "episode_outline", "strict": True, "schema": OUTLINE_SCHEMA},
+}
+
+# Several outlines in one structured response (generation.outlines_per_request)
+OUTLINE_GROUP_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "episode_outlines",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"outlines": {"type": "array", "items": OUTLINE_SCHEMA}},
+            "required": ["outlines"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+OUTLINE_MARKER = "=== OUTLINE ==="
+
 
 class OutlineParser:
     """Parse LLM outline output into structured data."""
 
+    def split(self, content: str) -> list[str]:
+        """
+        Split a response holding several outlines into one response per outline.
+
+        A structured response is an object with an "outlines" array; a text
+        response starts each outline with an === OUTLINE === line.
+
+        Returns:
+            Outline responses in order (text chunks or JSON objects)
+        """
+        try:
+            data = json.loads(self._unfence(content))
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and isinstance(data.get("outlines"), list):
+            return [json.dumps(outline) for outline in data["outlines"]]
+
+        chunks: list[list[str]] = []
+        for line in content.strip().split("\n"):
+            if line.strip() == OUTLINE_MARKER:
+                chunks.append([])
+            elif chunks:
+                chunks[-1].append(line)
+        return [text for text in ("\n".join(chunk).strip() for chunk in chunks) if text]
+
+    def parse_json(self, content: str) -> EpisodeOutline:
+        """
+        Parse a structured (JSON) outline response into EpisodeOutline.
+
+        raw_text is set to the outline in the text format, which is what
+        outline.txt and the script prompt use.
+
+        Raises:
+            ValueError: If the content isn't an outline object
+        """
+        try:
+            data = json.loads(self._unfence(content))
+            outline = EpisodeOutline(
+                title=data["title"],
+                premise=data.get("premise") or "",
+                theme=data.get("theme"),
+                scenes=[
+                    SceneBeat(scene_num=num, **scene)
+                    for num, scene in enumerate(data.get("scenes") or [], 1)
+                ],
+                callbacks=data.get("callbacks") or [],
+                ending=data.get("ending"),
+            )
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Invalid structured outline: {e}") from e
+
+        outline.raw_text = outline.to_text()
+        return outline
+
+    def _unfence(self, content: str) -> str:
+        """Strip a markdown code fence (from backends that ignore response_format)."""
+        text = content.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+        return text
+
+    def check(self, outline: EpisodeOutline) -> str | None:
+        """Describe why a parsed outline is unusable, or None if it is usable."""
+        if not outline.scenes:
+            return "no scenes"
+        if not outline.title or outline.title == "Untitled Episode":
+            return "no title"
+        incomplete = [s.scene_num for s in outline.scenes if not (s.setup and s.beat and s.lands)]
+        if incomplete:
+            return f"scenes {', '.join(map(str, incomplete))} incomplete"
+        return None
+
     def parse(self, content: str) -> EpisodeOutline:
         """Parse outline text into EpisodeOutline."""
         lines = content.strip().split("\n")
@@ -50,7 +193,7 @@ class OutlineParser:
             line_stripped = line.strip()
 
             # Skip empty lines and markers
-            if not line_stripped or line_stripped == "=== OUTLINE ===":
+            if not line_stripped or line_stripped == OUTLINE_MARKER:
                 continue
 
             # Parse top-level fields
@@ -80,8 +223,8 @@ class OutlineParser:
                     scene_num += 1
                     current_scene = {
                         "scene_num": scene_num,
-                        "shot_id": self._extract_shot_id(line_stripped),
-                        "characters": self._extract_characters(line_stripped),
+                        "shot_id": self.extract_shot_id(line_stripped),
+                        "characters": self.extract_characters(line_stripped),
                         "setup": "",
                         "beat": "",
                         "lands": "",
@@ -112,16 +255,14 @@ class OutlineParser:
             raw_text=content,
         )
 
-    def _extract_shot_id(self, line: str) -> int:
+    def extract_shot_id(self, line: str) -> int:
         """Extract shot ID from scene line like '1. [Shot 16] - ...'"""
-        import re
-
         match = re.search(r"\[(?:Shot\s*)?(\d+)\]", line, re.IGNORECASE)
         if match:
             return int(match.group(1))
         return 1
 
-    def _extract_characters(self, line: str) -> list[str]:
+    def extract_characters(self, line: str) -> list[str]:
         """Extract character names from scene line."""
         # Look for part after ' - '
         if " - " in line:
@@ -141,12 +282,134 @@ class OutlineParser:
         )
 
 
+@dataclass
+class OutlineRetries:
+    """New outline samples left for unparseable and near-duplicate responses."""
+
+    parse: int
+    duplicate: int
+
+    def allow(self, problem: str | None, truncated: bool, duplicate: DuplicateMatch | None) -> bool:
+        """Whether to sample again after a response (using up one retry if so)."""
+        # A truncated response would be cut short again
+        if problem and not truncated and self.parse > 0:
+            self.parse -= 1
+            return True
+        if duplicate and self.duplicate > 0:
+            self.duplicate -= 1
+            return True
+        return False
+
+
+class ScriptContinuation:
+    """
+    A script completion being continued after its output budget cut it off.
+
+    Holds the I/O-free part of continuing a truncated script, shared by the
+    sync and async pipelines: next_request() cuts the script back to its
+    finished scenes and builds the prompt for the rest, and add() splices
+    the completion for it back on. Callers only run the completions.
+    """
+
+    def __init__(
+        self,
+        pipeline: "EpisodePipeline",
+        script_text: str,
+        truncated: bool,
+        outline_text: str,
+        beats: list[SceneBeat],
+        outline: EpisodeOutline | None = None,
+    ):
+        """
+        Initialize the continuation.
+
+        Args:
+            pipeline: Pipeline whose prompts and budgets apply
+            script_text: Cleaned text of the first completion
+            truncated: Whether the budget cut it off
+            outline_text: Full outline text
+            beats: Outline scenes the script should cover
+            outline: Parsed outline, used to limit prompts to its cast
+        """
+        self.pipeline = pipeline
+        self.script_text = script_text
+        self.truncated = truncated
+        self.outline_text = outline_text
+        self.beats = beats
+        self.outline = outline
+        self.attempts = pipeline.config.generation.continuation_attempts
+
+    def next_request(self) -> tuple[list[dict[str, str]], int | None] | None:
+        """
+        Prepare the next continuation, if one is needed and allowed.
+
+        Returns:
+            Tuple of (prompt, output token budget), or None once done
+        """
+        if self.attempts <= 0 or not self.truncated or not self.beats:
+            return None
+        self.attempts -= 1
+
+        self.script_text, written = self.pipeline._drop_truncated_scene(self.script_text)
+        if written >= len(self.beats):
+            self.truncated = False
+            return None
+
+        logger.info("script_continuation", written=written, remaining=len(self.beats) - written)
+        prompt = self.pipeline._build_continuation_prompt(
+            self.outline_text, self.beats, written, self.outline
+        )
+        return prompt, self.pipeline.script_budget(len(self.beats) - written)
+
+    def add(self, script_text: str, truncated: bool) -> None:
+        """Splice a continuation's cleaned text onto the script."""
+        self.script_text = "\n\n".join(part for part in (self.script_text, script_text) if part)
+        self.truncated = truncated
+
+    def finish(self) -> str:
+        """The script written so far (a warning is logged if still truncated)."""
+        if self.truncated:
+            logger.warning("script_truncated", scenes=len(self.beats))
+        return self.script_text
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one episode in a batch run."""
+
+    topic: str | None
+    episode: Episode | None = None
+    error: Exception | None = None
+    failed_step: PipelineStep | None = None
+
+
+@dataclass
+class UsageSummary:
+    """LLM usage for one step (and model and output format) aggregated over episodes."""
+
+    step: str
+    model: str | None
+    output_format: str | None = None
+    episodes: int = 0
+    usage: StepUsage = field(default_factory=StepUsage)
+
+
 class EpisodePipeline:
     """
     Unified pipeline for episode generation.
 
     Handles the full flow: Topic → Outline → Script → Build → Complete
     with checkpoints at each step for resume capability.
+
+    The outline and script steps are also exposed as stages, for callers
+    that send the LLM requests themselves (AsyncEpisodePipeline, BulkRunner):
+
+    - Outline: prepare_outline() → outline_response_format() →
+      review_outline() → reject_duplicate() if needed → apply_outline()
+    - Script: prepare_script() → build_script_prompt() / script_budget() →
+      clean_script_text() (aborted_script() for an aborted stream) →
+      continue_scenes() → check_script() →
+      check_script_duplicate() → apply_script()
     """
 
     def __init__(self, config: AppConfig):
@@ -160,32 +423,42 @@ class EpisodePipeline:
 
         # Set up components
         self.wavlang_parser = WaveLangParser()
+        self.scripts = get_script_cache()
         self.outline_parser = OutlineParser()
         self.validator = ScriptValidator(self.characters, self.shots)
 
-        # Set up Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(config.paths.templates_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
+        # Shared, memoized prompt rendering
+        self.prompts = get_prompt_renderer(config)
+
+        # Set up LLM client
+        self.llm = create_llm_client(config)
+        self.repairer = ScriptRepairer(
+            self.llm,
+            self.validator,
+            self.prompts,
+            abort_after_errors=config.generation.abort_after_errors,
         )
 
-        # Set up OpenAI client
-        api_key = config.llm.api_key.get_secret_value() if config.llm.api_key else None
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url=config.llm.base_url,
-            timeout=config.llm.timeout,
+        # Near-duplicate index over outlines and scripts (generation.dedup)
+        dedup = config.generation.dedup
+        self.dedup = (
+            NearDuplicateIndex(config.paths.cache_dir, dedup.num_perm, dedup.shingle_size)
+            if dedup.enabled
+            else None
         )
 
         # Storage provider is lazily initialized (only needed for complete step)
         self._storage: StorageProvider | None = None
+        self._storage_lock = threading.Lock()
 
     @property
     def storage(self) -> StorageProvider:
         """Lazily initialize storage provider."""
-        if self._storage is None:
-            self._storage = create_storage_provider(self.config.storage, self.config.paths.scenes_dir)
+        with self._storage_lock:
+            if self._storage is None:
+                self._storage = create_storage_provider(
+                    self.config.storage, self.config.paths.scenes_dir
+                )
         return self._storage
 
     def create(self, topic: str | None = None) -> Episode:
@@ -199,7 +472,7 @@ class EpisodePipeline:
             New episode in CREATED state
         """
         episode = Episode.new(topic=topic)
-        episode.meta.model_used = self.config.llm.model
+        episode.meta.model_used = self.config.llm.for_step(PipelineStep.SCRIPT.value).model
         episode.work_dir = self.incomplete_dir / episode.id_str
         episode.work_dir.mkdir(parents=True, exist_ok=True)
 
@@ -218,29 +491,289 @@ class EpisodePipeline:
         Returns:
             Episode with outline populated
         """
+        prompt, monitor = self.prepare_outline(episode)
+
+        usage = episode.meta.step_usage(PipelineStep.OUTLINE.value)
+        retries = self._outline_retries()
+        with usage.timed():
+            # Ask again (as a new sample) while the response can't be parsed, is
+            # aborted by the monitor or repeats an existing episode
+            for variant in itertools.count():
+                monitor.reset()
+                try:
+                    response = self.llm.complete(
+                        prompt,
+                        monitor=monitor,
+                        usage=usage,
+                        variant=variant,
+                        step=PipelineStep.OUTLINE.value,
+                        max_tokens=self.config.generation.outline_max_tokens or None,
+                        response_format=self.outline_response_format(),
+                    )
+                except StreamAbortedError as e:
+                    if not retries.allow(str(e), False, None):
+                        raise
+                    continue
+                truncated = response.finish_reason == "length"
+                outline, problem, duplicate = self.review_outline(episode, response.content, usage)
+                if not retries.allow(problem, truncated, duplicate):
+                    break
+
+        if duplicate:
+            self.reject_duplicate(episode, "outline", duplicate)
+        return self.apply_outline(episode, outline.raw_text, outline, truncated=truncated)
+
+    def run_outlines(self, episodes: list[Episode]) -> list[Episode]:
+        """
+        Generate outlines for several episodes in one completion (Step 1 for a group).
+
+        The system prompt goes out once for the whole group, so prompt tokens
+        per outline drop by about the group size. The response is split into
+        one outline per episode. If it can't be split, or an outline is
+        unusable or a near-duplicate, that episode is left as it was for
+        run_outline() to handle with its own request.
+
+        Args:
+            episodes: Episodes to outline, in topic order
+
+        Returns:
+            The episodes (outlined ones now OUTLINED)
+        """
+        prompt, max_tokens, response_format = self._start_outline_group(episodes)
+
+        usage = StepUsage()
+        with usage.timed():
+            response = self.llm.complete(
+                prompt,
+                usage=usage,
+                step=PipelineStep.OUTLINE.value,
+                max_tokens=max_tokens,
+                response_format=response_format,
+            )
+
+        return self._apply_outline_group(episodes, response.content, response.finish_reason, usage)
+
+    def _start_outline_group(
+        self, episodes: list[Episode]
+    ) -> tuple[list[dict[str, str]], int | None, dict | None]:
+        """Check the episodes can be outlined; returns the prompt, output budget and format."""
+        for episode in episodes:
+            if episode.meta.status not in (EpisodeStatus.CREATED, EpisodeStatus.PENDING):
+                raise ValueError(
+                    f"Cannot run outline step on episode with status: {episode.meta.status}"
+                )
+
+        logger.info("generating_outline_group", episodes=[e.id_str for e in episodes])
+
+        generation = self.config.generation
+        max_tokens = generation.outline_max_tokens * len(episodes) or None
+        response_format = (
+            OUTLINE_GROUP_RESPONSE_FORMAT if generation.outline_format == "json" else None
+        )
+        prompt = self._build_outline_group_prompt([e.meta.topic for e in episodes])
+        return prompt, max_tokens, response_format
+
+    def _apply_outline_group(
+        self,
+        episodes: list[Episode],
+        content: str,
+        finish_reason: str | None,
+        usage: StepUsage,
+    ) -> list[Episode]:
+        """Split a group response and store each usable outline (see run_outlines)."""
+        truncated = finish_reason == "length"
+        chunks = self.outline_parser.split(content)
+
+        # A response cut short may hold fewer outlines; any other count can't be matched up
+        if len(chunks) > len(episodes) or (len(chunks) < len(episodes) and not truncated):
+            usage.parse_failures += 1
+            logger.warning(
+                "outline_group_split_failed", expected=len(episodes), outlines=len(chunks)
+            )
+            chunks = []
+
+        for index, episode in enumerate(episodes):
+            episode_usage = episode.meta.step_usage(PipelineStep.OUTLINE.value)
+            episode_usage.add_share(usage, index, len(episodes))
+            if index >= len(chunks):
+                continue
+
+            outline, problem, duplicate = self.review_outline(
+                episode, chunks[index], episode_usage
+            )
+            if problem or duplicate:
+                continue
+            last = index == len(chunks) - 1
+            self.apply_outline(episode, outline.raw_text, outline, truncated=truncated and last)
+
+        outlined = sum(1 for e in episodes if e.meta.status == EpisodeStatus.OUTLINED)
+        logger.info("outline_group_generated", episodes=len(episodes), outlined=outlined)
+        return episodes
+
+    def _outline_retries(self) -> OutlineRetries:
+        """Retry budget for one run of the outline step."""
+        generation = self.config.generation
+        regenerate = generation.dedup.enabled and generation.dedup.action == "regenerate"
+        return OutlineRetries(
+            parse=generation.outline_parse_retries,
+            duplicate=generation.dedup.regenerate_attempts if regenerate else 0,
+        )
+
+    def review_outline(
+        self, episode: Episode, content: str, usage: StepUsage | None = None
+    ) -> tuple[EpisodeOutline, str | None, DuplicateMatch | None]:
+        """
+        Parse an outline response and check it against the near-duplicate index.
+
+        Args:
+            episode: Episode being outlined (excluded from the duplicate search)
+            content: Response content
+            usage: Optional step usage record to count a parse failure in
+
+        Returns:
+            Tuple of (outline, why it is unusable or None, near-duplicate or None)
+        """
+        outline, problem = self._parse_outline(content, usage)
+        duplicate = None
+        if problem is None:
+            duplicate = self._find_duplicate(episode, "outline", outline_content(outline))
+        return outline, problem, duplicate
+
+    def _find_duplicate(
+        self, episode: Episode, kind: DedupKind, text: str
+    ) -> DuplicateMatch | None:
+        """Look up the closest other episode above generation.dedup.threshold."""
+        if self.dedup is None:
+            return None
+
+        match = self.dedup.query(
+            kind, text, self.config.generation.dedup.threshold, exclude=episode.id_str
+        )
+        if match:
+            logger.warning(
+                "near_duplicate_found",
+                episode_id=episode.id_str,
+                kind=kind,
+                duplicate_of=match.episode_id,
+                similarity=round(match.similarity, 2),
+            )
+        return match
+
+    def reject_duplicate(self, episode: Episode, kind: DedupKind, match: DuplicateMatch) -> None:
+        """
+        Fail the step for a near-duplicate (the episode keeps its status).
+
+        Args:
+            episode: Episode whose outline or script was rejected
+            kind: What was compared ("outline" or "script")
+            match: The episode it nearly repeats
+
+        Raises:
+            DuplicateEpisodeError: Always
+        """
+        raise DuplicateEpisodeError(
+            f"{kind.capitalize()} of episode {episode.id_str} is a near-duplicate of episode "
+            f"{match.episode_id} ({match.similarity:.0%} similar)",
+            kind,
+            match,
+        )
+
+    def outline_response_format(self) -> dict | None:
+        """Structured output format for outline requests (None in text mode)."""
+        if self.config.generation.outline_format == "json":
+            return OUTLINE_RESPONSE_FORMAT
+        return None
+
+    def _parse_outline(
+        self, content: str, usage: StepUsage | None = None
+    ) -> tuple[EpisodeOutline, str | None]:
+        """
+        Parse an outline response in the configured format.
+
+        A JSON response that doesn't parse falls back to the text parser
+        (backends may ignore response_format). An unusable outline counts as
+        a parse failure in the step's usage.
+
+        Args:
+            content: Response content
+            usage: Optional step usage record to count the failure in
+
+        Returns:
+            Tuple of (outline, why it is unusable or None)
+        """
+        output_format = self.config.generation.outline_format
+        outline = None
+        if output_format == "json":
+            try:
+                outline = self.outline_parser.parse_json(content)
+            except ValueError as e:
+                logger.info("outline_json_fallback", error=str(e))
+        if outline is None:
+            outline = self.outline_parser.parse(content)
+
+        problem = self.outline_parser.check(outline)
+        if usage:
+            usage.output_format = output_format
+            usage.parse_failures += 1 if problem else 0
+        if problem:
+            logger.warning("outline_parse_failed", format=output_format, problem=problem)
+        return outline, problem
+
+    def prepare_outline(
+        self, episode: Episode
+    ) -> tuple[list[dict[str, str]], OutlineStreamMonitor]:
+        """
+        Start the outline step.
+
+        Args:
+            episode: Episode to outline
+
+        Returns:
+            Tuple of (outline prompt, monitor for a streamed response)
+
+        Raises:
+            ValueError: If the episode isn't ready for the outline step
+        """
         if episode.meta.status not in (EpisodeStatus.CREATED, EpisodeStatus.PENDING):
             raise ValueError(f"Cannot run outline step on episode with status: {episode.meta.status}")
 
         logger.info("generating_outline", episode_id=episode.id_str, topic=episode.meta.topic)
 
-        # Build outline prompt
-        prompt = self._build_outline_prompt(episode.meta.topic)
-
-        response = self.client.chat.completions.create(
-            model=self.config.llm.model,
-            messages=prompt,
-            temperature=self.config.llm.temperature,
+        monitor = OutlineStreamMonitor(
+            self.validator,
+            self.config.generation.abort_after_errors,
+            self.outline_parser,
         )
+        return self._build_outline_prompt(episode.meta.topic), monitor
+
+    def apply_outline(
+        self, episode: Episode, content: str, outline: EpisodeOutline, truncated: bool = False
+    ) -> Episode:
+        """
+        Store a generated outline and checkpoint the episode.
 
-        content = response.choices[0].message.content
-        if not content:
-            raise ValueError("Empty response from LLM")
+        Args:
+            episode: Episode being outlined
+            content: Outline text to save as outline.txt
+            outline: Parsed outline
+            truncated: Whether the output budget cut the response off
 
-        if response.usage:
-            episode.meta.generation_tokens = response.usage.total_tokens
+        Returns:
+            The episode, now OUTLINED
+        """
+        if truncated:
+            # The parser keeps the scenes that were finished
+            logger.warning(
+                "outline_truncated",
+                episode_id=episode.id_str,
+                scenes=len(outline.scenes),
+                max_tokens=self.config.generation.outline_max_tokens,
+            )
+
+        if self.dedup is not None:
+            self.dedup.add("outline", episode.id_str, outline_content(outline))
 
-        # Parse outline
-        outline = self.outline_parser.parse(content)
+        episode.meta.update_generation_tokens()
         episode.outline = outline
         episode.meta.title = outline.title
         episode.meta.status = EpisodeStatus.OUTLINED
@@ -273,44 +806,160 @@ class EpisodePipeline:
         Returns:
             Episode with script populated
         """
+        outline_text = self.prepare_script(episode)
+
+        usage = episode.meta.step_usage(PipelineStep.SCRIPT.value)
+        with usage.timed():
+            if self._writes_by_scenes(episode):
+                script_text = self._generate_script_by_scenes(
+                    outline_text, episode.outline.scenes, usage, episode.outline
+                )
+            else:
+                prompt = self.build_script_prompt(outline_text, outline=episode.outline)
+                beats = episode.outline.scenes if episode.outline else []
+                script_text = self._write_scenes(
+                    prompt, outline_text, beats, usage, episode.outline
+                )
+
+            script_text, script, validation_result = self.check_script(script_text, usage)
+
+        self.check_script_duplicate(episode, script)
+        return self.apply_script(episode, script_text, script, validation_result)
+
+    def check_script_duplicate(self, episode: Episode, script: WaveLangScript) -> None:
+        """
+        Reject a script that nearly repeats another episode's, before audio is built.
+
+        Raises:
+            DuplicateEpisodeError: If a near-duplicate is found
+        """
+        duplicate = self._find_duplicate(episode, "script", script_content(script))
+        if duplicate:
+            self.reject_duplicate(episode, "script", duplicate)
+
+    def prepare_script(self, episode: Episode) -> str:
+        """
+        Start the script step.
+
+        Args:
+            episode: Episode with an outline (or legacy plot)
+
+        Returns:
+            Outline text to adapt
+
+        Raises:
+            ValueError: If the episode isn't ready for the script step
+        """
         if episode.meta.status not in (
             EpisodeStatus.OUTLINED,
             EpisodeStatus.PLOT_GENERATED,  # Legacy
         ):
-            raise ValueError(f"Cannot run script step on episode with status: {episode.meta.status}")
+            raise ValueError(
+                f"Cannot run script step on episode with status: {episode.meta.status}"
+            )
 
         if not episode.outline and not episode.plot:
             raise ValueError("Episode must have outline or plot to generate script")
 
         logger.info("generating_script", episode_id=episode.id_str, title=episode.title)
 
-        # Build script prompt
         outline_text = episode.outline.raw_text if episode.outline else ""
         if not outline_text and episode.plot:
             # Legacy: convert plot to outline-like text
             outline_text = self._plot_to_outline_text(episode.plot)
+        return outline_text
 
-        prompt = self._build_script_prompt(outline_text)
+    def check_script(
+        self, script_text: str, usage: StepUsage | None = None
+    ) -> tuple[str, WaveLangScript, ValidationResult]:
+        """
+        Parse and validate a script, regenerating only its failing scenes.
 
-        response = self.client.chat.completions.create(
-            model=self.config.llm.model,
-            messages=prompt,
-            temperature=self.config.llm.temperature,
+        Args:
+            script_text: Cleaned WaveLang script text
+            usage: Optional step usage record for the repair requests
+
+        Returns:
+            Tuple of (script text, parsed script, validation result), after repair
+        """
+        script, validation_result = self.validate_script(script_text)
+
+        repair_options = self.repair_options(validation_result, usage)
+        if repair_options:
+            script_text, validation_result = self.repairer.repair(
+                script_text, validation_result, **repair_options
+            )
+            script = self.scripts.parse(script_text)
+
+        return script_text, script, validation_result
+
+    def validate_script(self, script_text: str) -> tuple[WaveLangScript, ValidationResult]:
+        """
+        Parse (through the script cache) and validate a script.
+
+        Args:
+            script_text: WaveLang script text
+
+        Returns:
+            Tuple of (parsed script, validation result)
+        """
+        script = self.scripts.parse(script_text)
+        return script, self.validator.validate(script)
+
+    def repair_options(
+        self, validation_result: ValidationResult, usage: StepUsage | None = None
+    ) -> dict | None:
+        """
+        Arguments for ScriptRepairer.repair()/repair_async() after a validation.
+
+        Args:
+            validation_result: Validation of the script
+            usage: Optional step usage record for the repair requests
+
+        Returns:
+            Keyword arguments, or None if the script isn't to be repaired
+        """
+        repair_attempts = self.config.generation.repair_attempts
+        if validation_result.is_valid or repair_attempts <= 0:
+            return None
+        return {"max_rounds": repair_attempts, "usage": usage, "step": PipelineStep.SCRIPT.value}
+
+    def script_monitor(self) -> ScriptStreamMonitor:
+        """Stream monitor for a script completion."""
+        return ScriptStreamMonitor(self.validator, self.config.generation.abort_after_errors)
+
+    def _writes_by_scenes(self, episode: Episode) -> bool:
+        """Whether the script is written as concurrent scene-group completions."""
+        group_size = self.config.generation.scene_group_size
+        return (
+            group_size > 0
+            and episode.outline is not None
+            and len(episode.outline.scenes) > group_size
         )
 
-        content = response.choices[0].message.content
-        if not content:
-            raise ValueError("Empty response from LLM")
+    def apply_script(
+        self,
+        episode: Episode,
+        script_text: str,
+        script: WaveLangScript,
+        validation_result: ValidationResult,
+    ) -> Episode:
+        """
+        Store a generated script and checkpoint the episode.
 
-        # Clean up any markdown code blocks
-        script_text = content.strip()
-        if script_text.startswith("```"):
-            lines = script_text.split("\n")
-            script_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+        Args:
+            episode: Episode being scripted
+            script_text: Final script text to save as episode-script.txt
+            script: Parsed script
+            validation_result: Its validation (errors are logged, not raised)
 
-        # Parse and validate script
-        script = self.wavlang_parser.parse(script_text)
+        Returns:
+            The episode, now SCRIPTED
+        """
+        if self.dedup is not None:
+            self.dedup.add("script", episode.id_str, script_content(script))
 
+        episode.meta.update_generation_tokens()
         episode.script_raw = script_text
         episode.meta.scene_count = script.scene_count
         episode.meta.dialog_count = script.dialog_count
@@ -318,8 +967,6 @@ class EpisodePipeline:
         episode.meta.mark_step_completed(PipelineStep.SCRIPT)
         episode.meta.current_step = PipelineStep.BUILD.value
 
-        # Validate
-        validation_result = self.validator.validate(script)
         if not validation_result.is_valid:
             logger.warning(
                 "script_validation_warnings",
@@ -333,6 +980,7 @@ class EpisodePipeline:
             script_path = episode.work_dir / "episode-script.txt"
             with open(script_path, "w", encoding="utf-8") as f:
                 f.write(script_text)
+            self.scripts.save(script, episode.work_dir)
 
         logger.info(
             "script_generated",
@@ -343,6 +991,227 @@ class EpisodePipeline:
 
         return episode
 
+    def _write_scenes(
+        self,
+        prompt: list[dict[str, str]],
+        outline_text: str,
+        beats: list[SceneBeat],
+        usage: StepUsage | None = None,
+        outline: EpisodeOutline | None = None,
+    ) -> str:
+        """
+        Complete a script prompt within the output budget for its scenes.
+
+        When the budget cuts the completion off, its finished scenes are
+        kept and the rest are requested in a continuation (up to
+        generation.continuation_attempts times) instead of starting over.
+
+        Args:
+            prompt: Script prompt for the beats
+            outline_text: Full outline text
+            beats: Outline scenes the prompt asks for (empty without an outline)
+            usage: Optional step usage record
+            outline: Parsed outline, used to limit continuation prompts to its cast
+
+        Returns:
+            Cleaned WaveLang script text
+        """
+        script_text, truncated = self._complete_script(
+            prompt, usage, self.script_budget(len(beats))
+        )
+        return self.continue_scenes(script_text, truncated, outline_text, beats, usage, outline)
+
+    def continue_scenes(
+        self,
+        script_text: str,
+        truncated: bool,
+        outline_text: str,
+        beats: list[SceneBeat],
+        usage: StepUsage | None = None,
+        outline: EpisodeOutline | None = None,
+    ) -> str:
+        """
+        Request the scenes a truncated completion didn't finish (see _write_scenes).
+
+        Args:
+            script_text: Cleaned text of the completion
+            truncated: Whether the output budget cut it off
+            outline_text: Full outline text
+            beats: Outline scenes the completion was asked for
+            usage: Optional step usage record for the continuation requests
+            outline: Parsed outline, used to limit prompts to its cast
+
+        Returns:
+            Script text with the missing scenes appended
+        """
+        continuation = ScriptContinuation(
+            self, script_text, truncated, outline_text, beats, outline
+        )
+        while request := continuation.next_request():
+            prompt, max_tokens = request
+            continuation.add(*self._complete_script(prompt, usage, max_tokens))
+        return continuation.finish()
+
+    def _complete_script(
+        self,
+        prompt: list[dict[str, str]],
+        usage: StepUsage | None = None,
+        max_tokens: int | None = None,
+    ) -> tuple[str, bool]:
+        """Run a script completion; returns the cleaned text and whether it was truncated."""
+        try:
+            response = self.llm.complete(
+                prompt,
+                monitor=self.script_monitor(),
+                usage=usage,
+                step=PipelineStep.SCRIPT.value,
+                max_tokens=max_tokens,
+            )
+        except StreamAbortedError as e:
+            return self.aborted_script(e)
+        return self.clean_script_text(response.content), response.finish_reason == "length"
+
+    def aborted_script(self, error: StreamAbortedError) -> tuple[str, bool]:
+        """
+        Keep what a script completion wrote before its monitor aborted it.
+
+        The text is handled like a budget-truncated completion: its unfinished
+        scene is dropped and the rest are requested in a continuation, and
+        scenes that failed validation are repaired once the script is checked.
+
+        Args:
+            error: The monitor's abort, carrying the text streamed so far
+
+        Returns:
+            Tuple of (cleaned script text, True)
+        """
+        logger.warning(
+            "script_stream_salvaged",
+            errors=[e.message for e in error.errors],
+            received_chars=len(error.partial),
+        )
+        return self.clean_script_text(error.partial), True
+
+    def script_budget(self, scenes: int) -> int | None:
+        """
+        Output token budget for writing outline scenes.
+
+        Args:
+            scenes: Number of outline scenes requested
+
+        Returns:
+            max_tokens for the request (None = no per-call budget)
+        """
+        generation = self.config.generation
+        if not scenes or not generation.lines_per_scene:
+            return None
+        per_scene = generation.lines_per_scene * generation.tokens_per_line
+        return scenes * per_scene + generation.budget_overhead
+
+    def _drop_truncated_scene(self, script_text: str) -> tuple[str, int]:
+        """
+        Cut a truncated script back to its finished scenes.
+
+        Returns:
+            Tuple of (script text, number of finished scenes); a script cut
+            off in its summary line keeps every scene and loses the summary
+        """
+        lines = script_text.split("\n")
+        headers = [i for i, line in enumerate(lines) if line.lstrip().startswith(">>")]
+        if not headers:
+            return "", 0
+
+        last = headers[-1]
+        summary = next(
+            (i for i in range(last, len(lines)) if lines[i].strip().startswith("==")), None
+        )
+        if summary is not None:
+            return "\n".join(lines[:summary]).strip(), len(headers)
+        return "\n".join(lines[:last]).strip(), len(headers) - 1
+
+    def clean_script_text(self, content: str) -> str:
+        """
+        Strip whitespace and any markdown code fence from a script completion.
+
+        Args:
+            content: Response content
+
+        Returns:
+            WaveLang script text
+        """
+        script_text = content.strip()
+        if script_text.startswith("```"):
+            lines = script_text.split("\n")
+            script_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+
+        return script_text
+
+    def _generate_script_by_scenes(
+        self,
+        outline_text: str,
+        beats: list[SceneBeat],
+        usage: StepUsage | None = None,
+        outline: EpisodeOutline | None = None,
+    ) -> str:
+        """
+        Write the script as concurrent completions over groups of outline scenes.
+
+        Each request carries the full outline plus the neighbouring beats for
+        continuity. Group scripts are stitched back together in outline order,
+        and the last group also writes the summary line; dialog line numbers
+        stay continuous because they are assigned when the combined script is
+        parsed.
+
+        Args:
+            outline_text: Full outline text
+            beats: Outline scene beats
+            usage: Optional step usage record for the group requests
+            outline: Parsed outline, used to limit the prompt to its cast
+
+        Returns:
+            Combined WaveLang script text
+        """
+        groups = self._scene_groups(beats)
+
+        def write_group(index: int) -> str:
+            prompt = self._build_scene_group_prompt(outline_text, groups, index, outline)
+            script_text = self._write_scenes(prompt, outline_text, groups[index], usage, outline)
+            return self._finish_scene_group(groups[index], script_text, index == len(groups) - 1)
+
+        workers = max(1, min(len(groups), self.config.generation.scene_workers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            group_scripts = list(executor.map(write_group, range(len(groups))))
+
+        return "\n\n".join(group_scripts)
+
+    def _scene_groups(self, beats: list[SceneBeat]) -> list[list[SceneBeat]]:
+        """Split outline beats into scene groups of the configured size."""
+        group_size = self.config.generation.scene_group_size
+        groups = [beats[i : i + group_size] for i in range(0, len(beats), group_size)]
+        logger.info("generating_script_by_scenes", scenes=len(beats), groups=len(groups))
+        return groups
+
+    def _finish_scene_group(self, group: list[SceneBeat], script_text: str, last: bool) -> str:
+        """Check a scene-group script's scene count, dropping summary lines unless last."""
+        # Only the last group's summary line ends up at the end of the combined script
+        group_script = script_text
+        if not last:
+            lines = [line for line in script_text.split("\n") if not line.strip().startswith("==")]
+            group_script = "\n".join(lines).strip()
+
+        # Only the headers are needed, so the fragment isn't parsed; it also stays
+        # out of the script cache, which it would only crowd (the combined script
+        # is what gets parsed and reused)
+        written = len(self.wavlang_parser.split_scenes(group_script)[1])
+        if written != len(group):
+            logger.warning(
+                "scene_group_count_mismatch",
+                scenes=f"{group[0].scene_num}-{group[-1].scene_num}",
+                expected=len(group),
+                written=written,
+            )
+        return group_script
+
     def run_build(
         self,
         episode: Episode,
@@ -358,6 +1227,19 @@ class EpisodePipeline:
         Returns:
             Episode with audio built
         """
+        self._start_build(episode)
+
+        if build_callback:
+            episode = build_callback(episode)
+        else:
+            # If no callback provided, just mark as built (mock mode)
+            logger.warning("no_build_callback", episode_id=episode.id_str)
+            episode.meta.build_mocked = True
+
+        return self._apply_build(episode)
+
+    def _start_build(self, episode: Episode) -> None:
+        """Check the episode's audio can be built."""
         if episode.meta.status not in (
             EpisodeStatus.SCRIPTED,
             EpisodeStatus.SCRIPT_GENERATED,  # Legacy
@@ -369,13 +1251,8 @@ class EpisodePipeline:
 
         logger.info("building_audio", episode_id=episode.id_str)
 
-        if build_callback:
-            episode = build_callback(episode)
-        else:
-            # If no callback provided, just mark as built (mock mode)
-            logger.warning("no_build_callback", episode_id=episode.id_str)
-            episode.meta.build_mocked = True
-
+    def _apply_build(self, episode: Episode) -> Episode:
+        """Mark audio as built and checkpoint the episode."""
         episode.meta.status = EpisodeStatus.BUILT
         episode.meta.mark_step_completed(PipelineStep.BUILD)
         episode.meta.current_step = PipelineStep.COMPLETE.value
@@ -395,6 +1272,15 @@ class EpisodePipeline:
         Returns:
             Completed episode
         """
+        work_dir = self._start_complete(episode)
+
+        # Upload to cloud storage
+        remote_path = self.storage.upload_episode(work_dir, episode.id_str)
+
+        return self._apply_complete(episode, remote_path)
+
+    def _start_complete(self, episode: Episode) -> Path:
+        """Check the episode can be completed; returns its work directory."""
         if episode.meta.status != EpisodeStatus.BUILT:
             raise ValueError(f"Cannot complete episode with status: {episode.meta.status}")
 
@@ -402,10 +1288,10 @@ class EpisodePipeline:
             raise ValueError("Episode has no work directory")
 
         logger.info("completing_episode", episode_id=episode.id_str)
+        return episode.work_dir
 
-        # Upload to cloud storage
-        remote_path = self.storage.upload_episode(episode.work_dir, episode.id_str)
-
+    def _apply_complete(self, episode: Episode, remote_path: str) -> Episode:
+        """Mark the episode completed and remove its incomplete directory."""
         # Update status
         episode.meta.status = EpisodeStatus.COMPLETED
         episode.meta.completed_at = datetime.now()
@@ -448,23 +1334,7 @@ class EpisodePipeline:
             Episode (may be incomplete if paused)
         """
         episode = self.create(topic)
-
-        steps = [
-            (PipelineStep.OUTLINE, self.run_outline),
-            (PipelineStep.SCRIPT, self.run_script),
-            (PipelineStep.BUILD, lambda ep: self.run_build(ep, build_callback)),
-            (PipelineStep.COMPLETE, self.run_complete),
-        ]
-
-        for step, runner in steps:
-            episode = runner(episode)
-
-            if confirm_callback and step != PipelineStep.COMPLETE:
-                if not confirm_callback(episode, step):
-                    logger.info("pipeline_paused", episode_id=episode.id_str, step=step.value)
-                    return episode
-
-        return episode
+        return self._run_steps(episode, PipelineStep.OUTLINE, confirm_callback, build_callback)
 
     def resume(
         self,
@@ -495,7 +1365,126 @@ class EpisodePipeline:
 
         logger.info("resuming_episode", episode_id=episode_id, next_step=next_step.value)
 
-        # Build remaining steps
+        return self._run_steps(episode, next_step, confirm_callback, build_callback)
+
+    def run_batch(
+        self,
+        topics: list[str | None],
+        parallel: int = 1,
+        build_callback: Callable[[Episode], Episode] | None = None,
+        step_callback: Callable[[int, Episode, PipelineStep], None] | None = None,
+    ) -> list[BatchResult]:
+        """
+        Run the full pipeline for several episodes, optionally concurrently.
+
+        Each episode runs Outline → Script → Build → Complete in its own worker;
+        a failure only stops that episode, which stays resumable in the
+        incomplete directory. With generation.outlines_per_request above 1,
+        outlines are first written in groups (see run_outlines()).
+
+        Args:
+            topics: One entry per episode (None for a random topic)
+            parallel: Number of episodes to run at once
+            build_callback: Function to build TTS audio
+            step_callback: Called with (index, episode, step) after each completed step
+
+        Returns:
+            One BatchResult per topic, in input order
+        """
+
+        def run_one(index: int, topic: str | None, episode: Episode | None) -> BatchResult:
+            result = BatchResult(topic=topic, episode=episode)
+            try:
+                if result.episode is None:
+                    result.episode = self.create(topic)
+
+                def confirm(episode: Episode, step: PipelineStep) -> bool:
+                    if step_callback:
+                        step_callback(index, episode, step)
+                    return True
+
+                result.episode = self._run_steps(
+                    result.episode,
+                    result.episode.meta.get_next_step() or PipelineStep.OUTLINE,
+                    confirm,
+                    build_callback,
+                )
+                if step_callback:
+                    step_callback(index, result.episode, PipelineStep.COMPLETE)
+
+            except Exception as e:
+                result.error = e
+                if result.episode:
+                    result.failed_step = result.episode.meta.get_next_step()
+                logger.error(
+                    "batch_episode_failed",
+                    index=index,
+                    episode_id=result.episode.id_str if result.episode else None,
+                    step=result.failed_step.value if result.failed_step else None,
+                    error=str(e),
+                )
+
+            return result
+
+        logger.info("batch_started", episodes=len(topics), parallel=parallel)
+
+        with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+            episodes = self._outline_groups(executor, topics, step_callback)
+            futures = [
+                executor.submit(run_one, i, topic, episodes[i]) for i, topic in enumerate(topics)
+            ]
+            results = [future.result() for future in futures]
+
+        logger.info(
+            "batch_finished",
+            episodes=len(results),
+            failed=sum(1 for r in results if r.error),
+        )
+        return results
+
+    def _outline_groups(
+        self,
+        executor: ThreadPoolExecutor,
+        topics: list[str | None],
+        step_callback: Callable[[int, Episode, PipelineStep], None] | None = None,
+    ) -> list[Episode | None]:
+        """
+        Create a batch's episodes and outline them in groups of generation.outlines_per_request.
+
+        A group whose request fails is logged and left to the per-episode
+        workers, as are outlines that couldn't be split out.
+
+        Returns:
+            One episode per topic (None for all of them when grouping is off)
+        """
+        size = self.config.generation.outlines_per_request
+        if size <= 1 or len(topics) <= 1:
+            return [None] * len(topics)
+
+        episodes = [self.create(topic) for topic in topics]
+        groups = [list(range(i, min(i + size, len(topics)))) for i in range(0, len(topics), size)]
+
+        def outline_group(indexes: list[int]) -> None:
+            try:
+                self.run_outlines([episodes[i] for i in indexes])
+            except Exception as e:
+                logger.warning("outline_group_failed", episodes=len(indexes), error=str(e))
+                return
+            for i in indexes:
+                if step_callback and episodes[i].meta.status == EpisodeStatus.OUTLINED:
+                    step_callback(i, episodes[i], PipelineStep.OUTLINE)
+
+        list(executor.map(outline_group, groups))
+        return episodes
+
+    def _run_steps(
+        self,
+        episode: Episode,
+        start_step: PipelineStep,
+        confirm_callback: Callable[[Episode, PipelineStep], bool] | None,
+        build_callback: Callable[[Episode], Episode] | None,
+    ) -> Episode:
+        """Run pipeline steps from start_step onwards, pausing if confirmation is declined."""
         all_steps = [
             (PipelineStep.OUTLINE, self.run_outline),
             (PipelineStep.SCRIPT, self.run_script),
@@ -504,7 +1493,7 @@ class EpisodePipeline:
         ]
 
         # Find where to start
-        start_idx = next((i for i, (s, _) in enumerate(all_steps) if s == next_step), 0)
+        start_idx = next((i for i, (s, _) in enumerate(all_steps) if s == start_step), 0)
 
         for step, runner in all_steps[start_idx:]:
             episode = runner(episode)
@@ -604,6 +1593,110 @@ class EpisodePipeline:
             episodes.append((episode_id, title))
         return episodes
 
+    def collect_usage(self, include_completed: bool = False) -> list[UsageSummary]:
+        """
+        Aggregate per-step LLM usage from episode metadata.
+
+        Args:
+            include_completed: Also read completed episodes from storage
+                (one metadata request per episode for remote storage)
+
+        Returns:
+            One UsageSummary per (step, model, output format), in pipeline order
+        """
+        metas: list[dict] = []
+        for path in self.incomplete_dir.iterdir():
+            meta_path = path / "meta.json"
+            if path.is_dir() and meta_path.exists():
+                try:
+                    with open(meta_path, encoding="utf-8") as f:
+                        metas.append(json.load(f))
+                except Exception:
+                    pass
+
+        if include_completed:
+            for episode_id in self.storage.list_episodes():
+                meta = self.storage.get_episode_meta(episode_id)
+                if meta:
+                    metas.append(meta)
+
+        summaries: dict[tuple[str, str | None, str | None], UsageSummary] = {}
+        for meta in metas:
+            for step, data in (meta.get("usage") or {}).items():
+                usage = StepUsage.model_validate(data)
+                key = (step, usage.model, usage.output_format)
+                summary = summaries.setdefault(
+                    key,
+                    UsageSummary(step=step, model=usage.model, output_format=usage.output_format),
+                )
+                summary.episodes += 1
+                summary.usage.merge(usage)
+
+        order = [s.value for s in PipelineStep] + ["generate", "preview"]
+        return sorted(
+            summaries.values(),
+            key=lambda s: (
+                order.index(s.step) if s.step in order else len(order),
+                s.model or "",
+                s.output_format or "",
+            ),
+        )
+
+    def index_episodes(self, include_completed: bool = False) -> int:
+        """
+        Add episodes that aren't in the near-duplicate index yet.
+
+        Episodes are indexed as they are generated; this backfills ones
+        made before the index existed (or with other signature settings).
+
+        Args:
+            include_completed: Also read completed episodes from storage
+                (up to two file requests per episode for remote storage)
+
+        Returns:
+            Number of outlines and scripts added
+        """
+        if self.dedup is None:
+            raise ValueError("Near-duplicate detection is off (generation.dedup.enabled)")
+
+        texts: dict[str, tuple[str | None, str | None]] = {}
+        for path in self.incomplete_dir.iterdir():
+            outline_path = path / "outline.txt"
+            script_path = path / "episode-script.txt"
+            if path.is_dir() and (path / "meta.json").exists():
+                texts[path.name] = (
+                    outline_path.read_text(encoding="utf-8") if outline_path.exists() else None,
+                    script_path.read_text(encoding="utf-8") if script_path.exists() else None,
+                )
+
+        if include_completed:
+            for episode_id in self.storage.list_episodes():
+                if episode_id not in texts:
+                    texts[episode_id] = (
+                        self._stored_text(episode_id, "outline", "outline.txt"),
+                        self._stored_text(episode_id, "script", "episode-script.txt"),
+                    )
+
+        added = 0
+        for episode_id, (outline_text, script_text) in texts.items():
+            if outline_text and ("outline", episode_id) not in self.dedup:
+                outline = self.outline_parser.parse(outline_text)
+                self.dedup.add("outline", episode_id, outline_content(outline))
+                added += 1
+            if script_text and ("script", episode_id) not in self.dedup:
+                script = self.scripts.parse(script_text)
+                self.dedup.add("script", episode_id, script_content(script))
+                added += 1
+
+        logger.info("dedup_index_updated", added=added, indexed=len(self.dedup))
+        return added
+
+    def _stored_text(self, episode_id: str, kind: DedupKind, filename: str) -> str | None:
+        """Read a completed episode's file for the index, unless it is indexed already."""
+        if (kind, episode_id) in self.dedup:
+            return None
+        return self.storage.get_episode_file(episode_id, filename)
+
     def _save_episode(self, episode: Episode) -> None:
         """Save episode state to disk."""
         if not episode.work_dir:
@@ -614,35 +1707,165 @@ class EpisodePipeline:
         with open(meta_path, "w", encoding="utf-8") as f:
             json.dump(episode.meta.model_dump_json_compatible(), f, indent=2)
 
+    # Prompts keep the system message free of per-episode content so every
+    # request for a step shares a byte-identical prefix that providers can
+    # serve from their prompt cache; topics and outlines go in the user message.
+
     def _build_outline_prompt(self, topic: str | None) -> list[dict[str, str]]:
         """Build the outline generation prompt."""
-        template = self.jinja_env.get_template("outline.md.j2")
+        if topic:
+            user_content = f"Create an episode outline for: {topic}"
+        else:
+            user_content = "Create an episode outline for any premise you find interesting."
+
+        return self._outline_messages(user_content)
 
-        system_content = template.render(
-            characters=self.characters.characters,
-            shots=self.shots.shots,
-            topic=topic,
+    def _build_outline_group_prompt(self, topics: list[str | None]) -> list[dict[str, str]]:
+        """Build the prompt for one outline per topic in a single completion."""
+        premises = "\n".join(
+            f"{num}. {topic or 'Any premise you find interesting'}"
+            for num, topic in enumerate(topics, 1)
         )
+        if self.config.generation.outline_format == "json":
+            instructions = (
+                'Respond with a JSON object whose "outlines" array holds one outline per '
+                "premise, in this order."
+            )
+        else:
+            instructions = (
+                f"Write one outline per premise, in this order, each starting with its own "
+                f"{OUTLINE_MARKER} line."
+            )
+        user_content = (
+            f"Create {len(topics)} separate episode outlines, one for each of these premises:\n\n"
+            f"{premises}\n\n{instructions}"
+        )
+        return self._outline_messages(user_content)
 
-        return [
-            {"role": "system", "content": system_content},
-            {"role": "user", "content": f"Create an episode outline for: {topic or 'any topic you find interesting'}"},
-        ]
+    def _outline_messages(self, user_content: str) -> list[dict[str, str]]:
+        """Outline chat messages for the configured output format."""
+        if self.config.generation.outline_format == "json":
+            return self.prompts.messages("outline.md.j2", user_content, structured=True)
+        return self.prompts.messages("outline.md.j2", user_content)
 
-    def _build_script_prompt(self, outline_text: str) -> list[dict[str, str]]:
-        """Build the script generation prompt."""
-        template = self.jinja_env.get_template("script.md.j2")
+    def build_script_prompt(
+        self,
+        outline_text: str,
+        instructions: str = "Write the full WaveLang script for this outline.",
+        outline: EpisodeOutline | None = None,
+    ) -> list[dict[str, str]]:
+        """
+        Build the script generation prompt.
+
+        With generation.script_cast "outline" and a parsed outline, the system
+        prompt leaves the character voices out and the user message lists
+        only the cast and shots the outline uses, so the prompt grows with
+        the episode rather than the registry.
+
+        Args:
+            outline_text: Outline text to adapt
+            instructions: What to write (the whole script, a scene group, ...)
+            outline: Parsed outline, used to limit the prompt to its cast
 
-        system_content = template.render(
-            characters=self.characters.characters,
-            shots=self.shots.shots,
-            outline=outline_text,
+        Returns:
+            Chat messages
+        """
+        user_content = f"THE OUTLINE TO ADAPT:\n\n{outline_text}\n\n{instructions}"
+
+        cast = None
+        if outline and self.config.generation.script_cast == "outline":
+            cast = self._outline_cast(outline)
+        if cast is None:
+            return self.prompts.messages("script.md.j2", user_content)
+
+        characters, shots = cast
+        sheet = self.prompts.render("_script_cast.md.j2", characters=characters, shots=shots)
+        return self.prompts.messages(
+            "script.md.j2",
+            f"THE OUTLINE TO ADAPT:\n\n{outline_text}\n\n{sheet}\n{instructions}",
+            episode_cast=True,
         )
 
-        return [
-            {"role": "system", "content": system_content},
-            {"role": "user", "content": "Write the full WaveLang script for this outline."},
+    def _outline_cast(self, outline: EpisodeOutline) -> tuple[list[Character], list[Shot]] | None:
+        """
+        Pick the registry entries a script prompt needs for an outline.
+
+        Characters are those cast in any scene, plus (as a safety margin) any
+        other character the outline mentions by name, e.g. in a callback.
+        Shots are those the scenes use.
+
+        Returns:
+            Tuple of (characters, shots) in registry order, or None when the
+            outline has no parsed scenes
+        """
+        if not outline.scenes:
+            return None
+
+        names = {name for beat in outline.scenes for name in beat.characters}
+        characters = [
+            char
+            for char in self.characters.characters
+            if any(char.matches_name(name) for name in names)
+            or re.search(rf"\b{re.escape(char.id)}\b", outline.raw_text)
         ]
+        shot_ids = {beat.shot_id for beat in outline.scenes}
+        shots = [shot for shot in self.shots.shots if shot.id in shot_ids]
+
+        logger.debug(
+            "script_cast_selected",
+            characters=len(characters),
+            shots=len(shots),
+            registry_characters=len(self.characters.characters),
+            registry_shots=len(self.shots.shots),
+        )
+        return characters, shots
+
+    def _build_scene_group_prompt(
+        self,
+        outline_text: str,
+        groups: list[list[SceneBeat]],
+        index: int,
+        outline: EpisodeOutline | None = None,
+    ) -> list[dict[str, str]]:
+        """Build the prompt for writing one group of outline scenes."""
+        group = groups[index]
+        previous_beat = groups[index - 1][-1] if index > 0 else None
+        next_beat = groups[index + 1][0] if index + 1 < len(groups) else None
+        first, last = group[0].scene_num, group[-1].scene_num
+        scene_range = f"scene {first}" if first == last else f"scenes {first}-{last}"
+
+        parts = [
+            f"Write ONLY {scene_range} of this outline. "
+            "Other scenes are being written separately."
+        ]
+        if previous_beat:
+            parts.append(
+                f"PREVIOUS SCENE (already written, for continuity):\n{previous_beat.to_text()}"
+            )
+        parts.append("YOUR SCENES:\n" + "\n\n".join(beat.to_text() for beat in group))
+        if next_beat:
+            parts.append(f"NEXT SCENE (do not write it, but set it up):\n{next_beat.to_text()}")
+            ending = "No summary line."
+        else:
+            # The last group ends the episode, so it writes the script's summary line
+            ending = "After the last scene, end with a one-line episode summary (== summary)."
+        parts.append(
+            f"Write exactly {len(group)} scene(s), one per outline scene, in order. {ending} "
+            "Start directly with the first scene header (>>)."
+        )
+
+        return self.build_script_prompt(outline_text, "\n\n".join(parts), outline)
+
+    def _build_continuation_prompt(
+        self,
+        outline_text: str,
+        beats: list[SceneBeat],
+        written: int,
+        outline: EpisodeOutline | None = None,
+    ) -> list[dict[str, str]]:
+        """Build the prompt for the scenes a truncated completion didn't finish."""
+        groups = [group for group in (beats[:written], beats[written:]) if group]
+        return self._build_scene_group_prompt(outline_text, groups, len(groups) - 1, outline)
 
     def _plot_to_outline_text(self, plot) -> str:
         """Convert legacy plot to outline-like text for script generation."""
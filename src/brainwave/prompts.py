@@ -0,0 +1,273 @@
+"""Shared, memoized rendering of the prompt templates."""
+
+import hashlib
+import math
+import re
+import threading
+from pathlib import Path
+from typing import Literal
+
+import structlog
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from brainwave.config import AppConfig
+from brainwave.models.characters import load_characters, load_shots
+
+logger = structlog.get_logger()
+
+PromptVerbosity = Literal["full", "compact"]
+
+
+def _source_files(templates_dir: Path, data_dir: Path) -> list[Path]:
+    """Files that prompt content is rendered from."""
+    return sorted(templates_dir.glob("*.j2")) + sorted(data_dir.glob("*.yaml"))
+
+
+def prompt_fingerprint(templates_dir: Path, data_dir: Path) -> str:
+    """
+    Hash the prompt templates and character/shot data.
+
+    Args:
+        templates_dir: Directory containing *.j2 templates
+        data_dir: Directory containing the *.yaml registries
+
+    Returns:
+        Hex SHA-256 digest over file names and contents
+    """
+    digest = hashlib.sha256()
+    for path in _source_files(templates_dir, data_dir):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, math.ceil(len(text) / 4)) if text else 0
+
+
+def brief(text: str, limit: int = 120) -> str:
+    """
+    Shorten registry prose for compact prompts.
+
+    Keeps as many leading sentences as fit within limit characters; a first
+    sentence that is too long on its own is cut at its last clause (or word)
+    that fits.
+
+    Args:
+        text: Description or quirks text
+        limit: Maximum length of the result
+
+    Returns:
+        Abbreviated text
+    """
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+
+    # Sentence ends that aren't inside a quotation
+    ends = [
+        m.end()
+        for m in re.finditer(r"[.!?]\"?(?=\s)", text)
+        if text.count('"', 0, m.end()) % 2 == 0
+    ]
+    fitting = [end for end in ends if end <= limit]
+    if fitting:
+        return text[: fitting[-1]]
+
+    cut = text[:limit]
+    for separator in (", ", "; ", " "):
+        index = cut.rfind(separator)
+        if index > limit // 2:
+            return cut[:index].rstrip(",;") + "..."
+    return cut + "..."
+
+
+class PromptRenderer:
+    """
+    Renders the static (system) part of each prompt once and reuses it.
+
+    System prompts depend only on a template and the character/shot
+    registries, so each is rendered on first use and memoized under the
+    fingerprint of templates/*.j2 and data/*.yaml. A cheap stat check on
+    every call reloads the registries and drops the memo when any of those
+    files change. Compiled templates are kept in a bytecode cache so new
+    processes skip Jinja compilation as well.
+
+    With verbosity "compact", templates render the shot list as a terse
+    table and characters as abbreviated cards instead of the full prose.
+    """
+
+    def __init__(
+        self,
+        templates_dir: Path,
+        data_dir: Path,
+        cache_dir: Path | None = None,
+        verbosity: PromptVerbosity = "full",
+        card_length: int = 120,
+    ):
+        self.templates_dir = templates_dir
+        self.data_dir = data_dir
+        self.verbosity = verbosity
+        self.card_length = card_length
+
+        bytecode_cache = None
+        if cache_dir:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+
+        self.env = Environment(
+            loader=FileSystemLoader(templates_dir),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=bytecode_cache,
+        )
+        self.env.filters["brief"] = brief
+
+        self._lock = threading.Lock()
+        self._stamp: tuple = ()
+        self._fingerprint = ""
+        self._rendered: dict[tuple, str] = {}
+        self._context: dict = {}
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the templates and registries currently in use."""
+        with self._lock:
+            self._refresh()
+            return self._fingerprint
+
+    def system_prompt(self, template_name: str, **options) -> str:
+        """
+        Get the rendered system prompt for a template.
+
+        Args:
+            template_name: Template file name, e.g. "script.md.j2"
+            **options: Extra (hashable) template variables, part of the memo key
+
+        Returns:
+            Rendered prompt text (memoized until the sources change)
+        """
+        key = (template_name, *sorted(options.items()))
+        with self._lock:
+            self._refresh()
+            rendered = self._rendered.get(key)
+            if rendered is None:
+                rendered = self.env.get_template(template_name).render(**self._context, **options)
+                self._rendered[key] = rendered
+                logger.debug(
+                    "prompt_rendered",
+                    template=template_name,
+                    verbosity=self.verbosity,
+                    tokens=estimate_tokens(rendered),
+                    **options,
+                )
+            return rendered
+
+    def render(self, template_name: str, **context) -> str:
+        """
+        Render a template for one request, without memoizing.
+
+        Args:
+            template_name: Template file name, e.g. "_script_cast.md.j2"
+            **context: Variables overriding the registry context (e.g. a subset
+                of characters)
+
+        Returns:
+            Rendered text
+        """
+        with self._lock:
+            self._refresh()
+            base = dict(self._context)
+        return self.env.get_template(template_name).render({**base, **context})
+
+    def messages(self, template_name: str, user_content: str, **options) -> list[dict[str, str]]:
+        """
+        Build chat messages from a memoized system prompt and per-call content.
+
+        Args:
+            template_name: Template file name for the system message
+            user_content: Per-episode user message
+            **options: Extra template variables for the system prompt
+
+        Returns:
+            Chat messages (system, user)
+        """
+        return [
+            {"role": "system", "content": self.system_prompt(template_name, **options)},
+            {"role": "user", "content": user_content},
+        ]
+
+    def template_names(self) -> list[str]:
+        """Prompt templates in the templates directory (partials excluded)."""
+        return sorted(p.name for p in self.templates_dir.glob("*.j2") if not p.name.startswith("_"))
+
+    def token_estimates(self) -> dict[str, int]:
+        """
+        Estimate the rendered system prompt size of every template.
+
+        Returns:
+            Mapping of template name to estimated tokens at this verbosity
+        """
+        return {name: estimate_tokens(self.system_prompt(name)) for name in self.template_names()}
+
+    def _refresh(self) -> None:
+        """Reload registries and drop memoized prompts if any source file changed."""
+        files = _source_files(self.templates_dir, self.data_dir)
+        stamp = tuple((p.name, st.st_mtime_ns, st.st_size) for p in files for st in [p.stat()])
+        if stamp == self._stamp:
+            return
+
+        fingerprint = prompt_fingerprint(self.templates_dir, self.data_dir)
+        if fingerprint != self._fingerprint:
+            self._context = {
+                "characters": load_characters(self.data_dir / "characters.yaml").characters,
+                "shots": load_shots(self.data_dir / "shots.yaml").shots,
+                "compact": self.verbosity == "compact",
+                "card_length": self.card_length,
+            }
+            self._rendered.clear()
+            if self._fingerprint:
+                logger.info("prompt_sources_changed", fingerprint=fingerprint[:12])
+            self._fingerprint = fingerprint
+
+        self._stamp = stamp
+
+
+_renderers: dict[tuple, PromptRenderer] = {}
+_renderers_lock = threading.Lock()
+
+
+def get_prompt_renderer(
+    config: AppConfig, verbosity: PromptVerbosity | None = None
+) -> PromptRenderer:
+    """
+    Get the process-wide renderer for the configured templates and data.
+
+    Args:
+        config: Application configuration
+        verbosity: Override for generation.prompt_verbosity
+
+    Returns:
+        Shared PromptRenderer
+    """
+    verbosity = verbosity or config.generation.prompt_verbosity
+    card_length = config.generation.card_length
+    key = (
+        config.paths.templates_dir.resolve(),
+        config.paths.data_dir.resolve(),
+        verbosity,
+        card_length,
+    )
+    with _renderers_lock:
+        renderer = _renderers.get(key)
+        if renderer is None:
+            renderer = PromptRenderer(
+                config.paths.templates_dir,
+                config.paths.data_dir,
+                cache_dir=config.paths.cache_dir / "jinja",
+                verbosity=verbosity,
+                card_length=card_length,
+            )
+            _renderers[key] = renderer
+        return renderer
@@ -0,0 +1,219 @@
+"""Targeted scene-level repair of scripts that fail validation."""
+
+from dataclasses import dataclass
+
+import structlog
+
+from brainwave.llm import AsyncLLMClient, LLMClient
+from brainwave.models.episode import StepUsage
+from brainwave.parser import WaveLangParser
+from brainwave.prompts import PromptRenderer
+from brainwave.script_cache import get_script_cache
+from brainwave.streaming import ScriptStreamMonitor
+from brainwave.validator import ScriptValidator, ValidationResult
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class RepairPlan:
+    """One repair completion: the failing scenes and the prompt that fixes them."""
+
+    preamble: str
+    blocks: list[str]
+    scene_indices: list[int]
+    prompt: list[dict[str, str]]
+
+
+class ScriptRepairer:
+    """
+    Regenerates only the scenes a ValidationResult flags.
+
+    All failing scenes are sent in a single compact completion (their
+    current text, errors and the shot/cast constraints), and the returned
+    scenes are spliced back into the script in place. repair() needs a sync
+    LLMClient, repair_async() an AsyncLLMClient.
+    """
+
+    def __init__(
+        self,
+        llm: LLMClient | AsyncLLMClient,
+        validator: ScriptValidator,
+        prompts: PromptRenderer,
+        abort_after_errors: int = 0,
+    ):
+        self.llm = llm
+        self.validator = validator
+        self.prompts = prompts
+        self.abort_after_errors = abort_after_errors
+        self.parser = WaveLangParser()
+        self.scripts = get_script_cache()
+
+    def repair(
+        self,
+        script_text: str,
+        result: ValidationResult,
+        max_rounds: int = 1,
+        usage: StepUsage | None = None,
+        step: str | None = None,
+    ) -> tuple[str, ValidationResult]:
+        """
+        Repair failing scenes until the script validates or rounds run out.
+
+        Args:
+            script_text: WaveLang script that failed validation
+            result: Its validation result
+            max_rounds: Maximum repair completions
+            usage: Optional step usage record for the repair requests
+            step: Generation step whose LLM settings the repair requests use
+
+        Returns:
+            Tuple of (script text, validation result) - unchanged if the
+            errors could not be attributed to scenes or repair failed
+        """
+        for round_num in range(max_rounds):
+            if not self._worth_repairing(result):
+                break
+
+            try:
+                repaired_text = None
+                plan = self._prepare_round(script_text, result)
+                if plan:
+                    response = self.llm.complete(
+                        plan.prompt, monitor=self._monitor(), usage=usage, step=step
+                    )
+                    repaired_text = self._splice_round(plan, response.content)
+            except Exception as e:
+                logger.warning("script_repair_failed", round=round_num + 1, error=str(e))
+                break
+
+            if repaired_text is None:
+                break
+
+            script_text = repaired_text
+            result = self._revalidate(script_text, round_num)
+
+        return script_text, result
+
+    async def repair_async(
+        self,
+        script_text: str,
+        result: ValidationResult,
+        max_rounds: int = 1,
+        usage: StepUsage | None = None,
+        step: str | None = None,
+    ) -> tuple[str, ValidationResult]:
+        """Async variant of repair(); requires an AsyncLLMClient."""
+        for round_num in range(max_rounds):
+            if not self._worth_repairing(result):
+                break
+
+            try:
+                repaired_text = None
+                plan = self._prepare_round(script_text, result)
+                if plan:
+                    response = await self.llm.complete(
+                        plan.prompt, monitor=self._monitor(), usage=usage, step=step
+                    )
+                    repaired_text = self._splice_round(plan, response.content)
+            except Exception as e:
+                logger.warning("script_repair_failed", round=round_num + 1, error=str(e))
+                break
+
+            if repaired_text is None:
+                break
+
+            script_text = repaired_text
+            result = self._revalidate(script_text, round_num)
+
+        return script_text, result
+
+    def _worth_repairing(self, result: ValidationResult) -> bool:
+        """Whether another repair round could help."""
+        if result.is_valid:
+            return False
+
+        # Errors without a scene can't be fixed locally
+        if any(e.scene_index is None for e in result.errors):
+            logger.info("script_repair_skipped", reason="unscoped_errors")
+            return False
+
+        return True
+
+    def _monitor(self) -> ScriptStreamMonitor:
+        """Stream monitor for a repair completion."""
+        return ScriptStreamMonitor(self.validator, self.abort_after_errors)
+
+    def _revalidate(self, script_text: str, round_num: int) -> ValidationResult:
+        """Validate a repaired script and log the outcome of the round."""
+        result = self.validator.validate(self.scripts.parse(script_text))
+
+        logger.info(
+            "script_repaired",
+            round=round_num + 1,
+            valid=result.is_valid,
+            remaining_errors=result.error_count,
+        )
+        return result
+
+    def _prepare_round(
+        self,
+        script_text: str,
+        result: ValidationResult,
+    ) -> RepairPlan | None:
+        """Plan one repair completion; returns None if the errors don't match the scenes."""
+        preamble, blocks = self.parser.split_scenes(script_text)
+        scene_indices = sorted({e.scene_index for e in result.errors if e.scene_index is not None})
+
+        if any(idx >= len(blocks) for idx in scene_indices):
+            logger.warning("script_repair_scene_mismatch", scenes=len(blocks))
+            return None
+
+        prompt = self._build_repair_prompt(blocks, scene_indices, result)
+        return RepairPlan(preamble, blocks, scene_indices, prompt)
+
+    def _splice_round(
+        self,
+        plan: RepairPlan,
+        content: str,
+    ) -> str | None:
+        """Splice the repaired scenes into the script; returns None on a count mismatch."""
+        blocks, scene_indices = plan.blocks, plan.scene_indices
+
+        _, fixed_blocks = self.parser.split_scenes(content.strip().strip("`"))
+        if len(fixed_blocks) != len(scene_indices):
+            logger.warning(
+                "script_repair_count_mismatch",
+                expected=len(scene_indices),
+                returned=len(fixed_blocks),
+            )
+            return None
+
+        for idx, fixed in zip(scene_indices, fixed_blocks):
+            # Keep any summary line that trailed the original scene
+            summary = [line for line in blocks[idx].split("\n") if line.strip().startswith("==")]
+            fixed_lines = [line for line in fixed.split("\n") if not line.strip().startswith("==")]
+            blocks[idx] = "\n".join(fixed_lines + summary)
+
+        parts = [plan.preamble] if plan.preamble.strip() else []
+        return "\n".join(parts + blocks)
+
+    def _build_repair_prompt(
+        self,
+        blocks: list[str],
+        scene_indices: list[int],
+        result: ValidationResult,
+    ) -> list[dict[str, str]]:
+        """Build the compact repair prompt for the failing scenes."""
+        sections = []
+        for idx in scene_indices:
+            errors = "\n".join(f"- {e.message}" for e in result.errors if e.scene_index == idx)
+            sections.append(f"SCENE {idx + 1}\nErrors:\n{errors}\nCurrent text:\n{blocks[idx]}")
+
+        user_content = (
+            f"Fix these {len(scene_indices)} scene(s).\n\n"
+            + "\n\n".join(sections)
+            + f"\n\nReturn exactly {len(scene_indices)} scene(s), in this order."
+        )
+
+        return self.prompts.messages("repair.md.j2", user_content)
@@ -0,0 +1,143 @@
+"""Parse-once cache of WaveLang scripts shared by the pipeline stages."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import structlog
+from pydantic import ValidationError
+
+from brainwave.models.script import WaveLangScript
+from brainwave.parser import WaveLangParser
+
+logger = structlog.get_logger()
+
+# Parsed form kept next to episode-script.txt
+PARSED_SCRIPT_FILE = "episode-script.parsed.json"
+
+# Bump when the parser's output changes, so older parsed files are ignored
+PARSED_FORMAT = 1
+
+
+class ScriptParseCache:
+    """
+    WaveLang scripts parsed once per content hash.
+
+    Lookups go to an in-process LRU first, then to the parsed form saved in
+    the episode directory, and only then to the parser. A script parsed (or
+    checked) in one process is written next to episode-script.txt, so the
+    build, export and preview commands of later processes read the parsed
+    form instead of parsing again.
+
+    Returned scripts are shared between callers and must not be modified.
+    """
+
+    def __init__(self, parser: WaveLangParser | None = None, max_entries: int = 64):
+        """
+        Initialize the cache.
+
+        Args:
+            parser: Parser for scripts not cached yet
+            max_entries: Scripts kept in memory
+        """
+        self.parser = parser or WaveLangParser()
+        self.max_entries = max_entries
+        self._scripts: OrderedDict[str, WaveLangScript] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Content hash a script is cached under."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def parse(self, text: str, work_dir: Path | None = None) -> WaveLangScript:
+        """
+        Get the parsed form of a script, parsing it only if it isn't cached.
+
+        Args:
+            text: Raw WaveLang script text
+            work_dir: Episode directory holding the persisted parsed form
+                (read, and written after a parse)
+
+        Returns:
+            Parsed WaveLangScript (shared; don't modify)
+        """
+        key = self.key(text)
+        script = self._get(key)
+        if script is not None:
+            return script
+
+        script = self._load(key, text, work_dir) if work_dir else None
+        if script is None:
+            script = self.parser.parse(text)
+            if work_dir:
+                self._save(key, script, work_dir)
+
+        self._put(key, script)
+        return script
+
+    def save(self, script: WaveLangScript, work_dir: Path) -> None:
+        """
+        Persist an already parsed script next to its episode-script.txt.
+
+        Args:
+            script: Parsed script (its raw_text is the cached content)
+            work_dir: Episode directory
+        """
+        key = self.key(script.raw_text)
+        self._save(key, script, work_dir)
+        self._put(key, script)
+
+    def _get(self, key: str) -> WaveLangScript | None:
+        with self._lock:
+            script = self._scripts.get(key)
+            if script is not None:
+                self._scripts.move_to_end(key)
+            return script
+
+    def _put(self, key: str, script: WaveLangScript) -> None:
+        with self._lock:
+            self._scripts[key] = script
+            self._scripts.move_to_end(key)
+            while len(self._scripts) > self.max_entries:
+                self._scripts.popitem(last=False)
+
+    def _load(self, key: str, text: str, work_dir: Path) -> WaveLangScript | None:
+        """Read the persisted parsed form, if it is for this text and parser."""
+        path = work_dir / PARSED_SCRIPT_FILE
+        if not path.exists():
+            return None
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("format") != PARSED_FORMAT or data.get("sha256") != key:
+                return None
+            return WaveLangScript.model_validate(
+                {"scenes": data["scenes"], "summary": data["summary"], "raw_text": text}
+            )
+        except (OSError, ValueError, KeyError, ValidationError) as e:
+            logger.warning("parsed_script_unreadable", path=str(path), error=str(e))
+            return None
+
+    def _save(self, key: str, script: WaveLangScript, work_dir: Path) -> None:
+        """Write the parsed form (without the raw text, which is in episode-script.txt)."""
+        data = {
+            "format": PARSED_FORMAT,
+            "sha256": key,
+            **script.model_dump(mode="json", exclude={"raw_text"}),
+        }
+        try:
+            work_dir.mkdir(parents=True, exist_ok=True)
+            (work_dir / PARSED_SCRIPT_FILE).write_text(json.dumps(data), encoding="utf-8")
+        except OSError as e:
+            logger.warning("parsed_script_not_saved", path=str(work_dir), error=str(e))
+
+
+_cache = ScriptParseCache()
+
+
+def get_script_cache() -> ScriptParseCache:
+    """Get the process-wide script parse cache."""
+    return _cache
@@ -0,0 +1,734 @@
+"""Local OpenAI-compatible stand-in server for offline runs and load tests."""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import structlog
+
+from brainwave.models.characters import CharacterRegistry, ShotRegistry
+from brainwave.models.episode import EpisodeOutline, SceneBeat
+from brainwave.prompts import estimate_tokens
+
+logger = structlog.get_logger()
+
+# One MPEG-1 Layer III frame (32 kbps, 44.1 kHz, mono) of silence, ~26 ms
+SILENT_MP3_FRAME = b"\xff\xfb\x10\xc0" + bytes(100)
+MP3_FRAME_SECONDS = 1152 / 44100
+
+INFLECTIONS = [
+    "deadpan", "annoyed", "defensive", "confused", "dismissive", "excited",
+    "nervous", "sarcastic", "sincere", "trailing off",
+]
+
+LINES = [
+    "I'm going to need you to put that in writing.",
+    "Nobody told me that was a real meeting.",
+    "We have a process for this. I just don't know what it is.",
+    "Is that the thing from the email?",
+    "I already escalated it. To myself.",
+    "That's not what the slide said.",
+    "Can we circle back after I pretend I didn't hear that?",
+    "I think the printer is doing it on purpose.",
+    "Legally, I'm not allowed to answer that.",
+    "Wait. Who approved the budget for this?",
+    "I'm not mad. I'm documenting.",
+    "That sounds like a Monday problem.",
+    "So we're just doing this now? Okay.",
+    "I've been here forty years and I've never seen a fax do that.",
+    "Let's take this offline. Like, permanently.",
+    "Honestly, that's the most normal thing that's happened today.",
+]
+
+TOPICS = [
+    "the office coffee machine gains a loyalty program",
+    "a mandatory wellness survey goes wrong",
+    "the company accidentally trademarks a common word",
+    "an intern is mistaken for a visiting investor",
+]
+
+SCENE_LINE = re.compile(
+    r"^\s*\d+\.\s*\[(?:Shot\s*)?(\d+)\]\s*-\s*(.+)$", re.IGNORECASE | re.MULTILINE
+)
+
+
+@dataclass
+class StandInSettings:
+    """Behaviour of the stand-in server."""
+
+    tokens_per_second: float = 0.0  # Completion pacing (0 = as fast as possible)
+    latency: float = 0.0  # Seconds before the first byte of every response
+    error_rate: float = 0.0  # Fraction of requests answered with HTTP 500
+    rate_limit_rate: float = 0.0  # Fraction of requests answered with HTTP 429
+    retry_after: float = 1.0  # Retry-After sent with injected 429 responses
+    requests_per_minute: int = 0  # Chat request quota, enforced with 429s (0 = unlimited)
+    tokens_per_minute: int = 0  # Chat token quota (prompt + output cap; 0 = unlimited)
+    batch_delay: float = 0.0  # Seconds a Batch API job stays in progress
+    batch_error_rate: float = 0.0  # Fraction of Batch API requests failing with 500
+    seed: int | None = None
+
+
+class ResponseSynthesizer:
+    """
+    Writes outline, plot and WaveLang responses that satisfy the validator.
+
+    The kind of response is picked from the user message the pipeline and
+    generator send; casts are drawn from the registries within each shot's
+    size and gender limits.
+    """
+
+    def __init__(self, characters: CharacterRegistry, shots: ShotRegistry, rng: random.Random):
+        self.characters = characters
+        self.shots = shots
+        self.rng = rng
+
+    def respond(self, messages: list[dict[str, Any]], structured: bool = False) -> str:
+        """
+        Produce completion text for a chat request.
+
+        Args:
+            messages: Chat messages
+            structured: Whether a json_schema response format was requested
+                (outlines are then written as JSON)
+        """
+        user = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+
+        if "Create an episode outline" in user:
+            topic = user.split("for:", 1)[1].strip() if "for:" in user else None
+            outline = self.outline(topic)
+            return json.dumps(self._outline_data(outline)) if structured else outline.to_text()
+
+        if re.match(r"Create \d+ separate episode outlines", user):
+            # One outline per numbered premise
+            premises = re.findall(r"^\d+\. (.+)$", user, re.MULTILINE)
+            outlines = [self.outline(premise) for premise in premises]
+            if structured:
+                return json.dumps({"outlines": [self._outline_data(o) for o in outlines]})
+            return "\n\n".join(outline.to_text() for outline in outlines)
+
+        if user.startswith("Fix these"):
+            match = re.search(r"Fix these (\d+)", user)
+            count = int(match.group(1)) if match else 1
+            return self.script([self._random_cast() for _ in range(count)], summary=False)
+
+        if "Generate an episode plot outline" in user:
+            return self.plot(user)
+
+        if "Generate a complete episode" in user:
+            return f"{self.plot(user)}\n\n=== SCRIPT ===\n{self.script(None)}"
+
+        # Script from an outline (whole, or one group of scenes)
+        section = user.split("YOUR SCENES:", 1)[1] if "YOUR SCENES:" in user else user
+        if "NEXT SCENE" in section:
+            section = section.split("NEXT SCENE", 1)[0]
+        beats = [
+            (int(shot_id), [c.strip() for c in cast.split(",") if c.strip()])
+            for shot_id, cast in SCENE_LINE.findall(section)
+        ]
+        return self.script(beats or None, summary="No summary line" not in user)
+
+    def outline(self, topic: str | None) -> EpisodeOutline:
+        """Write an outline (to_text() gives the outline.md.j2 output format)."""
+        topic = topic or self.rng.choice(TOPICS)
+        scenes = []
+        for num in range(1, self.rng.randint(8, 12) + 1):
+            shot_id, cast = self._random_cast()
+            scenes.append(
+                SceneBeat(
+                    scene_num=num,
+                    shot_id=shot_id,
+                    characters=cast,
+                    setup=f"{cast[0]} notices something is off.",
+                    beat="It gets worse when someone tries to help.",
+                    lands="They agree to never speak of it, immediately speak of it.",
+                )
+            )
+        return EpisodeOutline(
+            title=f"The {topic.split()[-1].strip('.').title()} Situation",
+            premise=f"Everyone at Oddball Industries overreacts when {topic}.",
+            theme="Nobody reads the memo.",
+            scenes=scenes,
+            callbacks=["The memo nobody read"],
+            ending="The problem is solved by accident and nobody learns anything.",
+        )
+
+    def _outline_data(self, outline: EpisodeOutline) -> dict[str, Any]:
+        """An outline as the structured output schema has it (no scene numbers)."""
+        return outline.model_dump(exclude={"raw_text": True, "scenes": {"__all__": {"scene_num"}}})
+
+    def plot(self, user: str) -> str:
+        """Write a plot section in the episode/preview output format."""
+        topic = None
+        if "PREMISE:" in user:
+            topic = user.split("PREMISE:", 1)[1].split("\n", 1)[0].strip()
+        topic = topic or self.rng.choice(TOPICS)
+        return "\n".join([
+            "=== PLOT ===",
+            f"title: The {topic.split()[-1].strip('.').title()} Situation",
+            f"exposition: Oddball Industries finds out that {topic}.",
+            "rising_action: Every attempt to fix it makes it more official.",
+            "climax: Art signs something he shouldn't have.",
+            "falling_action: The paperwork becomes self-aware.",
+            "resolution: Nothing changes, but now there's a committee.",
+        ])
+
+    def script(self, beats: list[tuple[int, list[str]]] | None, summary: bool = True) -> str:
+        """
+        Write WaveLang scenes.
+
+        Args:
+            beats: (shot_id, cast) per scene, or None for a random episode
+            summary: Whether to end with a summary line
+        """
+        if beats is None:
+            beats = [self._random_cast() for _ in range(self.rng.randint(10, 14))]
+
+        lines: list[str] = []
+        for shot_id, cast in beats:
+            shot = self.shots.get_by_id(shot_id)
+            max_characters = shot.max_characters if shot else len(cast)
+            lines.append(f">> [{shot_id}] > {len(cast)}/{max_characters} - {', '.join(cast)}")
+            for i in range(self.rng.randint(3, 6)):
+                speaker = cast[i % len(cast)]
+                lines.append(
+                    f":: {speaker} : {self.rng.choice(INFLECTIONS)} : {self.rng.choice(LINES)}"
+                )
+            lines.append("")
+
+        if summary:
+            lines.append("== The office survives another day, barely.")
+        return "\n".join(lines).strip()
+
+    def _random_cast(self) -> tuple[int, list[str]]:
+        """Pick a shot and a cast that fits it."""
+        shot = self.rng.choice(self.shots.shots)
+        eligible = [
+            c.id
+            for c in self.characters.characters
+            if not shot.gender_restriction or c.gender == shot.gender_restriction
+        ]
+        size = self.rng.randint(min(2, shot.max_characters), shot.max_characters)
+        return shot.id, self.rng.sample(eligible, min(size, len(eligible)))
+
+
+class RateQuota:
+    """
+    A per-minute quota that refills continuously, as provider rate limits do.
+
+    Reports itself in the provider's x-ratelimit-* header format.
+    """
+
+    def __init__(self, name: str, per_minute: int):
+        self.name = name
+        self.limit = per_minute
+        self.level = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def wait(self, amount: float) -> float:
+        """Seconds until the amount is available (0 if it is now)."""
+        now = time.monotonic()
+        self.level = min(self.limit, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        return max(0.0, min(amount, self.limit) - self.level) / self.rate
+
+    def headers(self) -> dict[str, str]:
+        reset = (self.limit - self.level) / self.rate
+        return {
+            f"x-ratelimit-limit-{self.name}": str(self.limit),
+            f"x-ratelimit-remaining-{self.name}": str(int(self.level)),
+            f"x-ratelimit-reset-{self.name}": _duration(reset),
+        }
+
+
+class StandInServer:
+    """
+    Threaded HTTP server implementing the OpenAI endpoints brainwave uses.
+
+    - POST /v1/chat/completions (blocking and SSE streaming, with usage
+      and simulated prompt-cache hits)
+    - POST /v1/audio/speech (silent MP3 sized to the input text)
+    - POST /v1/files, GET /v1/files/{id}/content, POST /v1/batches and
+      GET /v1/batches/{id} (Batch API jobs answered in the background)
+
+    Optional request and token quotas answer chat requests past them with
+    429s and report what is left in x-ratelimit-* headers.
+    """
+
+    def __init__(
+        self,
+        synthesizer: ResponseSynthesizer,
+        settings: StandInSettings,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+    ):
+        self.synthesizer = synthesizer
+        self.settings = settings
+        self.rng = random.Random(settings.seed)
+        self._seen_prefixes: set[str] = set()
+        self._lock = threading.Lock()
+        self._files: dict[str, tuple[dict[str, Any], bytes]] = {}
+        self._batches: dict[str, dict[str, Any]] = {}
+        self._quotas = [
+            RateQuota(name, per_minute)
+            for name, per_minute in (
+                ("requests", settings.requests_per_minute),
+                ("tokens", settings.tokens_per_minute),
+            )
+            if per_minute > 0
+        ]
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as llm.base_url / tts.base_url."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def serve_forever(self) -> None:
+        """Serve until shutdown() is called."""
+        logger.info("standin_listening", base_url=self.base_url)
+        self.httpd.serve_forever()
+
+    def start(self) -> threading.Thread:
+        """Serve from a background thread."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self) -> None:
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def injected_error(self) -> tuple[int, dict[str, str]] | None:
+        """Roll for an injected failure; returns (status, headers) or None."""
+        roll = self.rng.random()
+        if roll < self.settings.rate_limit_rate:
+            return 429, {"Retry-After": f"{self.settings.retry_after:g}"}
+        if roll < self.settings.rate_limit_rate + self.settings.error_rate:
+            return 500, {}
+        return None
+
+    def admit(self, body: dict[str, Any]) -> tuple[float, dict[str, str]]:
+        """
+        Charge a chat request to the quotas.
+
+        Returns:
+            (seconds until it fits, 0 if admitted; rate-limit headers)
+        """
+        if not self._quotas:
+            return 0.0, {}
+
+        messages = body.get("messages", [])
+        tokens = sum(estimate_tokens(str(m.get("content", ""))) for m in messages)
+        tokens += body.get("max_completion_tokens") or body.get("max_tokens") or 0
+
+        with self._lock:
+            costs = [1 if quota.name == "requests" else tokens for quota in self._quotas]
+            wait = max(quota.wait(cost) for quota, cost in zip(self._quotas, costs))
+            if not wait:
+                for quota, cost in zip(self._quotas, costs):
+                    quota.level -= cost
+            headers = {k: v for quota in self._quotas for k, v in quota.headers().items()}
+        return wait, headers
+
+    def cached_tokens(self, messages: list[dict[str, Any]]) -> int:
+        """Simulate provider prompt caching of a repeated system message."""
+        system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        tokens = estimate_tokens(system)
+        with self._lock:
+            seen = system in self._seen_prefixes
+            self._seen_prefixes.add(system)
+        # Providers cache prompts of 1024+ tokens in 128-token increments
+        return (tokens // 128) * 128 if seen and tokens >= 1024 else 0
+
+    def chat_result(self, body: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
+        """Write a chat completion; returns (content, finish_reason, usage)."""
+        messages = body.get("messages", [])
+        response_format = body.get("response_format") or {}
+        content = self.synthesizer.respond(
+            messages, structured=response_format.get("type") == "json_schema"
+        )
+
+        # Cut the response at the requested output budget, as the real API does
+        finish_reason = "stop"
+        limit = body.get("max_completion_tokens") or body.get("max_tokens")
+        if limit and estimate_tokens(content) > limit:
+            content = content[: limit * 4]
+            finish_reason = "length"
+
+        usage = {
+            "prompt_tokens": sum(estimate_tokens(str(m.get("content", ""))) for m in messages),
+            "completion_tokens": estimate_tokens(content),
+            "prompt_tokens_details": {"cached_tokens": self.cached_tokens(messages)},
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        return content, finish_reason, usage
+
+    def handle_chat(
+        self,
+        handler: BaseHTTPRequestHandler,
+        body: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Answer a chat completion request (sending any extra headers)."""
+        model = body.get("model", "standin")
+        content, finish_reason, usage = self.chat_result(body)
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        if not body.get("stream"):
+            if self.settings.tokens_per_second > 0:
+                time.sleep(usage["completion_tokens"] / self.settings.tokens_per_second)
+            payload = _completion(completion_id, created, model, content, finish_reason, usage)
+            _send_json(handler, 200, payload, headers)
+            return
+
+        def chunk(delta: dict[str, Any], finish_reason: str | None = None) -> dict[str, Any]:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.send_header("Transfer-Encoding", "chunked")
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+
+        try:
+            _send_event(handler, chunk({"role": "assistant", "content": ""}))
+
+            start = time.monotonic()
+            sent_tokens = 0
+            for piece in re.findall(r"\S+\s*|\s+", content):
+                sent_tokens += estimate_tokens(piece)
+                if self.settings.tokens_per_second > 0:
+                    delay = start + sent_tokens / self.settings.tokens_per_second - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                _send_event(handler, chunk({"content": piece}))
+
+            _send_event(handler, chunk({}, finish_reason=finish_reason))
+            if (body.get("stream_options") or {}).get("include_usage"):
+                _send_event(handler, {**chunk({}), "choices": [], "usage": usage})
+            _send_chunk(handler, b"data: [DONE]\n\n")
+            _send_chunk(handler, b"")
+
+        except (BrokenPipeError, ConnectionResetError):
+            # The client closed the stream (e.g. an aborted or cancelled completion)
+            logger.debug("standin_stream_closed_by_client", sent_tokens=sent_tokens)
+            handler.close_connection = True
+
+    def handle_speech(self, handler: BaseHTTPRequestHandler, body: dict[str, Any]) -> None:
+        """Answer a text-to-speech request with silence roughly as long as the speech."""
+        text = str(body.get("input", ""))
+        seconds = max(0.5, len(text) / 15)  # ~15 characters per second of speech
+        audio = SILENT_MP3_FRAME * max(1, round(seconds / MP3_FRAME_SECONDS))
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "audio/mpeg")
+        handler.send_header("Content-Length", str(len(audio)))
+        handler.end_headers()
+        handler.wfile.write(audio)
+
+
+    def handle_file_upload(
+        self, handler: BaseHTTPRequestHandler, content_type: str, raw: bytes
+    ) -> None:
+        """Store a multipart file upload (Batch API input)."""
+        form = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+        )
+        fields = {
+            part.get_param("name", header="content-disposition"): part
+            for part in form.iter_parts()
+        }
+        if "file" not in fields:
+            _send_json(handler, 400, _error("Missing file", "invalid_request_error"))
+            return
+
+        data = fields["file"].get_payload(decode=True) or b""
+        purpose = fields["purpose"].get_content().strip() if "purpose" in fields else "batch"
+        meta = {
+            "id": f"file-{uuid.uuid4().hex[:24]}",
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": fields["file"].get_filename() or "upload.jsonl",
+            "purpose": purpose,
+            "status": "processed",
+        }
+        with self._lock:
+            self._files[meta["id"]] = (meta, data)
+        _send_json(handler, 200, meta)
+
+    def handle_file_content(self, handler: BaseHTTPRequestHandler, file_id: str) -> None:
+        """Return a stored file's bytes."""
+        with self._lock:
+            stored = self._files.get(file_id)
+        if stored is None:
+            _send_json(handler, 404, _error(f"No such file: {file_id}", "invalid_request_error"))
+            return
+
+        data = stored[1]
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/octet-stream")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def handle_batch_create(self, handler: BaseHTTPRequestHandler, body: dict[str, Any]) -> None:
+        """Create a batch and answer its requests in the background."""
+        file_id = body.get("input_file_id", "")
+        with self._lock:
+            stored = self._files.get(file_id)
+        if stored is None:
+            _send_json(handler, 400, _error(f"No such file: {file_id}", "invalid_request_error"))
+            return
+
+        batch = {
+            "id": f"batch_{uuid.uuid4().hex[:24]}",
+            "object": "batch",
+            "endpoint": body.get("endpoint", "/v1/chat/completions"),
+            "input_file_id": file_id,
+            "completion_window": body.get("completion_window", "24h"),
+            "status": "validating",
+            "created_at": int(time.time()),
+            "metadata": body.get("metadata"),
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        }
+        with self._lock:
+            self._batches[batch["id"]] = batch
+        threading.Thread(target=self._run_batch, args=(batch["id"], stored[1]), daemon=True).start()
+        _send_json(handler, 200, batch)
+
+    def handle_batch_get(self, handler: BaseHTTPRequestHandler, batch_id: str) -> None:
+        """Report a batch's status."""
+        with self._lock:
+            batch = dict(self._batches[batch_id]) if batch_id in self._batches else None
+        if batch is None:
+            _send_json(handler, 404, _error(f"No such batch: {batch_id}", "invalid_request_error"))
+            return
+        _send_json(handler, 200, batch)
+
+    def _run_batch(self, batch_id: str, data: bytes) -> None:
+        """Answer every request of a batch and publish the output file."""
+        requests = [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+        with self._lock:
+            batch = self._batches[batch_id]
+            batch["status"] = "in_progress"
+            batch["request_counts"]["total"] = len(requests)
+
+        if self.settings.batch_delay > 0:
+            time.sleep(self.settings.batch_delay)
+
+        lines = []
+        errors = []
+        for request in requests:
+            with self._lock:
+                failed = self.rng.random() < self.settings.batch_error_rate
+            if failed:
+                errors.append({
+                    "id": f"batch_req_{uuid.uuid4().hex[:24]}",
+                    "custom_id": request.get("custom_id"),
+                    "response": {
+                        "status_code": 500,
+                        "request_id": uuid.uuid4().hex,
+                        "body": _error("Injected stand-in failure", "server_error"),
+                    },
+                    "error": None,
+                })
+                continue
+
+            body = request.get("body", {})
+            content, finish_reason, usage = self.chat_result(body)
+            completion = _completion(
+                f"chatcmpl-{uuid.uuid4().hex[:24]}",
+                int(time.time()),
+                body.get("model", "standin"),
+                content,
+                finish_reason,
+                usage,
+            )
+            lines.append({
+                "id": f"batch_req_{uuid.uuid4().hex[:24]}",
+                "custom_id": request.get("custom_id"),
+                "response": {
+                    "status_code": 200,
+                    "request_id": uuid.uuid4().hex,
+                    "body": completion,
+                },
+                "error": None,
+            })
+
+        with self._lock:
+            batch["output_file_id"] = self._store_output(batch_id, "output", lines)
+            batch["error_file_id"] = self._store_output(batch_id, "error", errors)
+            batch["request_counts"]["completed"] = len(lines)
+            batch["request_counts"]["failed"] = len(errors)
+            batch["completed_at"] = int(time.time())
+            batch["status"] = "completed"
+        logger.debug(
+            "standin_batch_completed", batch_id=batch_id, requests=len(lines), failed=len(errors)
+        )
+
+    def _store_output(self, batch_id: str, kind: str, lines: list[dict[str, Any]]) -> str | None:
+        """Store a batch output or error file (lock must be held); None if there are no lines."""
+        if not lines:
+            return None
+
+        data = "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+        meta = {
+            "id": f"file-{uuid.uuid4().hex[:24]}",
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": f"{batch_id}_{kind}.jsonl",
+            "purpose": "batch_output",
+            "status": "processed",
+        }
+        self._files[meta["id"]] = (meta, data)
+        return meta["id"]
+
+
+def _completion(
+    completion_id: str,
+    created: int,
+    model: str,
+    content: str,
+    finish_reason: str,
+    usage: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": finish_reason,
+        }],
+        "usage": usage,
+    }
+
+
+def _duration(seconds: float) -> str:
+    """Format seconds like provider reset headers ("20ms", "1.5s", "6m0s")."""
+    if seconds < 1:
+        return f"{int(seconds * 1000)}ms"
+    minutes, rest = divmod(seconds, 60)
+    return f"{int(minutes)}m{rest:.0f}s" if minutes else f"{rest:.3g}s"
+
+
+def _send_json(
+    handler: BaseHTTPRequestHandler,
+    status: int,
+    payload: dict[str, Any],
+    headers: dict[str, str] | None = None,
+) -> None:
+    data = json.dumps(payload).encode("utf-8")
+    handler.send_response(status)
+    handler.send_header("Content-Type", "application/json")
+    handler.send_header("Content-Length", str(len(data)))
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
+    handler.end_headers()
+    handler.wfile.write(data)
+
+
+def _send_chunk(handler: BaseHTTPRequestHandler, data: bytes) -> None:
+    handler.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+    handler.wfile.flush()
+
+
+def _send_event(handler: BaseHTTPRequestHandler, payload: dict[str, Any]) -> None:
+    _send_chunk(handler, f"data: {json.dumps(payload)}\n\n".encode())
+
+
+def _make_handler(server: StandInServer) -> type[BaseHTTPRequestHandler]:
+    """Build the request handler class bound to a server instance."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("standin_request", line=format % args)
+
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0].rstrip("/")
+            parts = path.split("/")
+            if len(parts) >= 2 and parts[-2] == "batches":
+                server.handle_batch_get(self, parts[-1])
+            elif len(parts) >= 3 and parts[-3] == "files" and parts[-1] == "content":
+                server.handle_file_content(self, parts[-2])
+            else:
+                _send_json(self, 404, _error(f"Unknown endpoint: {path}", "invalid_request_error"))
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            path = self.path.split("?", 1)[0].rstrip("/")
+
+            if path.endswith("/files"):
+                server.handle_file_upload(self, self.headers.get("Content-Type", ""), raw)
+                return
+
+            try:
+                body = json.loads(raw or b"{}")
+            except json.JSONDecodeError:
+                _send_json(self, 400, _error("Invalid JSON body", "invalid_request_error"))
+                return
+
+            if path.endswith("/batches"):
+                server.handle_batch_create(self, body)
+                return
+
+            if not path.endswith(("/chat/completions", "/audio/speech")):
+                _send_json(self, 404, _error(f"Unknown endpoint: {path}", "invalid_request_error"))
+                return
+
+            if server.settings.latency > 0:
+                time.sleep(server.settings.latency)
+
+            failure = server.injected_error()
+            if failure:
+                status, headers = failure
+                kind = "rate_limit_exceeded" if status == 429 else "server_error"
+                _send_json(self, status, _error(f"Injected {status}", kind), headers)
+                return
+
+            if path.endswith("/chat/completions"):
+                wait, headers = server.admit(body)
+                if wait:
+                    headers["Retry-After"] = f"{wait:.3g}"
+                    _send_json(
+                        self, 429, _error("Rate limit reached", "rate_limit_exceeded"), headers
+                    )
+                    return
+                server.handle_chat(self, body, headers)
+            else:
+                server.handle_speech(self, body)
+
+    return Handler
+
+
+def _error(message: str, kind: str) -> dict[str, Any]:
+    return {"error": {"message": message, "type": kind, "code": kind}}
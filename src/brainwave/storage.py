@@ -1,5 +1,6 @@
 """Cloud storage providers for completed episodes."""
 
+import asyncio
 import json
 import shutil
 from abc import ABC, abstractmethod
@@ -9,9 +10,18 @@ from typing import Any
 import structlog
 
 from brainwave.config import StorageConfig
+from brainwave.script_cache import PARSED_SCRIPT_FILE
 
 logger = structlog.get_logger()
 
+# Working files kept in an episode directory that aren't uploaded with the episode
+LOCAL_ONLY_FILES = frozenset({PARSED_SCRIPT_FILE})
+
+
+def episode_files(local_dir: Path) -> list[Path]:
+    """Files of an episode directory to upload (local working files left out)."""
+    return [p for p in local_dir.rglob("*") if p.is_file() and p.name not in LOCAL_ONLY_FILES]
+
 
 class StorageProvider(ABC):
     """Abstract base class for storage providers."""
@@ -30,6 +40,21 @@ class StorageProvider(ABC):
         """
         pass
 
+    async def upload_episode_async(self, local_dir: Path, episode_id: str) -> str:
+        """
+        Upload a complete episode directory without blocking the event loop.
+
+        Default implementation runs upload_episode() in a worker thread.
+
+        Args:
+            local_dir: Local directory containing episode files
+            episode_id: Unique episode identifier
+
+        Returns:
+            Remote path/URL to the uploaded episode
+        """
+        return await asyncio.to_thread(self.upload_episode, local_dir, episode_id)
+
     @abstractmethod
     def download_episode(self, episode_id: str, local_dir: Path) -> Path:
         """
@@ -93,6 +118,20 @@ class StorageProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_episode_file(self, episode_id: str, filename: str) -> str | None:
+        """
+        Read one text file of an episode without downloading the rest.
+
+        Args:
+            episode_id: Unique episode identifier
+            filename: File name within the episode (e.g. episode-script.txt)
+
+        Returns:
+            File contents or None if not found
+        """
+        pass
+
 
 class LocalStorageProvider(StorageProvider):
     """Local filesystem storage (for development/testing)."""
@@ -108,7 +147,7 @@ class LocalStorageProvider(StorageProvider):
         if dest_dir.exists():
             shutil.rmtree(dest_dir)
 
-        shutil.copytree(local_dir, dest_dir)
+        shutil.copytree(local_dir, dest_dir, ignore=shutil.ignore_patterns(*LOCAL_ONLY_FILES))
         logger.info("episode_uploaded_local", episode_id=episode_id, path=str(dest_dir))
         return str(dest_dir)
 
@@ -155,6 +194,13 @@ class LocalStorageProvider(StorageProvider):
                 return json.load(f)
         return None
 
+    def get_episode_file(self, episode_id: str, filename: str) -> str | None:
+        """Read an episode file."""
+        path = self.base_dir / episode_id / filename
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+        return None
+
 
 class S3StorageProvider(StorageProvider):
     """S3-compatible storage (AWS S3, Cloudflare R2, MinIO, etc.)."""
@@ -196,37 +242,58 @@ class S3StorageProvider(StorageProvider):
         """Build S3 key for a file."""
         return f"{self.prefix}/{episode_id}/{filename}"
 
+    # Concurrent object uploads per episode in upload_episode_async()
+    UPLOAD_CONCURRENCY = 8
+
     def upload_episode(self, local_dir: Path, episode_id: str) -> str:
         """Upload episode directory to S3."""
-        uploaded_count = 0
-
-        for file_path in local_dir.rglob("*"):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(local_dir)
-                key = self._get_key(episode_id, str(relative_path).replace("\\", "/"))
-
-                # Determine content type
-                content_type = "application/octet-stream"
-                if file_path.suffix == ".json":
-                    content_type = "application/json"
-                elif file_path.suffix == ".txt":
-                    content_type = "text/plain"
-                elif file_path.suffix == ".mp3":
-                    content_type = "audio/mpeg"
-
-                with open(file_path, "rb") as f:
-                    self.client.put_object(
-                        Bucket=self.bucket,
-                        Key=key,
-                        Body=f,
-                        ContentType=content_type,
-                    )
-                uploaded_count += 1
+        files = episode_files(local_dir)
+        for file_path in files:
+            self._upload_file(local_dir, episode_id, file_path)
+
+        return self._uploaded(episode_id, len(files))
+
+    async def upload_episode_async(self, local_dir: Path, episode_id: str) -> str:
+        """Upload episode directory to S3, several objects at a time."""
+        files = episode_files(local_dir)
+        slots = asyncio.Semaphore(self.UPLOAD_CONCURRENCY)
+
+        # boto3 has no async API; its clients are thread-safe, so upload from worker threads
+        async def upload(file_path: Path) -> None:
+            async with slots:
+                await asyncio.to_thread(self._upload_file, local_dir, episode_id, file_path)
+
+        await asyncio.gather(*(upload(p) for p in files))
+        return self._uploaded(episode_id, len(files))
+
+    def _upload_file(self, local_dir: Path, episode_id: str, file_path: Path) -> None:
+        """Upload one episode file."""
+        relative_path = file_path.relative_to(local_dir)
+        key = self._get_key(episode_id, str(relative_path).replace("\\", "/"))
+
+        # Determine content type
+        content_type = "application/octet-stream"
+        if file_path.suffix == ".json":
+            content_type = "application/json"
+        elif file_path.suffix == ".txt":
+            content_type = "text/plain"
+        elif file_path.suffix == ".mp3":
+            content_type = "audio/mpeg"
+
+        with open(file_path, "rb") as f:
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=f,
+                ContentType=content_type,
+            )
 
+    def _uploaded(self, episode_id: str, files_count: int) -> str:
+        """Log a finished upload and return the episode's remote path."""
         logger.info(
             "episode_uploaded_s3",
             episode_id=episode_id,
-            files_count=uploaded_count,
+            files_count=files_count,
             bucket=self.bucket,
         )
 
@@ -336,6 +403,61 @@ class S3StorageProvider(StorageProvider):
         except Exception:
             return None
 
+    def get_episode_file(self, episode_id: str, filename: str) -> str | None:
+        """Read an episode file from S3 (other errors than a missing key are raised)."""
+        key = self._get_key(episode_id, filename)
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+        except self.client.exceptions.ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+        return response["Body"].read().decode("utf-8")
+
+    def upload_object(self, local_path: Path, key: str, content_type: str) -> None:
+        """Upload a single file to a raw bucket key."""
+        with open(local_path, "rb") as f:
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=f,
+                ContentType=content_type,
+            )
+
+    def download_object(self, key: str, local_path: Path) -> bool:
+        """
+        Download a single raw bucket key to a local file.
+
+        A single GET: a missing key costs the same one request as a HEAD.
+
+        Args:
+            key: Bucket key (not joined with the episode prefix)
+            local_path: Destination file
+
+        Returns:
+            True if downloaded, False if the key doesn't exist
+        """
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+        except self.client.exceptions.ClientError as e:
+            if _is_not_found(e):
+                return False
+            raise
+
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(f"{local_path.name}.part")
+        with open(tmp_path, "wb") as f:
+            for chunk in response["Body"].iter_chunks():
+                f.write(chunk)
+        tmp_path.replace(local_path)
+        return True
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Whether a botocore ClientError reports a missing key."""
+    code = getattr(error, "response", {}).get("Error", {}).get("Code")
+    return code in ("404", "NoSuchKey", "NotFound")
+
 
 def create_storage_provider(config: StorageConfig, local_fallback_dir: Path) -> StorageProvider:
     """
@@ -0,0 +1,157 @@
+"""Incremental checks on streamed LLM output."""
+
+from abc import ABC, abstractmethod
+from typing import Protocol
+
+import structlog
+
+from brainwave.models.script import Scene, SceneHeader
+from brainwave.parser import IncrementalWaveLangParser
+from brainwave.validator import ScriptValidator, ValidationError
+
+logger = structlog.get_logger()
+
+
+class StreamAbortedError(Exception):
+    """Raised when a stream monitor stops a completion early."""
+
+    def __init__(self, message: str, errors: list[ValidationError], partial: str = ""):
+        super().__init__(message)
+        self.errors = errors
+        self.partial = partial
+
+
+class OutlineLineParser(Protocol):
+    """The parts of OutlineParser used for incremental outline checks."""
+
+    def extract_shot_id(self, line: str) -> int: ...
+
+    def extract_characters(self, line: str) -> list[str]: ...
+
+
+class StreamMonitor(ABC):
+    """
+    Base class for monitors fed with streamed completion text.
+
+    Chunks are split into complete lines and handed to check_line();
+    once the number of fatal validation errors reaches the threshold
+    the stream is aborted.
+    """
+
+    def __init__(self, validator: ScriptValidator, abort_after_errors: int):
+        self.validator = validator
+        self.abort_after_errors = abort_after_errors
+        self.errors: list[ValidationError] = []
+        self._buffer = ""
+        self._text: list[str] = []
+
+    def reset(self) -> None:
+        """Forget all output seen so far (before a request is retried)."""
+        self.errors = []
+        self._buffer = ""
+        self._text = []
+
+    def feed(self, chunk: str) -> None:
+        """
+        Consume a chunk of streamed text.
+
+        Raises:
+            StreamAbortedError: If the fatal error threshold has been reached
+        """
+        self._text.append(chunk)
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self.check_line(line)
+
+    def finish(self) -> None:
+        """Process any trailing partial line once the stream ends."""
+        if self._buffer:
+            line, self._buffer = self._buffer, ""
+            self.check_line(line)
+
+    @abstractmethod
+    def check_line(self, line: str) -> None:
+        """Check one complete line of output."""
+        pass
+
+    def _record(self, errors: list[ValidationError]) -> None:
+        """Record fatal errors and abort if the threshold is reached."""
+        if not errors:
+            return
+
+        self.errors.extend(errors)
+
+        if self.abort_after_errors and len(self.errors) >= self.abort_after_errors:
+            logger.warning(
+                "stream_aborted",
+                errors=[e.message for e in self.errors],
+            )
+            raise StreamAbortedError(
+                f"Aborted after {len(self.errors)} validation error(s): {self.errors[0].message}",
+                errors=list(self.errors),
+                partial="".join(self._text),
+            )
+
+
+class ScriptStreamMonitor(StreamMonitor):
+    """Validates WaveLang scene headers as they stream in."""
+
+    def __init__(self, validator: ScriptValidator, abort_after_errors: int):
+        super().__init__(validator, abort_after_errors)
+        self.parser = IncrementalWaveLangParser()
+
+    def reset(self) -> None:
+        super().reset()
+        self.parser = IncrementalWaveLangParser()
+
+    def check_line(self, line: str) -> None:
+        scene = self.parser.feed_line(line)
+        if scene:
+            scene_idx = len(self.parser.scenes) - 1
+            self._record(self.validator.validate_scene(scene_idx, scene).errors)
+
+
+class OutlineStreamMonitor(StreamMonitor):
+    """Validates outline scene lines (shot and cast) as they stream in."""
+
+    def __init__(
+        self,
+        validator: ScriptValidator,
+        abort_after_errors: int,
+        outline_parser: OutlineLineParser,
+    ):
+        super().__init__(validator, abort_after_errors)
+        self.outline_parser = outline_parser
+        self._in_scenes = False
+        self._scene_idx = 0
+
+    def reset(self) -> None:
+        super().reset()
+        self._in_scenes = False
+        self._scene_idx = 0
+
+    def check_line(self, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+
+        # Mirrors the section tracking in OutlineParser.parse
+        if line.startswith("scenes:"):
+            self._in_scenes = True
+            return
+        if line.startswith(("title:", "premise:", "theme:", "ending:", "callbacks:")):
+            self._in_scenes = False
+            return
+
+        if self._in_scenes and line[0].isdigit() and ("." in line or "[" in line):
+            characters = self.outline_parser.extract_characters(line)
+            header = SceneHeader(
+                shot_id=self.outline_parser.extract_shot_id(line),
+                character_count=len(characters),
+                max_characters=len(characters),
+                characters=characters,
+            )
+            result = self.validator.validate_scene(self._scene_idx, Scene(header=header))
+            self._scene_idx += 1
+            self._record(result.errors)
@@ -1,5 +1,6 @@
 """Abstract base class for TTS providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
@@ -23,6 +24,9 @@ class TTSResult:
 class TTSProvider(ABC):
     """Abstract base class for TTS providers."""
 
+    # Model identifier, part of the audio cache key (providers with selectable models set it)
+    model: str | None = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -55,6 +59,28 @@ class TTSProvider(ABC):
         """
         ...
 
+    async def synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        output_path: Path,
+    ) -> TTSResult:
+        """
+        Synthesize speech without blocking the event loop.
+
+        Default implementation runs synthesize() in a worker thread.
+        Providers with a native async client can override it.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID (provider-specific)
+            output_path: Where to save the audio file
+
+        Returns:
+            TTSResult with path and metadata
+        """
+        return await asyncio.to_thread(self.synthesize, text, voice, output_path)
+
     def synthesize_batch(
         self,
         items: list[tuple[str, str, Path]],
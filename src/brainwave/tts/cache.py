@@ -0,0 +1,245 @@
+"""Two-tier content-addressed cache for synthesized TTS audio."""
+
+import hashlib
+import json
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import structlog
+
+from brainwave.storage import S3StorageProvider
+
+logger = structlog.get_logger()
+
+
+def tts_cache_key(provider: str, model: str | None, voice: str, text: str) -> str:
+    """
+    Build the content hash identifying a synthesized line.
+
+    Args:
+        provider: TTS provider name
+        model: Provider model (or None if the provider has no model choice)
+        voice: Voice ID
+        text: Cleaned text sent to the provider
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = "\x1f".join([provider, model or "", voice, text])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LocalTTSCache:
+    """Fast tier: audio files on local disk, sharded by hash prefix."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.mp3"
+
+    def get(self, key: str, output_path: Path) -> bool:
+        """Copy cached audio to output_path. Returns True on hit."""
+        cached = self._path(key)
+        if not cached.exists():
+            return False
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(cached, output_path)
+        return True
+
+    def put(self, key: str, audio_path: Path) -> None:
+        """Store a copy of audio_path under key."""
+        cached = self._path(key)
+        if cached.exists():
+            return
+
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached.with_name(f"{cached.name}.{uuid.uuid4().hex}.tmp")
+        shutil.copy(audio_path, tmp_path)
+        tmp_path.replace(cached)
+
+
+class NegativeLookupCache:
+    """Remembers remote misses on disk so they aren't re-queried until they expire."""
+
+    def __init__(self, path: Path, ttl: int):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = self._read()
+        self._discarded: set[str] = set()  # Forgotten since the last save
+
+    def _read(self) -> dict[str, float]:
+        """Entries currently on disk."""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.warning("tts_negative_cache_unreadable", path=str(self.path))
+            return {}
+
+    def contains(self, key: str) -> bool:
+        """Check if key is a known, unexpired miss."""
+        expires = self._entries.get(key)
+        return expires is not None and expires > time.time()
+
+    def add_many(self, keys: list[str]) -> None:
+        """Record keys as misses."""
+        expires = time.time() + self.ttl
+        with self._lock:
+            for key in keys:
+                self._entries[key] = expires
+
+    def discard(self, key: str) -> None:
+        """Forget a miss (e.g. after the key was uploaded)."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._discarded.add(key)
+
+    def save(self) -> None:
+        """
+        Persist unexpired entries.
+
+        The file is re-read and merged first, so misses saved meanwhile by
+        concurrent builds are kept, then replaced atomically.
+        """
+        now = time.time()
+        with self._lock:
+            merged = self._read()
+            for key in self._discarded:
+                merged.pop(key, None)
+            for key, expires in self._entries.items():
+                merged[key] = max(expires, merged.get(key, 0.0))
+            self._entries = {k: v for k, v in merged.items() if v > now}
+            self._discarded.clear()
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            tmp_path.replace(self.path)
+
+
+class RemoteTTSCache:
+    """
+    Shared tier: audio objects under a prefix in the episode storage bucket.
+
+    Objects are stored as ``<prefix>/<hash[:2]>/<hash>.mp3``. Each line not
+    known to be missing is fetched with one GET (concurrently), so a lookup
+    costs one request per line of the episode whatever the size of the cache;
+    misses are remembered in the negative cache.
+    """
+
+    def __init__(
+        self,
+        storage: S3StorageProvider,
+        prefix: str,
+        negative_cache: NegativeLookupCache,
+        max_workers: int = 8,
+    ):
+        self.storage = storage
+        self.prefix = prefix.rstrip("/")
+        self.negative_cache = negative_cache
+        self.max_workers = max_workers
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key[:2]}/{key}.mp3"
+
+    def fetch_many(self, requests: dict[str, Path]) -> set[str]:
+        """
+        Download every requested key that exists remotely.
+
+        Args:
+            requests: Mapping of cache key -> output path
+
+        Returns:
+            Set of keys that were downloaded
+        """
+        candidates = [key for key in requests if not self.negative_cache.contains(key)]
+        if not candidates:
+            return set()
+
+        def fetch(key: str) -> bool | None:
+            """True if downloaded, False if missing, None if the lookup failed."""
+            try:
+                return self.storage.download_object(self._key(key), requests[key])
+            except Exception as e:
+                logger.warning("tts_remote_cache_download_failed", key=key, error=str(e))
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            outcomes = dict(zip(candidates, executor.map(fetch, candidates)))
+
+        hits = {key for key, outcome in outcomes.items() if outcome}
+        # Failed lookups aren't misses; they are retried next time
+        self.negative_cache.add_many([key for key, outcome in outcomes.items() if outcome is False])
+        self.negative_cache.save()
+
+        logger.debug(
+            "tts_remote_cache_lookup",
+            requested=len(requests),
+            queried=len(candidates),
+            hits=len(hits),
+        )
+        return hits
+
+    def put(self, key: str, audio_path: Path) -> None:
+        """Upload audio for key."""
+        remote_key = self._key(key)
+        self.storage.upload_object(audio_path, remote_key, "audio/mpeg")
+        self.negative_cache.discard(key)
+
+
+class TTSCache:
+    """Local tier in front of an optional shared remote tier."""
+
+    def __init__(self, local: LocalTTSCache, remote: RemoteTTSCache | None = None):
+        self.local = local
+        self.remote = remote
+
+    def fetch_many(self, requests: dict[str, Path]) -> set[str]:
+        """
+        Restore cached audio for as many keys as possible.
+
+        Local hits are copied directly; the rest are looked up remotely in one
+        batch, and remote hits are promoted into the local tier.
+
+        Args:
+            requests: Mapping of cache key -> output path
+
+        Returns:
+            Set of keys whose audio was restored to its output path
+        """
+        hits = {key for key, path in requests.items() if self.local.get(key, path)}
+
+        remaining = {key: path for key, path in requests.items() if key not in hits}
+        if self.remote and remaining:
+            try:
+                remote_hits = self.remote.fetch_many(remaining)
+            except Exception as e:
+                logger.warning("tts_remote_cache_unavailable", error=str(e))
+                remote_hits = set()
+
+            for key in remote_hits:
+                self.local.put(key, remaining[key])
+            hits |= remote_hits
+
+        return hits
+
+    def store(self, key: str, audio_path: Path) -> None:
+        """Store freshly synthesized audio in both tiers."""
+        self.local.put(key, audio_path)
+
+        if self.remote:
+            try:
+                self.remote.put(key, audio_path)
+            except Exception as e:
+                logger.warning("tts_remote_cache_upload_failed", key=key, error=str(e))
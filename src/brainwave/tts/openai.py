@@ -3,7 +3,7 @@
 from pathlib import Path
 
 import structlog
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from brainwave.tts.base import TTSProvider, TTSResult
 
@@ -33,6 +33,11 @@ class OpenAITTSProvider(TTSProvider):
         self.client = OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
 
+        # Created on first async use; bound to that event loop
+        self._api_key = api_key
+        self._base_url = base_url
+        self._async_client: AsyncOpenAI | None = None
+
     @property
     def name(self) -> str:
         return "openai"
@@ -58,10 +63,7 @@ class OpenAITTSProvider(TTSProvider):
         Returns:
             TTSResult with path
         """
-        # Validate voice
-        if voice.lower() not in [v.lower() for v in self.VOICES]:
-            logger.warning("unknown_voice", voice=voice, using="alloy")
-            voice = "alloy"
+        voice = self._check_voice(voice)
 
         try:
             # Ensure output directory exists
@@ -85,3 +87,51 @@ class OpenAITTSProvider(TTSProvider):
         except Exception as e:
             logger.error("tts_failed", voice=voice, error=str(e))
             return TTSResult(audio_path=output_path, error=str(e))
+
+    async def synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        output_path: Path,
+    ) -> TTSResult:
+        """
+        Synthesize speech with the async OpenAI client.
+
+        Args:
+            text: Text to synthesize
+            voice: OpenAI voice ID (alloy, echo, fable, onyx, nova, shimmer)
+            output_path: Where to save the MP3 file
+
+        Returns:
+            TTSResult with path
+        """
+        voice = self._check_voice(voice)
+
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self._api_key, base_url=self._base_url)
+
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            response = await self._async_client.audio.speech.create(
+                model=self.model,
+                voice=voice.lower(),  # type: ignore
+                input=text,
+                response_format="mp3",
+            )
+            await response.astream_to_file(output_path)
+
+            logger.debug("tts_synthesized", voice=voice, path=str(output_path))
+
+            return TTSResult(audio_path=output_path)
+
+        except Exception as e:
+            logger.error("tts_failed", voice=voice, error=str(e))
+            return TTSResult(audio_path=output_path, error=str(e))
+
+    def _check_voice(self, voice: str) -> str:
+        """Fall back to alloy for voices the API doesn't know."""
+        if voice.lower() not in [v.lower() for v in self.VOICES]:
+            logger.warning("unknown_voice", voice=voice, using="alloy")
+            return "alloy"
+        return voice
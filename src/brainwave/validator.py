@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 from brainwave.models.characters import CharacterRegistry, ShotRegistry
-from brainwave.models.script import WaveLangScript
+from brainwave.models.script import Scene, WaveLangScript
 
 
 @dataclass
@@ -115,10 +115,27 @@ class ScriptValidator:
 
         return result
 
+    def validate_scene(self, scene_idx: int, scene: Scene) -> ValidationResult:
+        """
+        Validate a single scene on its own.
+
+        Used to check scenes as they stream in, before the full script exists.
+
+        Args:
+            scene_idx: Zero-based index of the scene in the script
+            scene: Scene to validate (dialog may still be incomplete)
+
+        Returns:
+            ValidationResult for this scene only
+        """
+        result = ValidationResult()
+        self._validate_scene(scene_idx, scene, result)
+        return result
+
     def _validate_scene(
         self,
         scene_idx: int,
-        scene,
+        scene: Scene,
         result: ValidationResult,
     ) -> None:
         """Validate a single scene."""
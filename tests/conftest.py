@@ -0,0 +1,79 @@
+"""Shared fixtures: stand-in OpenAI servers for exercising the LLM client end to end."""
+
+import random
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from brainwave.config import AppConfig, LLMBulkConfig, LLMConfig, PathsConfig
+from brainwave.models.characters import load_characters, load_shots
+from brainwave.standin import ResponseSynthesizer, StandInServer, StandInSettings
+
+ROOT = Path(__file__).parent.parent
+DATA_DIR = ROOT / "data"
+
+@pytest.fixture(scope="session")
+def synthesizer() -> ResponseSynthesizer:
+    """Response synthesizer over the bundled characters and shots."""
+    return ResponseSynthesizer(
+        load_characters(DATA_DIR / "characters.yaml"),
+        load_shots(DATA_DIR / "shots.yaml"),
+        random.Random(1),
+    )
+
+
+@pytest.fixture
+def standin(synthesizer):
+    """Factory starting stand-in servers on free ports; all are shut down afterwards."""
+    servers: list[StandInServer] = []
+
+    def start(**settings) -> StandInServer:
+        server = StandInServer(synthesizer, StandInSettings(seed=1, **settings), port=0)
+        server.start()
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+
+
+@pytest.fixture
+def messages() -> list[dict[str, str]]:
+    """A short chat request."""
+    return [
+        {"role": "system", "content": "You write sitcom scripts."},
+        {"role": "user", "content": "Say something about the printer."},
+    ]
+
+
+@pytest.fixture
+def llm_config():
+    """Factory for LLM settings talking to stand-in servers (no real credentials)."""
+
+    def make(**values) -> LLMConfig:
+        return LLMConfig(api_key=SecretStr("standin"), **values)
+
+    return make
+
+
+@pytest.fixture
+def app_config(tmp_path, llm_config):
+    """Factory for application settings using a stand-in server and scratch directories."""
+
+    def make(server: StandInServer) -> AppConfig:
+        return AppConfig(
+            llm=llm_config(base_url=server.base_url, bulk=LLMBulkConfig(poll_interval=0.05)),
+            paths=PathsConfig(
+                scenes_dir=tmp_path / "scenes",
+                incomplete_dir=tmp_path / "incomplete",
+                data_dir=DATA_DIR,
+                templates_dir=ROOT / "templates",
+                placeholders_dir=ROOT / "placeholders",
+                cache_dir=tmp_path / "cache",
+            ),
+        )
+
+    return make
@@ -0,0 +1,30 @@
+"""Async batch runs against the stand-in server."""
+
+import threading
+
+from brainwave.async_pipeline import run_batch_sync
+from brainwave.models.episode import EpisodeStatus
+from brainwave.pipeline import EpisodePipeline
+
+
+def test_batch_writes_checkpoints_off_the_event_loop(standin, app_config, monkeypatch):
+    config = app_config(standin())
+    loop_thread = threading.get_ident()
+    blocking_calls: list[str] = []
+
+    save_episode = EpisodePipeline._save_episode
+
+    def checked_save(pipeline, episode):
+        if threading.get_ident() == loop_thread:
+            blocking_calls.append(episode.meta.status.value)
+        save_episode(pipeline, episode)
+
+    monkeypatch.setattr(EpisodePipeline, "_save_episode", checked_save)
+
+    results = run_batch_sync(config, ["the printer", "the budget", None], parallel=3)
+
+    assert [r.error for r in results] == [None, None, None]
+    assert all(r.episode.meta.status == EpisodeStatus.COMPLETED for r in results)
+    assert blocking_calls == []
+    # Completed episodes were uploaded and their incomplete directories removed
+    assert not any((config.paths.incomplete_dir / r.episode.id_str).exists() for r in results)
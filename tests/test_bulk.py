@@ -0,0 +1,90 @@
+"""Bulk outline/script runs through the stand-in's Batch API."""
+
+import json
+
+from brainwave.bulk import BulkRunner
+from brainwave.models.episode import EpisodeStatus, PipelineStep
+
+
+def run_jobs(runner: BulkRunner, episodes, step: PipelineStep):
+    """Submit, wait for and collect a step's batches; returns every BatchResult."""
+    results = []
+    for job in runner.submit(episodes, step):
+        polls = []
+        batch = runner.wait(job, on_poll=lambda job, batch: polls.append(batch.status))
+        assert batch.status == "completed"
+        assert polls[-1] == "completed"
+        results.extend(runner.collect(job))
+    return results
+
+
+def test_bulk_outline_and_script_with_partially_failed_batch(standin, app_config):
+    server = standin(batch_error_rate=0.5, batch_delay=0.2)
+    config = app_config(server)
+    config.llm.bulk.max_requests = 4
+    runner = BulkRunner(config)
+
+    created = [runner.pipeline.create(f"topic {i}") for i in range(6)]
+    queued = runner.queued(PipelineStep.OUTLINE)
+    assert {e.id_str for e in queued} == {e.id_str for e in created}
+
+    jobs = runner.submit(queued, PipelineStep.OUTLINE)
+    assert [len(job.episode_ids) for job in jobs] == [4, 2]
+    # Submitted episodes aren't queued twice, and running jobs aren't collected
+    assert runner.queued(PipelineStep.OUTLINE) == []
+    assert runner.collect(jobs[0]) is None
+
+    results = []
+    for job in jobs:
+        runner.wait(job)
+        results.extend(runner.collect(job))
+    assert runner.jobs() == []
+
+    failed = [r for r in results if r.error]
+    outlined = [r for r in results if not r.error]
+    assert failed and outlined
+    for result in failed:
+        # Reported, and left as it was so it can be submitted again
+        assert result.failed_step == PipelineStep.OUTLINE
+        assert "Batch request failed" in str(result.error)
+        assert runner.pipeline.load(result.episode.id_str).meta.status == EpisodeStatus.CREATED
+    for result in outlined:
+        assert result.episode.meta.status == EpisodeStatus.OUTLINED
+        assert result.episode.outline.scenes
+        assert result.episode.meta.usage["outline"].requests == 1
+
+    # The failed episodes are queued again, and succeed on resubmission
+    server.settings.batch_error_rate = 0.0
+    retry = runner.queued(PipelineStep.OUTLINE)
+    assert {e.id_str for e in retry} == {r.episode.id_str for r in failed}
+    assert not any(r.error for r in run_jobs(runner, retry, PipelineStep.OUTLINE))
+
+    scripted = run_jobs(runner, runner.queued(PipelineStep.SCRIPT), PipelineStep.SCRIPT)
+    assert len(scripted) == len(created)
+    for result in scripted:
+        assert not result.error
+        episode = runner.pipeline.load(result.episode.id_str)
+        assert episode.meta.status == EpisodeStatus.SCRIPTED
+        assert episode.meta.scene_count > 0
+        assert (episode.work_dir / "episode-script.txt").exists()
+
+
+def test_collect_reports_episode_missing_from_input_file(standin, app_config):
+    config = app_config(standin())
+    runner = BulkRunner(config)
+    episodes = [runner.pipeline.create(f"topic {i}") for i in range(3)]
+
+    job = runner.submit(episodes, PipelineStep.OUTLINE)[0]
+    runner.wait(job)
+
+    # Lose one request from the saved input file
+    input_path = runner._input_path(job)
+    lines = input_path.read_text(encoding="utf-8").splitlines()
+    missing = json.loads(lines[0])["custom_id"]
+    input_path.write_text("\n".join(lines[1:]) + "\n", encoding="utf-8")
+
+    results = {r.episode.id_str: r for r in runner.collect(job)}
+
+    assert "missing from the batch input file" in str(results[missing].error)
+    assert results[missing].episode.meta.status == EpisodeStatus.CREATED
+    assert all(not r.error for episode_id, r in results.items() if episode_id != missing)
@@ -0,0 +1,38 @@
+"""Near-duplicate index shared between processes through its JSONL file."""
+
+from brainwave.dedup import NearDuplicateIndex
+
+OUTLINE = "the printer files a complaint about the budget meeting and nobody knows why"
+OTHER = "karaoke night at the warehouse goes wrong when the forklift learns to sing"
+
+
+def test_add_keeps_lines_other_processes_appended(tmp_path, monkeypatch):
+    ours = NearDuplicateIndex(tmp_path)
+    theirs = NearDuplicateIndex(tmp_path)
+
+    # Another process appends between our refresh and our own append
+    refresh = ours._refresh
+
+    def refresh_then_other_write() -> None:
+        refresh()
+        theirs.add("outline", "theirs", OTHER)
+
+    monkeypatch.setattr(ours, "_refresh", refresh_then_other_write)
+    ours.add("outline", "ours", OUTLINE)
+    monkeypatch.undo()
+
+    assert ("outline", "theirs") in ours
+    assert ours.query("outline", OTHER, 0.9).episode_id == "theirs"
+    assert ("outline", "ours") in theirs
+    assert len(ours) == len(theirs) == 2
+
+
+def test_reindexed_episode_replaces_its_signature(tmp_path):
+    index = NearDuplicateIndex(tmp_path)
+    index.add("script", "episode", OUTLINE)
+    index.add("script", "episode", OTHER)
+
+    reopened = NearDuplicateIndex(tmp_path)
+    assert len(reopened) == 1
+    assert reopened.query("script", OTHER, 0.9).episode_id == "episode"
+    assert reopened.query("script", OUTLINE, 0.9) is None
@@ -0,0 +1,218 @@
+"""Backend failover, circuit breaking and retry delays against the stand-in server."""
+
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import openai
+import pytest
+
+from brainwave.config import LLMBackendConfig, LLMRetryConfig, LLMRouterConfig
+from brainwave.llm import AsyncLLMClient, CompletionCancelledError, LLMClient
+from brainwave.llm_retry import CircuitBreaker, LLMCallError, backoff_delay, retry_after
+
+
+@pytest.fixture
+def two_backends(llm_config):
+    """Factory for clients routing between a primary and a secondary stand-in."""
+
+    def make(primary, secondary, **values) -> LLMClient:
+        return LLMClient(
+            llm_config(
+                backends=[
+                    LLMBackendConfig(name="primary", base_url=primary.base_url),
+                    LLMBackendConfig(name="secondary", base_url=secondary.base_url),
+                ],
+                # No random exploration, so the primary is always tried first
+                router=LLMRouterConfig(explore=0.0),
+                **values,
+            )
+        )
+
+    return make
+
+
+def rate_limit_error(headers: dict[str, str]) -> openai.RateLimitError:
+    """A 429 as the SDK raises it, carrying the given response headers."""
+    request = httpx.Request("POST", "http://standin/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return openai.RateLimitError("Rate limited", response=response, body=None)
+
+
+@pytest.mark.parametrize("failure", [{"error_rate": 1.0}, {"rate_limit_rate": 1.0}])
+def test_fails_over_to_secondary_backend(standin, two_backends, messages, failure):
+    primary = standin(**failure)
+    secondary = standin()
+    # A backoff this long would blow the time limit below: failover must not wait
+    client = two_backends(primary, secondary, retry=LLMRetryConfig(base_delay=30.0))
+    first, second = client.router.backends
+
+    started = time.monotonic()
+    response = client.complete(messages)
+
+    assert response.content
+    assert time.monotonic() - started < 5.0
+    assert first.health.snapshot()[:2] == (1, 1.0)
+    assert second.health.snapshot()[:2] == (1, 0.0)
+
+
+def test_fails_once_every_backend_is_exhausted(standin, two_backends, messages):
+    client = two_backends(
+        standin(error_rate=1.0),
+        standin(error_rate=1.0),
+        retry=LLMRetryConfig(max_attempts=3, base_delay=0.01, breaker_threshold=0),
+    )
+
+    with pytest.raises(LLMCallError) as excinfo:
+        client.complete(messages)
+
+    assert excinfo.value.kind == "server"
+    assert excinfo.value.attempts == 3
+
+
+def test_circuit_breaker_opens_and_recovers_after_cooldown(standin, llm_config, messages):
+    server = standin(error_rate=1.0)
+    cooldown = 0.5
+    client = LLMClient(
+        llm_config(
+            base_url=server.base_url,
+            retry=LLMRetryConfig(
+                max_attempts=2, base_delay=0.01, breaker_threshold=2, breaker_cooldown=cooldown
+            ),
+        )
+    )
+    breaker = client.router.default.breaker
+
+    with pytest.raises(LLMCallError):
+        client.complete(messages)
+    assert breaker.is_open
+
+    # The provider recovers; the next request waits out the cooldown, then probes
+    server.settings.error_rate = 0.0
+    started = time.monotonic()
+    response = client.complete(messages)
+
+    assert response.content
+    assert time.monotonic() - started >= cooldown * 0.8
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_reopens_after_failed_probe():
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+
+    breaker.record_failure()
+    assert breaker.is_open
+
+    time.sleep(0.06)
+    breaker.acquire()  # Let through as the probe
+    breaker.record_failure()
+    assert breaker.is_open
+
+    time.sleep(0.06)
+    breaker.acquire()
+    breaker.record_success()
+    assert not breaker.is_open
+
+
+def probe_due_with_spent_quota(client: LLMClient | AsyncLLMClient) -> CircuitBreaker:
+    """Leave the default backend's circuit waiting for a probe and its request quota spent."""
+    backend = client.router.default
+    backend.breaker.record_failure()
+    time.sleep(0.06)
+    backend.pacer.observe(
+        {
+            "x-ratelimit-limit-requests": "100",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "30s",
+        }
+    )
+    return backend.breaker
+
+
+def acquires_within(breaker: CircuitBreaker, timeout: float) -> bool:
+    """Whether another caller gets through the breaker in time."""
+    acquired = threading.Event()
+    threading.Thread(target=lambda: (breaker.acquire(), acquired.set()), daemon=True).start()
+    return acquired.wait(timeout)
+
+
+def test_cancelled_paced_probe_is_handed_back(standin, llm_config, messages):
+    retry = LLMRetryConfig(breaker_threshold=1, breaker_cooldown=0.05)
+    client = LLMClient(llm_config(base_url=standin().base_url, retry=retry))
+    breaker = probe_due_with_spent_quota(client)
+
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+    with pytest.raises(CompletionCancelledError, match="paced"):
+        client.complete(messages, cancel=cancel)
+
+    assert breaker.is_open
+    assert acquires_within(breaker, 2.0)
+
+
+def test_cancelled_async_probe_is_handed_back(standin, llm_config, messages):
+    retry = LLMRetryConfig(breaker_threshold=1, breaker_cooldown=0.05)
+    client = AsyncLLMClient(llm_config(base_url=standin().base_url, retry=retry))
+    breaker = probe_due_with_spent_quota(client)
+
+    async def cancel_while_paced() -> None:
+        task = asyncio.create_task(client.complete(messages))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_while_paced())
+
+    assert breaker.is_open
+    assert acquires_within(breaker, 2.0)
+
+
+def test_abandoned_probe_lets_the_next_caller_probe():
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.acquire()  # The probe
+    assert not acquires_within(breaker, 0.1)  # Held back while it is in flight
+
+    breaker.abandon_probe()
+    assert breaker.is_open
+    assert acquires_within(breaker, 2.0)
+
+
+def test_retry_after_read_from_standin_429(standin, messages):
+    server = standin(rate_limit_rate=1.0, retry_after=2.5)
+    sdk = openai.OpenAI(base_url=server.base_url, api_key="standin", max_retries=0)
+
+    with pytest.raises(openai.RateLimitError) as excinfo:
+        sdk.chat.completions.create(model="gpt-4o", messages=messages)
+    error = excinfo.value
+
+    assert retry_after(error) == 2.5
+    assert 2.5 <= backoff_delay(1, base_delay=0.1, max_delay=60.0, error=error) <= 2.6
+    # max_delay caps even a server-requested wait
+    assert 1.0 <= backoff_delay(1, base_delay=0.1, max_delay=1.0, error=error) <= 1.1
+
+
+def test_retry_after_header_forms():
+    assert retry_after(rate_limit_error({"retry-after-ms": "1500"})) == 1.5
+    # retry-after-ms is the more precise hint
+    assert retry_after(rate_limit_error({"retry-after-ms": "200", "retry-after": "9"})) == 0.2
+    assert retry_after(rate_limit_error({"retry-after": "garbage"})) is None
+    assert retry_after(rate_limit_error({})) is None
+    assert retry_after(ValueError("no response")) is None
+
+    later = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= retry_after(rate_limit_error({"retry-after": later})) <= 30
+
+
+def test_backoff_without_hint_is_jittered_exponential():
+    for attempt in range(1, 6):
+        cap = min(8.0, 0.5 * 2 ** (attempt - 1))
+        delays = [backoff_delay(attempt, base_delay=0.5, max_delay=8.0) for _ in range(50)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert len(set(delays)) > 1
@@ -0,0 +1,43 @@
+"""The single-pass WaveLang parser against the pattern-based reference."""
+
+import pytest
+
+from brainwave.parser import WaveLangParser
+
+SCRIPT = """\
+```wavelang
+>> [12] > 2/4 - Marcus, David
+:: Marcus : deadpan : The printer filed a complaint: again.
+::David:annoyed:No spaces at all.
+:: Marcus :  : Empty inflection falls back to the pattern.
+# a comment
+:: David : sarcastic : Time is 10:30, apparently.
+
+>>[3]>1/2-Carmen
+:: Carmen : excited : Ratio: 3:1.
+not a wavelang line
+== Everyone agrees the printer was right.
+```"""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        SCRIPT,
+        ":: Walt : nervous : Dialog before any scene.",
+        ">> [1] > 1/1 - June\n::June:trailing off:",
+        "",
+    ],
+)
+def test_parse_matches_reference(text):
+    parser = WaveLangParser()
+    assert parser.parse(text) == parser.parse_regex(text)
+
+
+def test_parse_numbers_dialog_across_scenes():
+    script = WaveLangParser().parse(SCRIPT)
+
+    assert script.scene_count == 2
+    assert [line.line_number for line in script.all_dialog_lines] == [1, 2, 3, 4, 5]
+    assert script.scenes[0].dialog[0].text == "The printer filed a complaint: again."
+    assert script.summary == "Everyone agrees the printer was right."
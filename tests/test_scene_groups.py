@@ -0,0 +1,30 @@
+"""Scripts written as concurrent scene-group completions."""
+
+import asyncio
+
+import pytest
+
+from brainwave.async_pipeline import AsyncEpisodePipeline
+from brainwave.models.episode import EpisodeStatus
+from brainwave.pipeline import EpisodePipeline
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_scene_group_script_keeps_one_summary_line(standin, app_config, asynchronous):
+    config = app_config(standin())
+    config.generation.scene_group_size = 3
+    pipeline = EpisodePipeline(config)
+    episode = pipeline.run_outline(pipeline.create("the printer"))
+
+    if asynchronous:
+        episode = asyncio.run(AsyncEpisodePipeline(config, pipeline=pipeline).run_script(episode))
+    else:
+        episode = pipeline.run_script(episode)
+
+    assert episode.meta.status == EpisodeStatus.SCRIPTED
+    script = pipeline.scripts.parse(episode.script_raw)
+    assert script.scene_count == len(episode.outline.scenes)
+    assert script.summary
+    summaries = [line for line in episode.script_raw.split("\n") if line.startswith("==")]
+    assert len(summaries) == 1
+    assert episode.script_raw.rstrip().endswith(summaries[0])
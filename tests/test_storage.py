@@ -0,0 +1,75 @@
+"""Storage providers: what an upload includes, and S3 errors (boto3 responses stubbed)."""
+
+from pathlib import Path
+
+import pytest
+from botocore.stub import ANY, Stubber
+from pydantic import SecretStr
+
+from brainwave.config import StorageConfig
+from brainwave.script_cache import PARSED_SCRIPT_FILE
+from brainwave.storage import LocalStorageProvider, S3StorageProvider
+
+
+@pytest.fixture
+def s3():
+    """S3 provider whose client answers from a Stubber."""
+    provider = S3StorageProvider(
+        StorageConfig(
+            provider="s3",
+            region="us-east-1",
+            access_key_id=SecretStr("test"),
+            secret_access_key=SecretStr("test"),
+        )
+    )
+    with Stubber(provider.client) as stubber:
+        yield provider, stubber
+
+
+@pytest.fixture
+def episode_dir(tmp_path):
+    """Episode work directory holding a script, its parsed form and audio."""
+    work_dir = tmp_path / "incomplete" / "episode"
+    (work_dir / "audio").mkdir(parents=True)
+    (work_dir / "meta.json").write_text("{}", encoding="utf-8")
+    (work_dir / "episode-script.txt").write_text(">> [1] > 1/1 - Art", encoding="utf-8")
+    (work_dir / PARSED_SCRIPT_FILE).write_text("{}", encoding="utf-8")
+    (work_dir / "audio" / "1.mp3").write_bytes(b"mp3")
+    return work_dir
+
+
+def test_local_upload_leaves_out_parsed_script(episode_dir, tmp_path):
+    provider = LocalStorageProvider(tmp_path / "completed")
+
+    uploaded = Path(provider.upload_episode(episode_dir, "episode"))
+
+    files = sorted(p.relative_to(uploaded).as_posix() for p in uploaded.rglob("*") if p.is_file())
+    assert files == ["audio/1.mp3", "episode-script.txt", "meta.json"]
+
+
+def test_s3_upload_leaves_out_parsed_script(s3, episode_dir):
+    provider, stubber = s3
+    for _ in range(3):
+        stubber.add_response(
+            "put_object", {}, {"Bucket": ANY, "Key": ANY, "Body": ANY, "ContentType": ANY}
+        )
+
+    provider.upload_episode(episode_dir, "episode")
+
+    # A fourth put_object (the parsed script) would have had no stubbed response
+    stubber.assert_no_pending_responses()
+
+
+def test_get_episode_file_missing_key_is_none(s3):
+    provider, stubber = s3
+    stubber.add_client_error("get_object", service_error_code="NoSuchKey", http_status_code=404)
+
+    assert provider.get_episode_file("episode", "outline.txt") is None
+
+
+def test_get_episode_file_raises_other_errors(s3):
+    provider, stubber = s3
+    stubber.add_client_error("get_object", service_error_code="AccessDenied", http_status_code=403)
+
+    with pytest.raises(provider.client.exceptions.ClientError):
+        provider.get_episode_file("episode", "outline.txt")
@@ -0,0 +1,90 @@
+"""Outline and script steps recovering from completions their stream monitor aborts."""
+
+import asyncio
+import re
+
+import pytest
+
+from brainwave.async_pipeline import AsyncEpisodePipeline
+from brainwave.models.episode import EpisodeStatus
+from brainwave.pipeline import EpisodePipeline
+from brainwave.streaming import StreamAbortedError
+
+
+class UnknownShots:
+    """Synthesizer wrapper writing its first responses with every scene in a missing shot."""
+
+    def __init__(self, synthesizer, bad: int):
+        self.synthesizer = synthesizer
+        self.bad = bad
+        self.requests = 0
+
+    def respond(self, messages, structured: bool = False) -> str:
+        content = self.synthesizer.respond(messages, structured)
+        self.requests += 1
+        if self.bad > 0:
+            self.bad -= 1
+            content = re.sub(r"\[(Shot )?\d+\]", r"[\g<1>999]", content)
+        return content
+
+
+@pytest.fixture
+def streaming(standin, app_config):
+    """Factory for (pipeline, wrapped synthesizer) streaming from a stand-in."""
+
+    def make(**generation) -> tuple[EpisodePipeline, UnknownShots]:
+        server = standin()
+        server.synthesizer = UnknownShots(server.synthesizer, bad=0)
+        config = app_config(server)
+        config.llm.stream = True
+        config.generation = config.generation.model_copy(update=generation)
+        return EpisodePipeline(config), server.synthesizer
+
+    return make
+
+
+def run(pipeline: EpisodePipeline, step: str, episode, asynchronous: bool):
+    """Run a step on the sync pipeline, or on an async one sharing it."""
+    if not asynchronous:
+        return getattr(pipeline, step)(episode)
+    async_pipeline = AsyncEpisodePipeline(pipeline.config, pipeline=pipeline)
+    return asyncio.run(getattr(async_pipeline, step)(episode))
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_aborted_outline_is_sampled_again(streaming, asynchronous):
+    pipeline, synthesizer = streaming()
+    episode = pipeline.create("the printer")
+    synthesizer.bad = 1
+
+    episode = run(pipeline, "run_outline", episode, asynchronous)
+
+    assert episode.meta.status == EpisodeStatus.OUTLINED
+    assert synthesizer.requests == 2
+    assert all(scene.shot_id != 999 for scene in episode.outline.scenes)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_aborted_script_keeps_finished_scenes_and_repairs(streaming, asynchronous):
+    pipeline, synthesizer = streaming()
+    episode = pipeline.run_outline(pipeline.create("the printer"))
+    synthesizer.bad = 1
+
+    episode = run(pipeline, "run_script", episode, asynchronous)
+
+    assert episode.meta.status == EpisodeStatus.SCRIPTED
+    script = pipeline.scripts.parse(episode.script_raw)
+    assert script.scene_count == len(episode.outline.scenes)
+    assert pipeline.validator.validate(script).is_valid
+    # Outline, aborted script, continuation and repair
+    assert synthesizer.requests == 4
+
+
+def test_outline_fails_once_abort_retries_are_used_up(streaming):
+    pipeline, synthesizer = streaming(outline_parse_retries=1)
+    episode = pipeline.create("the printer")
+    synthesizer.bad = 2
+
+    with pytest.raises(StreamAbortedError):
+        pipeline.run_outline(episode)
+    assert synthesizer.requests == 2